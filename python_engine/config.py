@@ -95,6 +95,7 @@ class BusinessConstants:
     TIME_MULTIPLIER: int = 30
     GANTT_DPI: int = 300
     FAKE_OPERATION_DEPTH: int = -1
+    LOCAL_SEARCH_ITERATIONS: int = 0  # 디스패치 후 지역 탐색 이동 시도 횟수 (0이면 미적용)
 
 
 @dataclass
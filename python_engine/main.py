@@ -13,14 +13,23 @@ from datetime import datetime
 import json
 
 from config import config
-from src.validation import preprocess_production_data
+from src.validation import preprocess_production_data, save_processed_data
 from src.order_sequencing import generate_order_sequences
 from src.yield_management import yield_prediction
 from src.dag_management import create_complete_dag_system
 from src.scheduler import run_scheduler_pipeline
 from src.results import create_results
+from src.utils import StageCache
+
+def run_level4_scheduling(use_stage_cache=False, cache_dir="data/cache"):
+    """
+    Args:
+        use_stage_cache (bool): True면 Validation~스케줄링 단계 출력을 입력 해시 기준으로 캐시
+            (입력이 같은 단계는 다시 실행하지 않음, 예: machine_rest만 바뀌면 스케줄링만 재실행)
+        cache_dir (str): 단계 캐시 디렉토리
+    """
+    stage_cache = StageCache(cache_dir, enabled=use_stage_cache)
 
-def run_level4_scheduling():
     # 사용자 입력으로 받는 부분
     base_date = datetime(config.constants.BASE_YEAR, config.constants.BASE_MONTH, config.constants.BASE_DAY)
     window_days = config.constants.WINDOW_DAYS
@@ -55,7 +64,7 @@ def run_level4_scheduling():
 
     # === 1단계: Validation - 데이터 유효성 검사 및 전처리 ===
     print("[10%] 데이터 유효성 검사 및 전처리 (Validation) 시작...")
-    processed_data = preprocess_production_data(
+    processed_data = stage_cache.run('preprocess', preprocess_production_data, dict(
         order_df=order_df,
         linespeed_df=linespeed_df,
         operation_df=operation_df,
@@ -70,8 +79,10 @@ def run_level4_scheduling():
         linespeed_period=linespeed_period,
         yield_period=yield_period,
         validate=True,
-        save_output=True
-    )
+        save_output=False
+    ))
+    # python_input.xlsx는 캐시 사용 여부와 관계없이 매번 저장 (캐시된 단계는 부수효과를 재실행하지 않음)
+    save_processed_data(processed_data)
 
     # 전처리된 데이터 추출
     linespeed = processed_data['linespeed']
@@ -110,19 +121,25 @@ def run_level4_scheduling():
 
     # === 2단계: 주문 시퀀스 생성 (Order Sequencing) ===
     print("[30%] 주문 시퀀스 생성 중...")
-    sequence_seperated_order, linespeed, unable_gitems, unable_order, unable_details = generate_order_sequences(
-        order, operation_seperated_sequence, operation_types, local_machine_limit, global_machine_limit, machine_allocate, linespeed, chemical_data)
+    sequence_seperated_order, linespeed, unable_gitems, unable_order, unable_details = stage_cache.run(
+        'order_sequencing', generate_order_sequences, dict(
+            order=order, operation_seperated_sequence=operation_seperated_sequence, operation_types=operation_types,
+            local_machine_limit=local_machine_limit, global_machine_limit=global_machine_limit,
+            machine_allocate=machine_allocate, linespeed=linespeed, chemical_data=chemical_data))
     
     # === 3단계: 수율 예측 ===
     print("[35%] 수율 예측 처리 중...")
-    sequence_seperated_order = yield_prediction(
-        yield_data, sequence_seperated_order
-    )
+    sequence_seperated_order = stage_cache.run('yield_prediction', yield_prediction, dict(
+        yield_data=yield_data, sequence_seperated_order=sequence_seperated_order
+    ))
 
     # === 4단계: DAG 생성 ===
     # DAG 생성 (aging_map 전달)
-    dag_df, opnode_dict, manager, machine_dict, merged_df = create_complete_dag_system(
-        sequence_seperated_order, linespeed, machine_mapper, aging_df)
+    dag_df, opnode_dict, manager, machine_dict, merged_df = stage_cache.run(
+        'dag', create_complete_dag_system, dict(
+            sequence_seperated_order=sequence_seperated_order, linespeed=linespeed,
+            machine_mapper=machine_mapper, aging_df=aging_df),
+        constants=('TIME_MULTIPLIER', 'FAKE_OPERATION_DEPTH'))
 
     print(f"[50%] DAG 시스템 생성 완료 - 노드: {len(dag_df)}개, 기계: {len(machine_dict)}개")
 
@@ -131,7 +148,7 @@ def run_level4_scheduling():
     try:
         # 스케줄링 준비 및 실행 모듈 호출
 
-        result, scheduler = run_scheduler_pipeline(
+        result, scheduler = stage_cache.run('schedule', run_scheduler_pipeline, dict(
             dag_df=dag_df,
             sequence_seperated_order=sequence_seperated_order,
             width_change_df=width_change_df,
@@ -143,7 +160,11 @@ def run_level4_scheduling():
             base_date=base_date,
             manager=manager,
             window_days=window_days,
-        )
+            # 지역 탐색은 시간 예산 대신 반복 횟수로 지정 (결과가 기계 부하와 무관해 캐시 키로 쓸 수 있음)
+            local_search_iterations=config.constants.LOCAL_SEARCH_ITERATIONS,
+        ), constants=('TIME_MULTIPLIER', 'FAKE_OPERATION_DEPTH'))
+        # 스케줄링 중 갱신된 노드 정보 (SELECTED_CHEMICAL 등, 캐시 사용 시 캐시된 스케줄러의 것)
+        opnode_dict = scheduler.delay_processor.opnode_dict
         
         # 원본 결과 저장 (임시)
         excel_filename = "data/output/result.xlsx"
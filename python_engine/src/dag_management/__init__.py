@@ -1,6 +1,8 @@
 from .dag_dataframe import make_process_table, Create_dag_dataframe, insert_aging_nodes_to_dag, parse_aging_requirements
 from .node_dict import create_opnode_dict, create_machine_dict
+from .node_table import NodeAttributeTable, NodeAttributeDict
 from .dag_manager import DAGGraphManager
+from .checkpoint import save_dag_checkpoint, load_dag_checkpoint, DAG_CHECKPOINT_VERSION
 from config import config
 import pandas as pd
 
@@ -84,4 +86,50 @@ def create_complete_dag_system(sequence_seperated_order, linespeed, machine_mapp
 
         print(f"[44%] Aging 노드 DAG 삽입 완료 - {len(aging_map)}개 노드")
 
-    return dag_df, opnode_dict, manager, machine_dict, merged_df
\ No newline at end of file
+    return dag_df, opnode_dict, manager, machine_dict, merged_df
+
+def extend_dag_system(dag_df, opnode_dict, manager, machine_dict, merged_df,
+                      new_sequence_seperated_order, linespeed, machine_mapper, aging_df):
+    """
+    기존 DAG 시스템에 신규 주문 노드만 추가 (신규 주문 삽입용)
+
+    신규 주문으로만 create_complete_dag_system을 실행한 뒤 그 노드들을 기존 객체에 이어 붙입니다.
+    manager / machine_dict / opnode_dict는 제자리 갱신되므로, 이들을 참조하는 Scheduler와
+    DelayProcessor도 그대로 신규 노드를 조회할 수 있습니다. 기존 노드의 스케줄 상태는 변경하지 않습니다.
+
+    Args:
+        dag_df, opnode_dict, manager, machine_dict, merged_df: 기존 create_complete_dag_system 결과
+        new_sequence_seperated_order: 신규 주문의 공정별 분리 주문 (노드 ID가 기존과 겹치지 않아야 함)
+        linespeed: 라인스피드 데이터
+        machine_mapper: MachineMapper 객체
+        aging_df: Aging 데이터
+
+    Returns:
+        tuple: (dag_df, merged_df, new_dag_df)
+            - dag_df / merged_df: 신규 행이 추가된 DataFrame (새 객체)
+            - new_dag_df: 신규 노드만의 DAG 데이터프레임 (신규 노드 디스패치용)
+    """
+    new_dag_df, new_opnode_dict, new_manager, new_machine_dict, new_merged_df = create_complete_dag_system(
+        new_sequence_seperated_order, linespeed, machine_mapper, aging_df
+    )
+
+    duplicated = [node_id for node_id in new_manager.nodes if node_id in manager.nodes]
+    if duplicated:
+        raise ValueError(f"신규 주문 노드 ID가 기존 DAG와 겹칩니다: {duplicated[:5]}")
+
+    # 1. 노드 속성 (NodeAttributeTable이면 배열 이어 붙이기)
+    table = getattr(opnode_dict, 'table', None)
+    if table is not None:
+        table.append(new_opnode_dict.table)
+    else:
+        opnode_dict.update({node_id: dict(new_opnode_dict[node_id]) for node_id in new_opnode_dict})
+
+    # 2. 기계별 처리시간 / DAG 노드 (신규 주문은 기존 노드와 간선이 없음)
+    machine_dict.update(new_machine_dict)
+    manager.nodes.update(new_manager.nodes)
+
+    dag_df = pd.concat([dag_df, new_dag_df], ignore_index=True)
+    merged_df = pd.concat([merged_df, new_merged_df], ignore_index=True)
+
+    print(f"[INFO] DAG 확장 완료 - 신규 노드 {len(new_dag_df)}개 (전체 {len(dag_df)}개)")
+    return dag_df, merged_df, new_dag_df
@@ -0,0 +1,292 @@
+"""
+DAG 시스템 체크포인트 모듈
+
+create_complete_dag_system()의 결과 (dag_df, opnode_dict, manager, machine_dict, merged_df)를
+버전이 있는 단일 .npz 파일로 저장/로딩합니다.
+
+- DAGNode 객체 그래프를 pickle하지 않고, 노드 ID(문자열 배열) + 자식 인덱스(CSR 배열)로 저장
+- opnode_dict는 NodeAttributeTable의 컬럼 배열을 그대로 저장
+- machine_dict는 (노드, 기계 코드, 처리시간) CSR 배열로 저장
+- DataFrame은 컬럼별 배열(문자열 컬럼은 결측 마스크, 리스트 컬럼은 CSR)로 저장
+- 로딩은 np.load(allow_pickle=False)만 사용하므로 다른 프로세스에서 바로 스케줄링을 시작할 수 있습니다.
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from .dag_dataframe import DAGNode
+from .dag_manager import DAGGraphManager
+from .node_table import NodeAttributeTable
+
+
+DAG_CHECKPOINT_VERSION = 1
+
+
+# ===================================================================
+# 공통 인코딩 (문자열 / 리스트)
+# ===================================================================
+def _encode_strings(values):
+    """문자열(또는 결측) 목록 → (유니코드 배열, 결측 마스크)"""
+    mask = np.array([not isinstance(value, str) for value in values], dtype=bool)
+    strings = np.array(['' if missing else value for value, missing in zip(values, mask)], dtype=str)
+    return strings, mask
+
+
+def _plain_array(values, name):
+    """pickle 없이 저장 가능한 배열인지 확인 (object 배열은 저장 불가)"""
+    values = np.asarray(values)
+    if values.dtype == object:
+        raise TypeError(f"체크포인트에 저장할 수 없는 object 배열입니다: {name}")
+    return values
+
+
+def _decode_strings(strings, mask, missing=np.nan):
+    """(유니코드 배열, 결측 마스크) → object 배열 (결측은 missing)"""
+    values = strings.astype(object)
+    values[mask] = missing
+    return values
+
+
+def _encode_lists(lists, name):
+    """문자열 리스트 목록 → (평탄화된 유니코드 배열, offsets)
+
+    문자열이 아닌 원소는 문자열로 바뀌어 복원 시 타입이 달라지므로 저장하지 않고 TypeError
+    """
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(items) for items in lists])
+    items = [item for items in lists for item in items]
+    invalid = next((item for item in items if not isinstance(item, str)), None)
+    if invalid is not None:
+        raise TypeError(
+            f"체크포인트에 저장할 수 없는 리스트 원소입니다 (문자열만 가능): {name} - {type(invalid).__name__} {invalid!r}"
+        )
+    flat = np.array(items, dtype=str)
+    return flat, offsets
+
+
+def _decode_lists(flat, offsets, as_tuple=False):
+    items = flat.astype(object)
+    container = tuple if as_tuple else list
+    return [container(items[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+
+
+# ===================================================================
+# DataFrame
+# ===================================================================
+def _encode_frame(name, df, arrays):
+    """DataFrame을 컬럼별 배열로 arrays에 추가하고 메타 정보 반환"""
+    columns = []
+    for i, column in enumerate(df.columns):
+        key = f"{name}/{i}"
+        series = df[column]
+        if series.dtype != object:
+            arrays[key] = _plain_array(series.to_numpy(), f"{name}.{column}")
+            kind = 'array'
+        else:
+            non_null = [value for value in series if isinstance(value, (str, list, tuple)) or not pd.isna(value)]
+            if all(isinstance(value, str) for value in non_null):
+                arrays[key], arrays[f"{key}/mask"] = _encode_strings(series.tolist())
+                kind = 'str'
+            elif all(isinstance(value, (list, tuple)) for value in series):
+                arrays[key], arrays[f"{key}/offsets"] = _encode_lists(series.tolist(), f"{name}.{column}")
+                kind = 'list'
+            else:
+                raise TypeError(f"체크포인트에 저장할 수 없는 컬럼입니다: {name}.{column}")
+        columns.append({'name': column, 'kind': kind})
+
+    index = df.index
+    if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+        index_kind = 'range'
+    else:
+        arrays[f"{name}/index"] = index.to_numpy()
+        index_kind = 'array'
+    return {'columns': columns, 'index': index_kind, 'length': len(df)}
+
+
+def _decode_frame(name, meta, arrays):
+    data = {}
+    for i, column in enumerate(meta['columns']):
+        key = f"{name}/{i}"
+        if column['kind'] == 'array':
+            values = arrays[key]
+        elif column['kind'] == 'str':
+            values = _decode_strings(arrays[key], arrays[f"{key}/mask"])
+        else:
+            values = _decode_lists(arrays[key], arrays[f"{key}/offsets"])
+        data[column['name']] = pd.Series(values, dtype=object) if column['kind'] != 'array' else values
+    index = pd.RangeIndex(meta['length']) if meta['index'] == 'range' else arrays[f"{name}/index"]
+    df = pd.DataFrame(data, columns=[column['name'] for column in meta['columns']])
+    df.index = index
+    return df
+
+
+# ===================================================================
+# DAGGraphManager / opnode_dict / machine_dict
+# ===================================================================
+def _encode_manager(manager, arrays):
+    nodes = list(manager.nodes.values())
+    if any(node.node_start is not None for node in nodes):
+        raise ValueError("스케줄링이 시작된 DAG는 체크포인트로 저장할 수 없습니다 (DAG 생성 직후 상태만 저장)")
+
+    position = {node.id: i for i, node in enumerate(nodes)}
+    arrays['manager/node_ids'] = np.array([node.id for node in nodes], dtype=str)
+    arrays['manager/depth'] = np.array([node.depth for node in nodes], dtype=np.int64)
+    arrays['manager/is_aging'] = np.array([node.is_aging for node in nodes], dtype=bool)
+    arrays['manager/parent_node_count'] = np.array([node.parent_node_count for node in nodes], dtype=np.int64)
+    child_lists = [[position[child.id] for child in node.children] for node in nodes]
+    arrays['manager/child_offsets'] = np.zeros(len(nodes) + 1, dtype=np.int64)
+    arrays['manager/child_offsets'][1:] = np.cumsum([len(children) for children in child_lists])
+    arrays['manager/children'] = np.array([c for children in child_lists for c in children], dtype=np.int64)
+    return {'max_length': manager.max_length}
+
+
+def _decode_manager(meta, arrays, opnode_dict):
+    manager = DAGGraphManager(opnode_dict)
+    manager.max_length = meta['max_length']
+
+    node_ids = arrays['manager/node_ids'].astype(object)
+    depths = arrays['manager/depth'].tolist()
+    is_aging = arrays['manager/is_aging'].tolist()
+    parent_counts = arrays['manager/parent_node_count'].tolist()
+    nodes = []
+    for node_id, depth, aging, parent_count in zip(node_ids, depths, is_aging, parent_counts):
+        node = DAGNode(node_id, depth, is_aging=aging)
+        node.parent_node_count = parent_count
+        nodes.append(node)
+
+    offsets = arrays['manager/child_offsets']
+    children = arrays['manager/children'].tolist()
+    for i, node in enumerate(nodes):
+        node.children = [nodes[c] for c in children[offsets[i]:offsets[i + 1]]]
+        manager.nodes[node.id] = node
+
+    manager._build_all_descendants()
+    return manager
+
+
+def _encode_opnode_dict(opnode_dict, arrays):
+    table = getattr(opnode_dict, 'table', None)
+    if not isinstance(table, NodeAttributeTable):
+        raise TypeError("opnode_dict는 create_opnode_dict()가 만든 NodeAttributeDict여야 합니다")
+
+    for name in ('operation_code_categories', 'classification_categories'):
+        if not all(isinstance(value, str) for value in getattr(table, name)):
+            raise TypeError(f"체크포인트에 저장할 수 없는 opnode 범주값입니다 (문자열만 지원): {name}")
+
+    arrays['opnode/node_ids'] = np.array(table.node_ids.tolist(), dtype=str)
+    arrays['opnode/operation_order'] = _plain_array(table.operation_order, 'operation_order')
+    arrays['opnode/operation_code_codes'] = table.operation_code_codes
+    arrays['opnode/operation_code_categories'], _ = _encode_strings(table.operation_code_categories.tolist())
+    arrays['opnode/classification_codes'] = table.classification_codes
+    arrays['opnode/classification_categories'], _ = _encode_strings(table.classification_categories.tolist())
+    arrays['opnode/fabric_width'] = _plain_array(table.fabric_width, 'fabric_width')
+    arrays['opnode/production_length'] = _plain_array(table.production_length, 'production_length')
+    arrays['opnode/chemical_ids'] = table.chemical_ids
+    arrays['opnode/chemical_tuples'], arrays['opnode/chemical_offsets'] = _encode_lists(table.chemical_tuples, 'opnode.chemical_tuples')
+    arrays['opnode/selected_chemical'], arrays['opnode/selected_chemical_mask'] = \
+        _encode_strings(table.selected_chemical.tolist())
+
+
+def _decode_opnode_dict(arrays):
+    table = NodeAttributeTable(
+        node_ids=arrays['opnode/node_ids'].astype(object),
+        operation_order=arrays['opnode/operation_order'],
+        operation_code_codes=arrays['opnode/operation_code_codes'],
+        operation_code_categories=arrays['opnode/operation_code_categories'].astype(object),
+        classification_codes=arrays['opnode/classification_codes'],
+        classification_categories=arrays['opnode/classification_categories'].astype(object),
+        fabric_width=arrays['opnode/fabric_width'],
+        production_length=arrays['opnode/production_length'],
+        chemical_ids=arrays['opnode/chemical_ids'],
+        chemical_tuples=_decode_lists(arrays['opnode/chemical_tuples'], arrays['opnode/chemical_offsets'], as_tuple=True),
+    )
+    table.selected_chemical[:] = _decode_strings(
+        arrays['opnode/selected_chemical'], arrays['opnode/selected_chemical_mask'], missing=None
+    )
+    return table.as_dict()
+
+
+def _encode_machine_dict(machine_dict, arrays):
+    machine_codes = list(dict.fromkeys(code for times in machine_dict.values() for code in times))
+    code_position = {code: i for i, code in enumerate(machine_codes)}
+    arrays['machine_dict/node_ids'] = np.array(list(machine_dict.keys()), dtype=str)
+    arrays['machine_dict/machine_codes'] = np.array(machine_codes, dtype=str)
+    arrays['machine_dict/offsets'] = np.zeros(len(machine_dict) + 1, dtype=np.int64)
+    arrays['machine_dict/offsets'][1:] = np.cumsum([len(times) for times in machine_dict.values()])
+    arrays['machine_dict/codes'] = np.array(
+        [code_position[code] for times in machine_dict.values() for code in times], dtype=np.int64)
+    arrays['machine_dict/times'] = np.array(
+        [time for times in machine_dict.values() for time in times.values()], dtype=np.int64)
+
+
+def _decode_machine_dict(arrays):
+    machine_codes = arrays['machine_dict/machine_codes'].astype(object)
+    offsets = arrays['machine_dict/offsets'].tolist()
+    codes = machine_codes[arrays['machine_dict/codes']].tolist()
+    times = arrays['machine_dict/times'].tolist()
+    return {
+        node_id: dict(zip(codes[offsets[i]:offsets[i + 1]], times[offsets[i]:offsets[i + 1]]))
+        for i, node_id in enumerate(arrays['machine_dict/node_ids'].tolist())
+    }
+
+
+# ===================================================================
+# 저장 / 로딩
+# ===================================================================
+def save_dag_checkpoint(path, dag_df, opnode_dict, manager, machine_dict, merged_df, compress=True):
+    """
+    DAG 시스템 체크포인트 저장 (스케줄링 시작 전 상태)
+
+    Args:
+        path (str): 저장 경로 (.npz)
+        dag_df, opnode_dict, manager, machine_dict, merged_df: create_complete_dag_system() 결과
+        compress (bool): zip 압축 여부 (False면 파일은 커지지만 로딩이 더 빠름)
+
+    Returns:
+        str: 저장된 파일 경로
+    """
+    arrays = {}
+    meta = {
+        'version': DAG_CHECKPOINT_VERSION,
+        'dag_df': _encode_frame('dag_df', dag_df, arrays),
+        'merged_df': _encode_frame('merged_df', merged_df, arrays),
+        'manager': _encode_manager(manager, arrays),
+    }
+    _encode_opnode_dict(opnode_dict, arrays)
+    _encode_machine_dict(machine_dict, arrays)
+    arrays['meta'] = np.array(json.dumps(meta, ensure_ascii=False))
+
+    with open(path, 'wb') as f:
+        (np.savez_compressed if compress else np.savez)(f, **arrays)
+    print(f"[체크포인트] DAG 체크포인트 저장 완료: {path} (노드 {len(manager.nodes)}개, v{DAG_CHECKPOINT_VERSION})")
+    return path
+
+
+def load_dag_checkpoint(path):
+    """
+    DAG 시스템 체크포인트 로딩
+
+    Args:
+        path (str): save_dag_checkpoint()로 저장한 파일 경로
+
+    Returns:
+        tuple: (dag_df, opnode_dict, manager, machine_dict, merged_df) - create_complete_dag_system()과 동일
+
+    Raises:
+        ValueError: 체크포인트 버전이 현재 코드와 다른 경우
+    """
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+
+    meta = json.loads(arrays['meta'].item())
+    if meta.get('version') != DAG_CHECKPOINT_VERSION:
+        raise ValueError(
+            f"DAG 체크포인트 버전 불일치: 파일 v{meta.get('version')}, 현재 v{DAG_CHECKPOINT_VERSION} ({path})"
+        )
+
+    dag_df = _decode_frame('dag_df', meta['dag_df'], arrays)
+    merged_df = _decode_frame('merged_df', meta['merged_df'], arrays)
+    opnode_dict = _decode_opnode_dict(arrays)
+    manager = _decode_manager(meta['manager'], arrays, opnode_dict)
+    machine_dict = _decode_machine_dict(arrays)
+    return dag_df, opnode_dict, manager, machine_dict, merged_df
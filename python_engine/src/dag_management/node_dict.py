@@ -1,30 +1,24 @@
 import pandas as pd
 import numpy as np
 from config import config
+from .node_table import NodeAttributeTable
 
 def create_opnode_dict(sequence_seperated_order):
-    opnode_dict = {}
-
-    for _, row in sequence_seperated_order.iterrows():
-        # CHEMICAL_LIST 문자열을 튜플로 변환
-        chemical_str = str(row[config.columns.CHEMICAL_LIST])
-        if chemical_str == "None" or chemical_str.strip() == "":
-            chemical_tuple = ()
-        else:
-            # 'A|B' -> ('A','B'), 'A' -> ('A',)
-            chemical_tuple = tuple(chemical_str.split("|"))
-        
-        opnode_dict[row[config.columns.PROCESS_ID]] = {
-            "OPERATION_ORDER": row[config.columns.OPERATION_ORDER],
-            "OPERATION_CODE": row[config.columns.OPERATION_CODE],
-            "OPERATION_CLASSIFICATION": row[config.columns.OPERATION_CLASSIFICATION],
-            "FABRIC_WIDTH": row[config.columns.FABRIC_WIDTH],
-            "CHEMICAL_LIST": chemical_tuple,
-            "PRODUCTION_LENGTH": row[config.columns.PRODUCTION_LENGTH],
-            "SELECTED_CHEMICAL": None,  # 초기값
-        }
-    
-    return opnode_dict
+    """
+    노드 속성 사전 생성 (벡터 연산 기반)
+
+    iterrows() 대신 NodeAttributeTable을 컬럼 단위로 생성하고,
+    기존 dict와 동일하게 사용할 수 있는 NodeAttributeDict 파사드를 반환합니다.
+
+    Args:
+        sequence_seperated_order: 공정별 분리 주문 DataFrame
+
+    Returns:
+        NodeAttributeDict: {node_id: {"OPERATION_ORDER", "OPERATION_CODE", "OPERATION_CLASSIFICATION",
+                                      "FABRIC_WIDTH", "CHEMICAL_LIST", "PRODUCTION_LENGTH", "SELECTED_CHEMICAL"}}
+            `.table` 속성으로 NodeAttributeTable(배열)에 직접 접근 가능
+    """
+    return NodeAttributeTable.from_dataframe(sequence_seperated_order).as_dict()
 
 
 
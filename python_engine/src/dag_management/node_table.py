@@ -0,0 +1,336 @@
+"""
+노드 속성 테이블 모듈
+
+create_opnode_dict가 만들던 dict-of-dict 구조를 컬럼형(NumPy 배열) 테이블로 보관합니다.
+- 노드 ID는 정수 인덱스로 인턴(intern)되어 배열 조회로 접근
+- 공정코드/공정분류는 범주형(codes + categories)으로 저장
+- CHEMICAL_LIST는 인턴된 튜플 ID로 저장
+
+기존 호출부(DelayProcessor, find_best_chemical, SimplifiedGapAnalyzer 등)는
+NodeAttributeDict 파사드를 통해 기존과 동일하게 opnode_dict[node_id]["KEY"] 형태로 접근할 수 있습니다.
+"""
+
+from collections.abc import Mapping
+import numpy as np
+import pandas as pd
+from config import config
+
+
+# opnode_dict 레코드의 키 순서 (기존 create_opnode_dict와 동일)
+NODE_ATTRIBUTE_KEYS = (
+    "OPERATION_ORDER",
+    "OPERATION_CODE",
+    "OPERATION_CLASSIFICATION",
+    "FABRIC_WIDTH",
+    "CHEMICAL_LIST",
+    "PRODUCTION_LENGTH",
+    "SELECTED_CHEMICAL",
+)
+
+
+def _to_python(value):
+    """NumPy 스칼라를 파이썬 기본 타입으로 변환 (기존 dict 값 타입 유지용)"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def parse_chemical_string(chemical_str):
+    """
+    CHEMICAL_LIST 문자열을 튜플로 변환
+
+    'A|B' -> ('A', 'B'), 'A' -> ('A',), 'None' 또는 빈 문자열 -> ()
+    """
+    if chemical_str == "None" or chemical_str.strip() == "":
+        return ()
+    return tuple(chemical_str.split("|"))
+
+
+class NodeAttributeTable:
+    """
+    공정 노드 속성의 컬럼형 테이블
+
+    Attributes:
+        node_ids (np.ndarray): 인턴된 노드 ID 배열 (object). 배열 위치가 정수 노드 ID
+        operation_order (np.ndarray): 공정순서
+        operation_code_codes (np.ndarray): 공정코드 범주 코드 (int32, 결측 -1)
+        operation_code_categories (np.ndarray): 공정코드 범주값
+        classification_codes (np.ndarray): 공정분류 범주 코드 (int32, 결측 -1)
+        classification_categories (np.ndarray): 공정분류 범주값
+        fabric_width (np.ndarray): 원단너비
+        production_length (np.ndarray): 생산길이
+        chemical_ids (np.ndarray): CHEMICAL_LIST 튜플 ID (int32)
+        chemical_tuples (list): 인턴된 CHEMICAL_LIST 튜플 목록
+        chemical_names (np.ndarray): 전체 배합액 코드 목록
+        chemical_membership (np.ndarray): [튜플 ID, 배합액 코드] 포함 여부 (bool)
+        selected_chemical (np.ndarray): 선택된 배합액 (object, 가변)
+    """
+
+    def __init__(self, node_ids, operation_order, operation_code_codes, operation_code_categories,
+                 classification_codes, classification_categories, fabric_width, production_length,
+                 chemical_ids, chemical_tuples):
+        self.node_ids = np.asarray(node_ids, dtype=object)
+        self.index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+        self.operation_order = np.asarray(operation_order)
+        self.operation_code_codes = np.asarray(operation_code_codes, dtype=np.int32)
+        self.operation_code_categories = np.asarray(operation_code_categories, dtype=object)
+        self.classification_codes = np.asarray(classification_codes, dtype=np.int32)
+        self.classification_categories = np.asarray(classification_categories, dtype=object)
+        self.fabric_width = np.asarray(fabric_width)
+        self.production_length = np.asarray(production_length)
+        self.chemical_ids = np.asarray(chemical_ids, dtype=np.int32)
+        self.chemical_tuples = list(chemical_tuples)
+        self.selected_chemical = np.full(len(self.node_ids), None, dtype=object)
+
+        self._build_chemical_membership()
+
+    def _build_chemical_membership(self):
+        """튜플 ID × 배합액 코드 포함 행렬 생성 (배합액 카운트를 배열 연산으로 처리)"""
+        names = sorted({chem for chem_tuple in self.chemical_tuples for chem in chem_tuple})
+        self.chemical_names = np.asarray(names, dtype=object)
+        self.chemical_code = {name: i for i, name in enumerate(names)}
+        self.chemical_membership = np.zeros((len(self.chemical_tuples), len(names)), dtype=bool)
+        for tuple_id, chem_tuple in enumerate(self.chemical_tuples):
+            for chem in chem_tuple:
+                self.chemical_membership[tuple_id, self.chemical_code[chem]] = True
+
+    @classmethod
+    def from_dataframe(cls, sequence_seperated_order):
+        """
+        sequence_seperated_order에서 벡터 연산으로 테이블 생성
+
+        기존 dict 생성 방식과 동일하게, 중복 PROCESS_ID는 최초 등장 순서를 유지하고
+        값은 마지막 행의 값을 사용합니다.
+
+        Args:
+            sequence_seperated_order (pd.DataFrame): 공정별 분리 주문 데이터
+
+        Returns:
+            NodeAttributeTable
+        """
+        df = sequence_seperated_order
+        process_ids = df[config.columns.PROCESS_ID]
+
+        # 노드 순서: 최초 등장 순서, 값: 마지막 행
+        order = process_ids.drop_duplicates(keep='first')
+        last = df.drop_duplicates(subset=config.columns.PROCESS_ID, keep='last').set_index(config.columns.PROCESS_ID)
+        last = last.loc[order.values]
+
+        operation_code_codes, operation_code_categories = pd.factorize(last[config.columns.OPERATION_CODE])
+        classification_codes, classification_categories = pd.factorize(last[config.columns.OPERATION_CLASSIFICATION])
+
+        # CHEMICAL_LIST: 고유 문자열만 파싱 후 튜플 인턴
+        chemical_str_codes, chemical_strings = pd.factorize(last[config.columns.CHEMICAL_LIST].astype(str))
+        chemical_tuples = []
+        tuple_ids = {}
+        string_to_tuple = np.empty(len(chemical_strings), dtype=np.int32)
+        for i, chemical_str in enumerate(chemical_strings):
+            chem_tuple = parse_chemical_string(chemical_str)
+            if chem_tuple not in tuple_ids:
+                tuple_ids[chem_tuple] = len(chemical_tuples)
+                chemical_tuples.append(chem_tuple)
+            string_to_tuple[i] = tuple_ids[chem_tuple]
+
+        return cls(
+            node_ids=last.index.to_numpy(dtype=object),
+            operation_order=last[config.columns.OPERATION_ORDER].to_numpy(),
+            operation_code_codes=operation_code_codes,
+            operation_code_categories=np.asarray(operation_code_categories, dtype=object),
+            classification_codes=classification_codes,
+            classification_categories=np.asarray(classification_categories, dtype=object),
+            fabric_width=last[config.columns.FABRIC_WIDTH].to_numpy(),
+            production_length=last[config.columns.PRODUCTION_LENGTH].to_numpy(),
+            chemical_ids=string_to_tuple[chemical_str_codes],
+            chemical_tuples=chemical_tuples,
+        )
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def append(self, other):
+        """
+        다른 테이블의 노드를 뒤에 추가 (신규 주문 삽입용, 제자리 갱신)
+
+        기존 노드의 정수 인덱스와 SELECTED_CHEMICAL은 그대로 유지되며,
+        범주값/배합액 튜플은 기존 목록 뒤에 이어서 인턴합니다.
+        테이블 객체를 교체하지 않으므로 같은 테이블을 참조하는 DelayProcessor 등에도 바로 반영됩니다.
+
+        Args:
+            other (NodeAttributeTable): 추가할 노드 테이블 (기존 노드 ID와 겹치면 안 됨)
+        """
+        duplicated = [node_id for node_id in other.node_ids if node_id in self.index]
+        if duplicated:
+            raise ValueError(f"이미 존재하는 노드 ID는 추가할 수 없습니다: {duplicated[:5]}")
+
+        def merge_codes(codes, categories, other_codes, other_categories):
+            categories = list(categories)
+            position = {value: i for i, value in enumerate(categories)}
+            remap = np.empty(len(other_categories), dtype=np.int32)
+            for i, value in enumerate(other_categories):
+                if value not in position:
+                    position[value] = len(categories)
+                    categories.append(value)
+                remap[i] = position[value]
+            other_codes = np.where(other_codes >= 0, remap[np.maximum(other_codes, 0)], -1) \
+                if len(remap) else np.full(len(other_codes), -1, dtype=np.int32)
+            return (np.concatenate([codes, other_codes]).astype(np.int32),
+                    np.asarray(categories, dtype=object))
+
+        self.operation_code_codes, self.operation_code_categories = merge_codes(
+            self.operation_code_codes, self.operation_code_categories,
+            other.operation_code_codes, other.operation_code_categories)
+        self.classification_codes, self.classification_categories = merge_codes(
+            self.classification_codes, self.classification_categories,
+            other.classification_codes, other.classification_categories)
+
+        tuple_ids = {chem_tuple: i for i, chem_tuple in enumerate(self.chemical_tuples)}
+        tuple_remap = np.empty(len(other.chemical_tuples), dtype=np.int32)
+        for i, chem_tuple in enumerate(other.chemical_tuples):
+            if chem_tuple not in tuple_ids:
+                tuple_ids[chem_tuple] = len(self.chemical_tuples)
+                self.chemical_tuples.append(chem_tuple)
+            tuple_remap[i] = tuple_ids[chem_tuple]
+        self.chemical_ids = np.concatenate([self.chemical_ids, tuple_remap[other.chemical_ids]]).astype(np.int32)
+
+        offset = len(self.node_ids)
+        self.node_ids = np.concatenate([self.node_ids, other.node_ids])
+        self.index.update({node_id: offset + i for i, node_id in enumerate(other.node_ids)})
+        self.operation_order = np.concatenate([self.operation_order, other.operation_order])
+        self.fabric_width = np.concatenate([self.fabric_width, other.fabric_width])
+        self.production_length = np.concatenate([self.production_length, other.production_length])
+        self.selected_chemical = np.concatenate([self.selected_chemical, other.selected_chemical])
+
+        self._build_chemical_membership()
+
+    # === 정수 ID 기반 조회 (hot path) ===
+
+    def index_of(self, node_id):
+        """노드 ID → 정수 인덱스 (없으면 -1)"""
+        return self.index.get(node_id, -1)
+
+    def indices_of(self, node_ids):
+        """노드 ID 리스트 → 정수 인덱스 배열 (없는 ID는 -1)"""
+        index = self.index
+        return np.fromiter((index.get(node_id, -1) for node_id in node_ids), dtype=np.int64, count=len(node_ids))
+
+    def operation_code_at(self, idx):
+        code = self.operation_code_codes[idx]
+        return self.operation_code_categories[code] if code >= 0 else np.nan
+
+    def classification_at(self, idx):
+        code = self.classification_codes[idx]
+        return self.classification_categories[code] if code >= 0 else np.nan
+
+    def chemical_list_at(self, idx):
+        return self.chemical_tuples[self.chemical_ids[idx]]
+
+    def chemical_counts(self, chemical_list, indices):
+        """
+        주어진 노드들 중 각 배합액을 사용할 수 있는 노드 수
+
+        Args:
+            chemical_list (tuple): 카운트할 배합액 코드들
+            indices (np.ndarray): 노드 정수 인덱스 배열 (-1은 무시)
+
+        Returns:
+            list: chemical_list 순서대로의 카운트
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        indices = indices[indices >= 0]
+        tuple_ids = self.chemical_ids[indices]
+        counts = []
+        for chemical in chemical_list:
+            code = self.chemical_code.get(chemical)
+            counts.append(0 if code is None else int(self.chemical_membership[tuple_ids, code].sum()))
+        return counts
+
+    def record(self, idx):
+        """정수 인덱스의 노드 정보를 기존 opnode_dict 레코드(dict)로 반환"""
+        return {
+            "OPERATION_ORDER": _to_python(self.operation_order[idx]),
+            "OPERATION_CODE": self.operation_code_at(idx),
+            "OPERATION_CLASSIFICATION": self.classification_at(idx),
+            "FABRIC_WIDTH": _to_python(self.fabric_width[idx]),
+            "CHEMICAL_LIST": self.chemical_list_at(idx),
+            "PRODUCTION_LENGTH": _to_python(self.production_length[idx]),
+            "SELECTED_CHEMICAL": self.selected_chemical[idx],
+        }
+
+    def as_dict(self):
+        """dict 호환 파사드 반환"""
+        return NodeAttributeDict(self)
+
+
+class NodeRecordView(Mapping):
+    """
+    단일 노드 레코드의 dict 호환 뷰
+
+    값은 테이블 배열에서 직접 읽고, SELECTED_CHEMICAL 쓰기는 테이블에 반영됩니다.
+    """
+
+    __slots__ = ("_table", "_idx")
+
+    def __init__(self, table, idx):
+        self._table = table
+        self._idx = idx
+
+    def __getitem__(self, key):
+        table, idx = self._table, self._idx
+        if key == "SELECTED_CHEMICAL":
+            return table.selected_chemical[idx]
+        if key == "CHEMICAL_LIST":
+            return table.chemical_list_at(idx)
+        if key == "OPERATION_CODE":
+            return table.operation_code_at(idx)
+        if key == "OPERATION_CLASSIFICATION":
+            return table.classification_at(idx)
+        if key == "FABRIC_WIDTH":
+            return _to_python(table.fabric_width[idx])
+        if key == "PRODUCTION_LENGTH":
+            return _to_python(table.production_length[idx])
+        if key == "OPERATION_ORDER":
+            return _to_python(table.operation_order[idx])
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key != "SELECTED_CHEMICAL":
+            raise KeyError(f"{key}는 읽기 전용 속성입니다 (SELECTED_CHEMICAL만 변경 가능)")
+        self._table.selected_chemical[self._idx] = value
+
+    def __iter__(self):
+        return iter(NODE_ATTRIBUTE_KEYS)
+
+    def __len__(self):
+        return len(NODE_ATTRIBUTE_KEYS)
+
+    def __repr__(self):
+        return repr(self._table.record(self._idx))
+
+
+class NodeAttributeDict(Mapping):
+    """
+    NodeAttributeTable의 dict 호환 파사드 (기존 opnode_dict 대체)
+
+    opnode_dict[node_id] / opnode_dict.get(node_id) / values() / items() 등
+    기존 dict 사용 패턴을 그대로 지원합니다. `table` 속성으로 배열에 직접 접근할 수 있습니다.
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    def __getitem__(self, node_id):
+        idx = self.table.index.get(node_id)
+        if idx is None:
+            raise KeyError(node_id)
+        return NodeRecordView(self.table, idx)
+
+    def __contains__(self, node_id):
+        return node_id in self.table.index
+
+    def __iter__(self):
+        return iter(self.table.node_ids)
+
+    def __len__(self):
+        return len(self.table)
+
+    def __repr__(self):
+        return f"NodeAttributeDict(nodes={len(self.table)})"
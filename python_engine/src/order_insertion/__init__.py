@@ -0,0 +1,11 @@
+"""
+신규 주문 삽입 모듈
+
+이미 스케줄된 상태에 긴급 주문 등 소량의 신규 주문을 추가할 때
+주문 시퀀스 생성 / 수율 예측 / DAG 생성은 신규 주문에 대해서만 수행하고,
+기존 작업은 그대로 둔 채 신규 작업만 기계의 빈 시간 창에 배치합니다.
+"""
+
+from .order_inserter import insert_orders, rename_conflicting_process_ids
+
+__all__ = ['insert_orders', 'rename_conflicting_process_ids']
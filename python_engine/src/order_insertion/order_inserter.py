@@ -0,0 +1,127 @@
+"""
+신규 주문 삽입 실행 모듈
+
+전체 재실행(시퀀스 생성 → DAG 생성 → 스케줄링) 대신
+신규 주문만 같은 단계 함수로 처리한 뒤 기존 DAG/스케줄러 상태에 이어 붙입니다.
+"""
+
+import pandas as pd
+from config import config
+from src.validation.production_preprocessor import ProductionDataPreprocessor
+from src.order_sequencing import generate_order_sequences
+from src.yield_management import yield_prediction
+from src.dag_management import extend_dag_system
+from src.scheduler import run_order_insertion
+
+
+def rename_conflicting_process_ids(sequence_seperated_order, existing_ids):
+    """
+    기존 노드와 겹치는 PROCESS_ID에 '_ADD<n>' 접미사를 붙여 고유하게 만듦
+
+    PROCESS_ID는 GITEM/폭/조합분류/납기 월/공정/배합액으로 만들어지므로,
+    같은 제품의 주문이 추가되면 기존 노드와 ID가 같아질 수 있습니다.
+    (접미사는 ID 끝에 붙이므로 ID 앞부분을 파싱하는 결과 처리 로직에는 영향 없음)
+
+    Args:
+        sequence_seperated_order (pd.DataFrame): 신규 주문의 공정별 분리 주문
+        existing_ids (iterable): 기존 DAG 노드 ID (Aging 노드 포함)
+
+    Returns:
+        pd.DataFrame: PROCESS_ID가 조정된 복사본
+    """
+    taken = set(existing_ids)
+    renamed = {}
+    for process_id in pd.unique(sequence_seperated_order[config.columns.PROCESS_ID]):
+        if process_id not in taken:
+            continue
+        suffix = 1
+        while f"{process_id}_ADD{suffix}" in taken:
+            suffix += 1
+        renamed[process_id] = f"{process_id}_ADD{suffix}"
+        taken.add(renamed[process_id])
+
+    sequence_seperated_order = sequence_seperated_order.copy()
+    if renamed:
+        print(f"[INFO] 기존 노드와 겹치는 신규 노드 ID {len(renamed)}개 변경 (예: {next(iter(renamed.values()))})")
+        sequence_seperated_order[config.columns.PROCESS_ID] = sequence_seperated_order[config.columns.PROCESS_ID].replace(renamed)
+    return sequence_seperated_order
+
+
+def insert_orders(new_order_df, processed_data, local_machine_limit, machine_allocate, machine_mapper,
+                  scheduler, manager, dag_df, opnode_dict, machine_dict, merged_df, sequence_seperated_order,
+                  base_date, window_days, release_time=0):
+    """
+    기존 스케줄에 신규 주문을 삽입
+
+    1. 신규 주문 전처리 → 주문 시퀀스 생성 → 수율 예측 (신규 주문만)
+    2. 기존 노드와 겹치는 ID 조정 후 DAG 생성, 기존 manager/machine_dict/opnode_dict에 이어 붙임
+    3. 신규 노드만 디스패치 우선순위로 스케줄링 (기존 작업은 이동하지 않고 빈 시간 창 우선 사용)
+
+    scheduler / manager / opnode_dict / machine_dict는 제자리 갱신됩니다.
+
+    Args:
+        new_order_df (pd.DataFrame): 신규 주문 (tb_polist 시트와 같은 형식)
+        processed_data (dict): 기존 스케줄에 사용한 preprocess_production_data() 결과
+        local_machine_limit (pd.DataFrame): 시나리오 machine_limit 시트
+        machine_allocate (pd.DataFrame): 시나리오 machine_allocate 시트
+        machine_mapper (MachineMapper): 기계 정보 매핑 관리 객체
+        scheduler: run_scheduler_pipeline() 결과 스케줄러
+        manager, dag_df, opnode_dict, machine_dict, merged_df: 기존 create_complete_dag_system() 결과
+        sequence_seperated_order (pd.DataFrame): 기존 공정별 분리 주문 (yield_prediction() 결과)
+        base_date (datetime): 기준 날짜
+        window_days (int): 디스패칭 window 크기
+        release_time (datetime or int): 신규 작업의 최초 시작 가능 시각 (기본 0)
+
+    Returns:
+        dict:
+            - 'result': 전체 노드 스케줄링 결과 (run_scheduler_pipeline 결과와 같은 형식)
+            - 'sequence_seperated_order' / 'dag_df' / 'merged_df': 신규 주문이 추가된 DataFrame (결과 후처리용)
+            - 'new_node_ids': 추가된 노드 ID 리스트
+            - 'unable_order': 생산 불가로 제외된 신규 주문
+    """
+    new_order = ProductionDataPreprocessor().preprocess_order_data(new_order_df)
+
+    existing_po = set(merged_df[config.columns.PO_NO])
+    duplicated_po = sorted(set(new_order[config.columns.PO_NO].astype(str)) & existing_po)
+    if duplicated_po:
+        raise ValueError(f"이미 스케줄에 포함된 P/O는 신규 주문으로 삽입할 수 없습니다: {duplicated_po[:5]}")
+
+    print(f"[신규주문] {len(new_order)}개 주문 시퀀스 생성 중...")
+    new_sequence_order, linespeed, _, unable_order, _ = generate_order_sequences(
+        new_order,
+        processed_data['operation_sequence'],
+        processed_data['operation_types'],
+        local_machine_limit,
+        processed_data['global_machine_limit'],
+        machine_allocate,
+        processed_data['linespeed'],
+        processed_data['chemical_data'],
+    )
+    new_sequence_order = yield_prediction(processed_data['yield_data'], new_sequence_order)
+    new_sequence_order = rename_conflicting_process_ids(new_sequence_order, manager.nodes.keys())
+
+    print("[신규주문] DAG 확장 중...")
+    dag_df, merged_df, new_dag_df = extend_dag_system(
+        dag_df, opnode_dict, manager, machine_dict, merged_df,
+        new_sequence_order, linespeed, machine_mapper, processed_data['aging_data'],
+    )
+
+    result, _ = run_order_insertion(
+        scheduler, manager, new_dag_df, new_sequence_order, window_days,
+        release_time=release_time, base_date=base_date,
+    )
+
+    new_node_ids = new_dag_df[config.columns.PROCESS_ID].tolist()
+    unscheduled = [node_id for node_id in new_node_ids if manager.nodes[node_id].node_start is None]
+    if unscheduled:
+        print(f"[경고] 신규 노드 {len(unscheduled)}개 스케줄링 실패: {unscheduled[:5]}")
+    print(f"[신규주문] 삽입 완료 - 신규 노드 {len(new_node_ids)}개")
+
+    return {
+        'result': result,
+        'sequence_seperated_order': pd.concat([sequence_seperated_order, new_sequence_order], ignore_index=True),
+        'dag_df': dag_df,
+        'merged_df': merged_df,
+        'new_node_ids': new_node_ids,
+        'unable_order': unable_order,
+    }
@@ -1,21 +1,18 @@
 from config import config
 import pandas as pd
 import numpy as np
-from .order_preprocessing import seperate_order_by_month, same_order_groupby
-from .sequence_preprocessing import process_operations_by_category, create_sequence_seperated_order
+from .order_preprocessing import seperate_order_by_month, same_order_groupby, same_order_groupby_by_month, DUE_MONTH_KEY
+from .sequence_preprocessing import process_operations_by_category, create_sequence_seperated_order, create_sequence_seperated_order_single_pass
 from .operation_machine_limit import operation_machine_limit, operation_machine_exclusive
 
 def generate_order_sequences(order, operation_seperated_sequence, operation_types, local_machine_limit, global_machine_limit, machine_allocate, linespeed, chemical_data):
     """
-    order -> 월별 분리 -> 동일 주문 병합 -> 시퀀스 주문 생성 -> 공정 타입 병합 + 컬럼 타입 변환
+    order -> 동일 주문 병합(납기 월 기준) -> 시퀀스 주문 생성 -> 공정 타입 병합 + 컬럼 타입 변환
     한 번에 처리하는 파이프라인 함수
     """
-    # 1-A. 납기일 월별 분리
-    order_list = seperate_order_by_month(order)
-
-    # 1-B. 동일 주문 병합
+    # 1-A/1-B. 동일 주문 병합 (납기 월을 그룹 키로 포함 → 월별 분리 후 병합과 동일)
     groupby_columns = [config.columns.GITEM, config.columns.GITEM_NAME, config.columns.WIDTH, config.columns.LENGTH]
-    order_list = [same_order_groupby(groupby_columns, df) for df in order_list]
+    grouped_order = same_order_groupby_by_month(groupby_columns, order)
 
     # 1-C. 시퀀스 주문 생성
     chemical_data = chemical_data.copy()  # SettingWithCopyWarning 방지
@@ -31,7 +28,7 @@ def generate_order_sequences(order, operation_seperated_sequence, operation_type
     # 배합액 없는 공정의 경우 None으로 추가
     operation_seperated_sequence[config.columns.CHEMICAL_LIST] = operation_seperated_sequence[config.columns.CHEMICAL_LIST].replace(np.nan, "None")
 
-    sequence_order = create_sequence_seperated_order(order_list, operation_seperated_sequence)
+    sequence_order = create_sequence_seperated_order_single_pass(grouped_order, operation_seperated_sequence, [DUE_MONTH_KEY])
 
     # 1-D. 공정 타입 정보 병합 및 형 변환
     sequence_order = sequence_order.merge(
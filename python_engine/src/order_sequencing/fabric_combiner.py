@@ -1,9 +1,13 @@
+import numpy as np
 import pandas as pd
 from config import config
 
 
 class FabricRuleHandler:
     """원단 조합 규칙 처리 클래스 (전체 구현)"""
+
+    # 그룹별 합계를 구하는 너비 분류 (그 외 너비는 'other')
+    WIDTH_CLASSES = (508, 1016, 609, 914, 762, 1524)
     
     def __init__(self):
         self.handlers = {
@@ -130,6 +134,86 @@ class FabricRuleHandler:
         """조합 타입에 따른 핸들러 반환"""
         return self.handlers.get(combination_type)
 
+    @staticmethod
+    def classify_widths(widths: pd.Series) -> np.ndarray:
+        """원단 너비 배열 기반 조합분류 계산 (classify_width의 벡터 버전)"""
+        widths = widths.to_numpy()
+        return np.select(
+            [widths == 1524, np.isin(widths, [1016, 508]), np.isin(widths, [609, 914]), widths == 762],
+            [0, 1, 2, 3],
+            default=4,
+        ).astype(np.int64)
+
+    def apply_rules(self, comb_types: np.ndarray, width_sums: pd.DataFrame, width_counts: pd.DataFrame):
+        """
+        그룹별 너비 분류 합계에 조합분류 0~4 규칙을 컬럼 단위로 적용 (_handle_type0~4와 동일 규칙)
+
+        Args:
+            comb_types: 그룹별 조합분류
+            width_sums: 그룹별 너비 분류(WIDTH_CLASSES) 생산길이 합계
+            width_counts: 그룹별 너비 분류 행 수 (원단 존재 여부 판단)
+
+        Returns:
+            tuple: (원단너비 배열, 생산길이 배열)
+        """
+        total = width_sums.sum(axis=1).to_numpy()
+        len_508, len_1016 = width_sums[508].to_numpy(), width_sums[1016].to_numpy()
+        len_609, len_914 = width_sums[609].to_numpy(), width_sums[914].to_numpy()
+        has_508, has_1016 = width_counts[508].to_numpy() > 0, width_counts[1016].to_numpy() > 0
+        has_609, has_914 = width_counts[609].to_numpy() > 0, width_counts[914].to_numpy() > 0
+
+        is_type1 = comb_types == 1
+        is_type2 = comb_types == 2
+        if (is_type1 & ~has_508 & ~has_1016).any():
+            raise ValueError("조합분류 1 규칙에 필요한 원단(508/1016mm)이 없습니다")
+        if (is_type2 & ~has_609 & ~has_914).any():
+            raise ValueError("조합분류 2 규칙에 필요한 원단(609/914mm)이 없습니다")
+
+        # 조합분류 1: 508 단독(3:1) / 1016 단독 / 조합
+        type1_both = is_type1 & has_508 & has_1016
+        type1_1016 = is_type1 & ~has_508
+        fabric_width = np.select(
+            [comb_types == 4, type1_1016, type1_both & (len_508 < len_1016)],
+            [1300, 1000, 1000],
+            default=1500,
+        ).astype(np.int64)
+
+        production_length = np.select(
+            [
+                is_type1 & ~has_1016,
+                type1_both & (len_508 > len_1016),
+                type1_both & (len_508 < len_1016),
+                type1_both,
+                is_type2 & ~has_914,
+                is_type2 & ~has_609,
+                is_type2,
+            ],
+            [
+                total // 3,
+                (len_508 - len_1016) // 3 + len_1016,
+                len_1016 + (len_508 // 2),
+                len_1016,
+                len_609,
+                len_914,
+                np.maximum(len_609, len_914),
+            ],
+            default=total,
+        )
+
+        # 조합분류 3: 762mm 2개 조합 (실수 나눗셈)
+        is_type3 = comb_types == 3
+        if is_type3.any():
+            production_length = production_length.astype(np.float64)
+            production_length[is_type3] = total[is_type3] / 2
+
+        for i in np.flatnonzero(is_type2):
+            if not has_914[i]:
+                print("원단 길이에 맞는 914mm의 주문이 없어서 609mm 단독처리")
+            elif not has_609[i]:
+                print("원단 길이에 맞는 609mm의 주문이 없어서 914mm 단독처리")
+
+        return fabric_width, production_length
+
 
 
 class FabricCombiner:
@@ -140,6 +224,8 @@ class FabricCombiner:
         groupby 기준 컬럼명 리스트 (default: ['GITEM', '공정', '공정순서', '조합분류'])
     param: dropna : bool
         groupby에서 NA(결측치)도 그룹으로 포함할지 여부 (pandas groupby dropna 옵션, default: False)
+    param: sort : bool
+        결과를 그룹 키 정렬 순서로 반환할지 여부. False면 그룹 첫 등장 순서 (pandas groupby sort 옵션, default: True)
 
     Notes
     -----
@@ -149,10 +235,11 @@ class FabricCombiner:
       ['P/O NO', 'GITEM', '공정', '공정순서', '조합분류', '납기일', '원단너비', '생산길이']
     
     """
-    def __init__(self, groupby_cols=None, dropna=False):
+    def __init__(self, groupby_cols=None, dropna=False, sort=True):
         self.rule_handler = FabricRuleHandler()
         self.groupby_cols = groupby_cols or [config.columns.GITEM, config.columns.OPERATION_CODE, config.columns.OPERATION_ORDER, config.columns.COMBINATION_CLASSIFICATION]
         self.dropna = dropna  # groupby에서 NA 그룹 포함 여부 
+        self.sort = sort  # 그룹 정렬 여부 (False: 첫 등장 순서)
 
     def process(self, input_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -166,34 +253,66 @@ class FabricCombiner:
     def _add_combination_type(self, df: pd.DataFrame) -> pd.DataFrame:
         """조합분류 컬럼 추가 (너비 기준)"""
         df = df.copy()
-        df[config.columns.COMBINATION_CLASSIFICATION] = df[config.columns.WIDTH].apply(self.rule_handler.classify_width)
+        df[config.columns.COMBINATION_CLASSIFICATION] = self.rule_handler.classify_widths(df[config.columns.WIDTH])
         return df 
 
     def _process_groups(self, df: pd.DataFrame) -> pd.DataFrame:
-        """그룹별로 assign_fabric_quantity 실행"""
-        return (
-            df.groupby(self.groupby_cols, group_keys=True, as_index=False, dropna=self.dropna)
-              .apply(self._assign_fabric_quantity)
-              .reset_index(drop=True)
+        """
+        그룹별 폭조합 결과 계산 (벡터 연산)
+
+        그룹별 너비 분류 합계를 한 번의 집계로 구한 뒤 조합분류 규칙을 컬럼 단위로 적용합니다.
+        결과 행 순서는 groupby 그룹 순서(sort 옵션)와 같습니다.
+        """
+        result_columns = [
+            config.columns.PO_NO, config.columns.GITEM, config.columns.OPERATION_CODE, config.columns.OPERATION_ORDER,
+            config.columns.COMBINATION_CLASSIFICATION, config.columns.DUE_DATE, config.columns.FABRIC_WIDTH,
+            config.columns.PRODUCTION_LENGTH, config.columns.CHEMICAL_LIST,
+        ]
+
+        group_ids = df.groupby(self.groupby_cols, sort=self.sort, dropna=self.dropna).ngroup()
+        in_group = group_ids.notna().to_numpy()
+        df = df[in_group].reset_index(drop=True)
+        group_ids = group_ids[in_group].to_numpy(dtype=np.int64)
+        if df.empty:
+            return pd.DataFrame(columns=result_columns)
+
+        # 그룹 대표 행 (각 그룹 첫 행)
+        _, first_pos = np.unique(group_ids, return_index=True)
+        first_rows = df.iloc[first_pos].reset_index(drop=True)
+
+        # 너비 분류별 생산길이 합계 / 행 수 (한 번의 pivot)
+        width_labels = [*self.rule_handler.WIDTH_CLASSES, 'other']
+        widths = df[config.columns.WIDTH].to_numpy()
+        width_class = np.full(len(df), len(width_labels) - 1, dtype=np.int64)
+        for i, width in enumerate(self.rule_handler.WIDTH_CLASSES):
+            width_class[widths == width] = i
+        pivot = (
+            df[config.columns.PRODUCTION_LENGTH]
+            .groupby([group_ids, width_class])
+            .agg(['sum', 'size'])
+            .unstack(fill_value=0)
+            .reindex(columns=pd.MultiIndex.from_product([['sum', 'size'], range(len(width_labels))]), fill_value=0)
+        )
+        width_sums = pivot['sum'].set_axis(width_labels, axis=1)
+        width_counts = pivot['size'].set_axis(width_labels, axis=1)
+        fabric_width, production_length = self.rule_handler.apply_rules(
+            first_rows[config.columns.COMBINATION_CLASSIFICATION].to_numpy(), width_sums, width_counts
         )
 
-    def _assign_fabric_quantity(self, sub_df: pd.DataFrame) -> pd.DataFrame:
-        comb_type = sub_df[config.columns.COMBINATION_CLASSIFICATION].iloc[0]
-        handler = self.rule_handler.get_handler(comb_type) 
-        if not handler:
-            raise ValueError(f"Invalid combination type: {comb_type}")
-        result = handler(sub_df)
-
-
-        return pd.DataFrame([{
-            config.columns.PO_NO: ', '.join(map(str, sub_df[config.columns.PO_NO].explode().unique())),
-            config.columns.GITEM: sub_df[config.columns.GITEM].iloc[0],
-            config.columns.OPERATION_CODE: sub_df[config.columns.OPERATION_CODE].iloc[0],
-            config.columns.OPERATION_ORDER: sub_df[config.columns.OPERATION_ORDER].iloc[0],
-            config.columns.COMBINATION_CLASSIFICATION: comb_type,
-            config.columns.DUE_DATE: sub_df[config.columns.DUE_DATE].min(),
-            config.columns.FABRIC_WIDTH: result['fabric_width'],
-            config.columns.PRODUCTION_LENGTH: result['production_length'],
-            config.columns.CHEMICAL_LIST: sub_df[config.columns.CHEMICAL_LIST].iloc[0],
+        # P/O 목록: 그룹 내 등장 순서대로 중복 제거 후 결합
+        po_numbers = pd.DataFrame({'group': group_ids, 'po': df[config.columns.PO_NO].to_numpy()}).explode('po')
+        po_numbers = po_numbers.drop_duplicates(subset=['group', 'po'])
+        po_joined = po_numbers['po'].map(str).groupby(po_numbers['group']).agg(', '.join)
+
+        return pd.DataFrame({
+            config.columns.PO_NO: po_joined.to_numpy(),
+            config.columns.GITEM: first_rows[config.columns.GITEM],
+            config.columns.OPERATION_CODE: first_rows[config.columns.OPERATION_CODE],
+            config.columns.OPERATION_ORDER: first_rows[config.columns.OPERATION_ORDER],
+            config.columns.COMBINATION_CLASSIFICATION: first_rows[config.columns.COMBINATION_CLASSIFICATION],
+            config.columns.DUE_DATE: df[config.columns.DUE_DATE].groupby(group_ids).min().to_numpy(),
+            config.columns.FABRIC_WIDTH: fabric_width,
+            config.columns.PRODUCTION_LENGTH: production_length,
+            config.columns.CHEMICAL_LIST: first_rows[config.columns.CHEMICAL_LIST],
             #'MIDDLE (점착제)': middle_value  # 항상 포함
-        }])
+        })
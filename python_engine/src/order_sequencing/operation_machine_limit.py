@@ -40,6 +40,30 @@ def operation_machine_limit(linespeed, local_machine_limit, global_machine_limit
     return linespeed, unable_gitems, unable_details
 
 
+def _gitem_proccode_codes(linespeed):
+    """
+    (gitemno, proccode) 그룹 정수 코드 계산
+
+    Returns:
+        codes (np.ndarray): 행별 그룹 코드 (gitemno/proccode 결측 시 -1)
+        n_groups (int): 그룹 수
+    """
+    gitem_codes, _ = pd.factorize(linespeed[config.columns.GITEM])
+    proc_codes, proc_uniques = pd.factorize(linespeed[config.columns.OPERATION_CODE])
+    missing = (gitem_codes < 0) | (proc_codes < 0)
+    pair_codes = gitem_codes.astype(np.int64) * max(len(proc_uniques), 1) + proc_codes
+    uniques, compact = np.unique(pair_codes[~missing], return_inverse=True)
+    codes = np.full(len(linespeed), -1, dtype=np.int64)
+    codes[~missing] = compact
+    return codes, len(uniques)
+
+
+def _group_sum(codes, mask, n_groups):
+    """그룹 코드별 mask 개수 (코드 -1 제외)"""
+    selected = codes[mask & (codes >= 0)]
+    return np.bincount(selected, minlength=n_groups)
+
+
 def apply_local_machine_limit(linespeed, local_machine_limit):
     """
     Local 제약조건 적용: 특정 공정에서 특정 기계 제외
@@ -54,6 +78,10 @@ def apply_local_machine_limit(linespeed, local_machine_limit):
 
     안전성:
         - 제거 후 해당 (gitemno, proccode)가 모든 기계 불가능이 되면 제거 취소
+
+    처리 방식:
+        - 같은 공정의 제약조건은 입력 순서대로 적용되어야 하므로, 공정별 n번째 제약조건끼리 한 라운드로 묶음
+        - 라운드마다 (gitemno, proccode)별 제거 후 남는 유효 기계 수를 계산하고 안전한 행만 일괄 제거
     """
 
     # 1. 제약조건 정제
@@ -64,7 +92,7 @@ def apply_local_machine_limit(linespeed, local_machine_limit):
 
     constraints = local_machine_limit[
         [config.columns.OPERATION_CODE, config.columns.MACHINE_CODE]
-    ].dropna().drop_duplicates()
+    ].dropna().drop_duplicates().reset_index(drop=True)
 
     if constraints.empty:
         print("[Local 제약] 제약조건 없음")
@@ -72,52 +100,59 @@ def apply_local_machine_limit(linespeed, local_machine_limit):
 
     print(f"[Local 제약] {len(constraints)}개 제약조건 처리 중...")
 
-    # 2. 각 제약조건별로 처리
-    total_removed = 0
-    for _, row in constraints.iterrows():
-        proccode = row[config.columns.OPERATION_CODE]
-        machineno = row[config.columns.MACHINE_CODE]
-
-        # 제거 후보 마스크
-        drop_mask = (
-            (linespeed[config.columns.OPERATION_CODE] == proccode) &
-            (linespeed[config.columns.MACHINE_CODE] == machineno)
+    # 2. (gitemno, proccode) 그룹별 유효 기계 수
+    codes, n_groups = _gitem_proccode_codes(linespeed)
+    valid = (linespeed['linespeed'] > 0).to_numpy()
+    alive = np.ones(len(linespeed), dtype=bool)
+    valid_remaining = _group_sum(codes, valid, n_groups)
+
+    row_pairs = pd.MultiIndex.from_arrays([
+        linespeed[config.columns.OPERATION_CODE], linespeed[config.columns.MACHINE_CODE]
+    ])
+    matched_counts = np.zeros(len(constraints), dtype=np.int64)
+    removed_counts = np.zeros(len(constraints), dtype=np.int64)
+
+    # 3. 라운드별 처리 (라운드 내 제약조건은 서로 다른 공정 → 독립)
+    rounds = constraints.groupby(config.columns.OPERATION_CODE, sort=False).cumcount().to_numpy()
+    for round_no in range(rounds.max() + 1):
+        round_idx = np.flatnonzero(rounds == round_no)
+        round_pairs = pd.MultiIndex.from_frame(
+            constraints.loc[round_idx, [config.columns.OPERATION_CODE, config.columns.MACHINE_CODE]]
         )
+        position = round_pairs.get_indexer(row_pairs)
 
+        # 제거 후보
+        drop_mask = alive & (position >= 0)
         if not drop_mask.any():
             continue
 
-        # 안전성 검사: 이 제약조건을 적용했을 때 생산 불가능해지는 GITEM이 있는지
-        affected_gitems = linespeed.loc[drop_mask, config.columns.GITEM].unique()
+        # 안전성 검사: 제거 후 (gitemno, proccode)에 유효 기계가 최소 1개 남는지
+        has_candidate = _group_sum(codes, drop_mask, n_groups) > 0
+        removed_valid = _group_sum(codes, drop_mask & valid, n_groups)
+        safe_groups = has_candidate & (valid_remaining - removed_valid > 0)
 
-        safe_to_drop = []
-        for gitem in affected_gitems:
-            # 해당 gitem + proccode의 모든 행
-            gitem_proc_mask = (
-                (linespeed[config.columns.GITEM] == gitem) &
-                (linespeed[config.columns.OPERATION_CODE] == proccode)
-            )
+        final_drop_mask = drop_mask & (codes >= 0) & safe_groups[np.maximum(codes, 0)]
+        alive &= ~final_drop_mask
+        valid_remaining -= np.where(safe_groups, removed_valid, 0)
 
-            # 제거 후 남는 유효한 행 (linespeed > 0)
-            remaining_after_drop = linespeed.loc[
-                gitem_proc_mask & ~drop_mask &
-                (linespeed['linespeed'] > 0)
-            ]
-
-            # 최소 1개 기계가 남으면 안전
-            if len(remaining_after_drop) > 0:
-                safe_to_drop.append(gitem)
+        matched_counts[round_idx] = np.bincount(position[drop_mask], minlength=len(round_idx))
+        removed_counts[round_idx] = np.bincount(position[final_drop_mask], minlength=len(round_idx))
 
-        # 안전한 gitem에 대해서만 제거
-        if safe_to_drop:
-            final_drop_mask = drop_mask & linespeed[config.columns.GITEM].isin(safe_to_drop)
-            removed_count = final_drop_mask.sum()
-            linespeed = linespeed[~final_drop_mask].reset_index(drop=True)
-            total_removed += removed_count
-            print(f"[Local 제약] 공정 {proccode}, 기계 {machineno}: {removed_count}개 행 제거")
+    # 4. 제약조건 순서대로 결과 출력
+    for i, row in constraints.iterrows():
+        if matched_counts[i] == 0:
+            continue
+        proccode = row[config.columns.OPERATION_CODE]
+        machineno = row[config.columns.MACHINE_CODE]
+        if removed_counts[i] > 0:
+            print(f"[Local 제약] 공정 {proccode}, 기계 {machineno}: {removed_counts[i]}개 행 제거")
         else:
             print(f"[Local 제약] 공정 {proccode}, 기계 {machineno}: 제거 불가 (생산 불가능 위험)")
 
+    total_removed = int(removed_counts.sum())
+    if total_removed > 0:
+        linespeed = linespeed[alive].reset_index(drop=True)
+
     print(f"[Local 제약] 완료: 총 {total_removed}개 행 제거")
     return linespeed
 
@@ -155,66 +190,32 @@ def apply_global_machine_limit(linespeed, global_machine_limit):
     print(f"[Global 제약] {len(constraints)}개 제약조건 처리 중...")
 
     # 3. Long Format에서 직접 매칭 및 제거
-    # (gitemno, proccode, machineno) 조합 생성
-    linespeed['__KEY__'] = (
-        linespeed[config.columns.GITEM].astype(str) + '|' +
-        linespeed[config.columns.OPERATION_CODE].astype(str) + '|' +
-        linespeed[config.columns.MACHINE_CODE].astype(str)
-    )
-
-    constraints['__KEY__'] = (
-        constraints[config.columns.GITEM].astype(str) + '|' +
-        constraints[config.columns.OPERATION_CODE].astype(str) + '|' +
-        constraints[config.columns.MACHINE_CODE].astype(str)
-    )
-
-    blacklist_keys = set(constraints['__KEY__'].unique())
+    # (gitemno, proccode, machineno) 조합을 문자열 기준으로 매칭
+    key_cols = [config.columns.GITEM, config.columns.OPERATION_CODE, config.columns.MACHINE_CODE]
+    blacklist_keys = pd.MultiIndex.from_frame(constraints[key_cols].astype(str)).unique()
 
     # 제거 후보 마스크
-    drop_mask = linespeed['__KEY__'].isin(blacklist_keys)
+    drop_mask = pd.MultiIndex.from_frame(linespeed[key_cols].astype(str)).isin(blacklist_keys)
 
     # 4. 안전성 검사: 제거 후 생산 불가능해지는 (gitemno, proccode) 조합 확인
     total_removed = 0
     if drop_mask.any():
-        affected_keys = linespeed.loc[drop_mask, [config.columns.GITEM, config.columns.OPERATION_CODE]].drop_duplicates()
-
-        safe_to_drop = []
-        for _, row in affected_keys.iterrows():
-            gitem = row[config.columns.GITEM]
-            proccode = row[config.columns.OPERATION_CODE]
+        codes, n_groups = _gitem_proccode_codes(linespeed)
+        valid = (linespeed['linespeed'] > 0).to_numpy()
 
-            # 해당 (gitem, proccode)의 모든 행
-            gitem_proc_mask = (
-                (linespeed[config.columns.GITEM] == gitem) &
-                (linespeed[config.columns.OPERATION_CODE] == proccode)
-            )
-
-            # 제거 후 남는 유효한 행 (linespeed > 0)
-            remaining_after_drop = linespeed.loc[
-                gitem_proc_mask & ~drop_mask &
-                (linespeed['linespeed'] > 0)
-            ]
-
-            # 최소 1개 기계가 남으면 안전
-            if len(remaining_after_drop) > 0:
-                safe_to_drop.append((gitem, proccode))
+        # (gitemno, proccode)별 제거 후 남는 유효 기계 수 → 최소 1개 남으면 안전
+        affected_groups = _group_sum(codes, drop_mask, n_groups) > 0
+        safe_groups = affected_groups & (_group_sum(codes, valid & ~drop_mask, n_groups) > 0)
 
         # 안전한 항목에 대해서만 제거
-        if safe_to_drop:
-            safe_gitem_proccode = set(safe_to_drop)
-            final_drop_mask = drop_mask & linespeed.apply(
-                lambda row: (row[config.columns.GITEM], row[config.columns.OPERATION_CODE]) in safe_gitem_proccode,
-                axis=1
-            )
+        if safe_groups.any():
+            final_drop_mask = drop_mask & (codes >= 0) & safe_groups[np.maximum(codes, 0)]
             total_removed = final_drop_mask.sum()
             linespeed = linespeed[~final_drop_mask].reset_index(drop=True)
-            print(f"[Global 제약] {len(blacklist_keys)}개 조합 중 {total_removed}개 행 제거, {len(safe_to_drop)}개 (gitem, 공정) 영향")
+            print(f"[Global 제약] {len(blacklist_keys)}개 조합 중 {total_removed}개 행 제거, {safe_groups.sum()}개 (gitem, 공정) 영향")
         else:
             print(f"[Global 제약] 제거 불가 (모든 항목이 생산 불가능 위험)")
 
-    # 5. 임시 컬럼 제거
-    linespeed = linespeed.drop(columns=['__KEY__'])
-
     print(f"[Global 제약] 완료: 총 {total_removed}개 행 제거")
     return linespeed
 
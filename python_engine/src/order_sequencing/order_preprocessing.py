@@ -1,5 +1,8 @@
 from config import config
 
+# 납기 월 그룹 키 (단일 패스 처리용 임시 컬럼)
+DUE_MONTH_KEY = '__DUE_MONTH__'
+
 def seperate_order_by_month(order):
     return [group for _, group in order.groupby(order[config.columns.DUE_DATE].dt.month)]
 
@@ -20,4 +23,16 @@ def same_order_groupby(grouby_condition_list, df):
         config.columns.DUE_DATE: 'min',
         config.columns.PO_NO: lambda x: list(x)
     })
-    return df
\ No newline at end of file
+    return df
+
+
+def same_order_groupby_by_month(grouby_condition_list, order):
+    """
+    납기 월을 그룹 키로 포함한 same_order_groupby
+
+    seperate_order_by_month 후 월별 same_order_groupby 결과를 이어붙인 것과 동일한 결과를
+    월별 반복 없이 한 번의 groupby로 생성한다. (납기일 결측 주문은 제외, 월 키는 DUE_MONTH_KEY 컬럼)
+    """
+    order = order[order[config.columns.DUE_DATE].notna()]
+    order = order.assign(**{DUE_MONTH_KEY: order[config.columns.DUE_DATE].dt.month})
+    return same_order_groupby([DUE_MONTH_KEY] + list(grouby_condition_list), order)
@@ -1,61 +1,83 @@
 from config import config
 from .fabric_combiner import FabricRuleHandler, FabricCombiner
+import numpy as np
 import pandas as pd
 
-def process_operations_by_category(merged_df):
+def process_operations_by_category(merged_df, partition_cols=None):
     """
     병합된 DataFrame(merged_df)을 받아서, 세부유형/공정/배합코드 기준으로 
     FabricCombiner를 적용하고 결과 리스트를 반환한다.
+
+    (GITEM, 공정) 슬라이스별 반복 대신 전체를 한 번에 조합하며, 결과는
+    파티션 등장 순서 → GITEM 등장 순서 → GITEM 내 공정 등장 순서 → 배합코드/조합분류 순으로 정렬된다.
+
+    Args:
+        merged_df (pd.DataFrame): 주문-공정 병합 데이터
+        partition_cols (list, optional): 추가 그룹 키 (예: 납기 월). 파티션별로 따로 처리한 결과를 이어붙인 것과 동일
     """
-    results = []
-
-    for gitem in merged_df[config.columns.GITEM].dropna().unique():
-        category_df = merged_df[merged_df[config.columns.GITEM] == gitem]
-
-        for operation in category_df[config.columns.OPERATION_CODE].dropna().unique():
-            opslice = category_df[category_df[config.columns.OPERATION_CODE] == operation]
-
-            # 배합코드 유무에 따라 분리
-            nan_bh = opslice[opslice[config.columns.CHEMICAL_LIST].isna()]
-            notnan_bh = opslice[~opslice[config.columns.CHEMICAL_LIST].isna()]
-
-            # 배합코드가 존재하는 경우
-            if not notnan_bh.empty:
-                groupby_col = [config.columns.GITEM, config.columns.OPERATION_CODE, config.columns.CHEMICAL_LIST, config.columns.COMBINATION_CLASSIFICATION]
-                combiner = FabricCombiner(groupby_col)
-                
-                
-                paired_order = combiner.process(notnan_bh)
-
-                if not paired_order.empty:
-                    # PRODUCT_ID와 PROCESS_ID를 한 번에 생성 (월 포함)
-                    # paired_order에 이미 DUE_DATE가 있으므로 처음부터 월 정보 포함
-
-                    # PRODUCT_ID 생성 (월 포함)
-                    paired_order[config.columns.PRODUCT_ID] = (
-                        str(gitem) + "_" +
-                        paired_order[config.columns.FABRIC_WIDTH].round().astype(int).astype(str) + "_" +
-                        paired_order[config.columns.COMBINATION_CLASSIFICATION].astype(str) + "_M" +
-                        paired_order[config.columns.DUE_DATE].dt.month.astype(str)
-                    )
-
-                    # PROCESS_ID 생성 (PRODUCT_ID 기반)
-                    paired_order[config.columns.PROCESS_ID] = (
-                        paired_order[config.columns.PRODUCT_ID] + "_" +
-                        paired_order[config.columns.OPERATION_CODE].astype(str) + "_" +
-                        paired_order[config.columns.CHEMICAL_LIST].astype(str)
-                    )
-
-                    results.append(paired_order)
-
-            if not nan_bh.empty:
-                print(f"[{gitem}/{operation}] 배합코드 미존재 행 존재!!!!")
-
-    if results:
-        return pd.concat(results, ignore_index=True)
+    partition_cols = list(partition_cols or [])
+    gitem_cols = partition_cols + [config.columns.GITEM]
+    pair_cols = gitem_cols + [config.columns.OPERATION_CODE]
+
+    gitem_rows = merged_df[merged_df[config.columns.GITEM].notna()]
+    target = gitem_rows[gitem_rows[config.columns.OPERATION_CODE].notna()]
+    if target.empty:
+        return pd.DataFrame()
+
+    # 파티션 / GITEM / (GITEM, 공정) 등장 순서 (GITEM 순서는 공정 결측 행까지 포함한 등장 순서)
+    if partition_cols:
+        partition_order = pd.MultiIndex.from_frame(gitem_rows[partition_cols]).unique()
+        partition_rank = partition_order.get_indexer(pd.MultiIndex.from_frame(target[partition_cols]))
     else:
+        partition_rank = np.zeros(len(target), dtype=np.int64)
+    gitem_order = pd.MultiIndex.from_frame(gitem_rows[gitem_cols]).unique()
+    gitem_rank = gitem_order.get_indexer(pd.MultiIndex.from_frame(target[gitem_cols]))
+    pair_rank, pair_uniques = pd.factorize(pd.MultiIndex.from_frame(target[pair_cols]))
+
+    # 배합코드 미존재 행이 있는 (GITEM, 공정)
+    chemical_missing = target[config.columns.CHEMICAL_LIST].isna().to_numpy()
+    missing_rows = np.flatnonzero(chemical_missing)
+    missing_rows = missing_rows[np.lexsort((pair_rank[missing_rows], gitem_rank[missing_rows], partition_rank[missing_rows]))]
+    for rank in pd.unique(pair_rank[missing_rows]):
+        *_, gitem, operation = pair_uniques[rank]
+        print(f"[{gitem}/{operation}] 배합코드 미존재 행 존재!!!!")
+
+    # 배합코드가 존재하는 경우
+    notnan_bh = target[~chemical_missing]
+    if notnan_bh.empty:
         return pd.DataFrame()
-        
+
+    # 슬라이스별 처리 순서로 행 정렬 (슬라이스 내부는 배합코드, 조합분류 정렬 순서)
+    keep = ~chemical_missing
+    chemical_codes, _ = pd.factorize(notnan_bh[config.columns.CHEMICAL_LIST], sort=True)
+    comb_types = FabricRuleHandler.classify_widths(notnan_bh[config.columns.WIDTH])
+    row_order = np.lexsort((comb_types, chemical_codes, pair_rank[keep], gitem_rank[keep], partition_rank[keep]))
+    notnan_bh = notnan_bh.iloc[row_order]
+
+    groupby_col = partition_cols + [config.columns.GITEM, config.columns.OPERATION_CODE, config.columns.CHEMICAL_LIST, config.columns.COMBINATION_CLASSIFICATION]
+    combiner = FabricCombiner(groupby_col, sort=False)
+    paired_order = combiner.process(notnan_bh)
+
+    # PRODUCT_ID와 PROCESS_ID를 한 번에 생성 (월 포함)
+    # paired_order에 이미 DUE_DATE가 있으므로 처음부터 월 정보 포함
+
+    # PRODUCT_ID 생성 (월 포함)
+    paired_order[config.columns.PRODUCT_ID] = (
+        paired_order[config.columns.GITEM].astype(str) + "_" +
+        paired_order[config.columns.FABRIC_WIDTH].round().astype(int).astype(str) + "_" +
+        paired_order[config.columns.COMBINATION_CLASSIFICATION].astype(str) + "_M" +
+        paired_order[config.columns.DUE_DATE].dt.month.astype(str)
+    )
+
+    # PROCESS_ID 생성 (PRODUCT_ID 기반)
+    paired_order[config.columns.PROCESS_ID] = (
+        paired_order[config.columns.PRODUCT_ID] + "_" +
+        paired_order[config.columns.OPERATION_CODE].astype(str) + "_" +
+        paired_order[config.columns.CHEMICAL_LIST].astype(str)
+    )
+
+    return paired_order
+
 def create_sequence_seperated_order(order_list, operation_seperated_sequence):
     sequence_seperated_order_list = []
     
@@ -77,4 +99,27 @@ def create_sequence_seperated_order(order_list, operation_seperated_sequence):
     sequence_seperated_order[config.columns.OPERATION_ORDER] = sequence_seperated_order[config.columns.OPERATION_ORDER].astype(int)
 
     return sequence_seperated_order
-    
\ No newline at end of file
+    
+def create_sequence_seperated_order_single_pass(order_df, operation_seperated_sequence, partition_cols):
+    """
+    파티션(납기 월 등) 키를 그룹 키로 사용해 create_sequence_seperated_order를 한 번에 처리
+
+    Args:
+        order_df (pd.DataFrame): partition_cols 컬럼을 포함한 병합 주문 데이터
+        operation_seperated_sequence (pd.DataFrame): GITEM별 공정 순서 데이터
+        partition_cols (list): 파티션 키 컬럼 (결과에는 포함되지 않음)
+
+    Returns:
+        pd.DataFrame: 파티션별 결과를 파티션 순서대로 이어붙인 것과 동일한 시퀀스 주문
+    """
+    merged = pd.merge(order_df, operation_seperated_sequence, on=[config.columns.GITEM], how='left')
+    merged = merged.rename(columns={config.columns.FABRIC_LENGTH: config.columns.PRODUCTION_LENGTH})
+
+    sequence_seperated_order = process_operations_by_category(merged, partition_cols=partition_cols)
+    if sequence_seperated_order.empty:
+        raise ValueError("생성된 시퀀스 주문이 없습니다.")
+
+    # OPERATION_ORDER 타입 변환만 유지
+    sequence_seperated_order[config.columns.OPERATION_ORDER] = sequence_seperated_order[config.columns.OPERATION_ORDER].astype(int)
+
+    return sequence_seperated_order
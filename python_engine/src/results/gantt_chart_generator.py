@@ -7,6 +7,45 @@ import os
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Patch
+from config import config
+
+
+def _merge_subpixel_bars(starts, ends, color_index, min_width):
+    """
+    min_width보다 좁고 서로 min_width 이내로 붙어 있는 연속 작업들을 하나의 바로 병합
+
+    병합된 바의 색상은 구간 내 가장 긴 작업의 색상을 사용합니다.
+    min_width 이상인 작업은 그대로 유지됩니다.
+
+    Args:
+        starts, ends (np.ndarray): 작업 시작/종료 시간
+        color_index (np.ndarray): 작업별 색상 인덱스
+        min_width (float): 병합 기준 폭 (시간 슬롯 단위)
+
+    Returns:
+        tuple: (starts, ends, color_index) 병합 결과
+    """
+    order = np.argsort(starts, kind='stable')
+    starts, ends, color_index = starts[order], ends[order], color_index[order]
+    widths = ends - starts
+    small = widths < min_width
+
+    # 이전 작업과 같은 구간으로 묶을지 여부: 둘 다 좁고 사이 간격도 좁은 경우
+    joined = np.zeros(len(starts), dtype=bool)
+    joined[1:] = small[1:] & small[:-1] & (starts[1:] - ends[:-1] < min_width)
+    run_starts = np.flatnonzero(~joined)
+    run_id = np.cumsum(~joined) - 1
+
+    # 구간별 가장 긴 작업의 색상
+    widest = np.lexsort((-widths, run_id))
+    first_in_run = np.ones(len(widest), dtype=bool)
+    first_in_run[1:] = run_id[widest][1:] != run_id[widest][:-1]
+
+    return (
+        starts[run_starts],
+        np.maximum.reduceat(ends, run_starts),
+        color_index[widest[first_in_run]]
+    )
 
 
 class DrawChart:
@@ -18,7 +57,23 @@ class DrawChart:
         self.fig = None
         self.ax = None
 
-    def plot(self, figsize=(15, 8), fontsize=6, major_interval=48, minor_interval=24, dpi=300, show_gaps=True, save_path='data/output/level4_gantt.png'):
+    def plot(self, figsize=(15, 8), fontsize=6, major_interval=48, minor_interval=24, dpi=None, show_gaps=True,
+             save_path='data/output/level4_gantt.png', lod=False, lod_pixel_width=1.0):
+        """
+        간트차트 그리기 및 저장
+
+        기계별 작업 바를 broken_barh 한 번으로 그립니다 (작업 수만큼 barh를 호출하지 않음).
+
+        Args:
+            figsize (tuple): 그림 크기 (인치)
+            dpi (int, optional): 저장 해상도 (기본: config.constants.GANTT_DPI)
+            lod (bool): True면 저장 해상도에서 lod_pixel_width 픽셀보다 좁은 연속 작업들을
+                하나의 바로 합쳐서 그림 (작업 수가 매우 많은 스케줄용)
+            lod_pixel_width (float): lod 모드의 병합 기준 폭 (픽셀)
+        """
+        if dpi is None:
+            dpi = config.constants.GANTT_DPI
+
         self.fig, self.ax = plt.subplots(figsize=figsize)
 
         # 모든 작업의 depth 추출 및 정렬
@@ -27,16 +82,30 @@ class DrawChart:
         cmap = plt.get_cmap('tab20')
         # depth별 색상 동적 할당 (depth 종류 > 20이면 순환)
         depth_to_color = {depth: cmap(i % cmap.N) for i, depth in enumerate(unique_depths)}
+        depth_to_index = {depth: i for i, depth in enumerate(unique_depths)}
+        palette = [depth_to_color[depth] for depth in unique_depths]
 
-        # 작업 바 그리기
+        # LOD 병합 기준 폭 (시간 슬롯 단위): 저장 해상도에서 lod_pixel_width 픽셀에 해당하는 시간
+        min_width = self._pixel_width_in_slots(figsize, dpi, lod_pixel_width) if lod else None
+
+        # 작업 바 그리기 (기계당 broken_barh 1회)
         # ★ 딕셔너리 순회로 변경
         for i, (machine_code, machine) in enumerate(self.Machines.items()):
-            for (start, end), job_info in zip(zip(machine.O_start, machine.O_end), machine.assigned_task):
-                depth = job_info[0]
-                color = depth_to_color[depth]
-                self.ax.barh(i, width=end-start, left=start, height=0.7, color=color,
-                             edgecolor='black', linewidth=0.5)
-        
+            if len(machine.assigned_task) == 0:
+                continue
+            starts = np.asarray(machine.O_start, dtype=float)
+            ends = np.asarray(machine.O_end, dtype=float)
+            color_index = np.array([depth_to_index[job[0]] for job in machine.assigned_task])
+
+            if min_width:
+                starts, ends, color_index = _merge_subpixel_bars(starts, ends, color_index, min_width)
+
+            self.ax.broken_barh(
+                list(zip(starts, ends - starts)), (i - 0.35, 0.7),
+                facecolors=[palette[c] for c in color_index],
+                edgecolor='black', linewidth=0.5
+            )
+
         # 간격 분석 및 표시
         if show_gaps and self.gap_analyzer:
             self._draw_gaps()
@@ -64,6 +133,18 @@ class DrawChart:
         # plt.show() 제거 - 비대화형 백엔드에서는 경고 발생
         
         return self.fig
+
+    def _pixel_width_in_slots(self, figsize, dpi, pixel_width):
+        """저장 해상도에서 pixel_width 픽셀에 해당하는 시간 슬롯 폭"""
+        time_span = max(
+            (max(machine.O_end) for machine in self.Machines.values() if len(machine.O_end) > 0),
+            default=0
+        )
+        # 축 영역 폭 = 그림 폭 × subplot 좌우 여백 비율
+        axes_width_px = figsize[0] * dpi * (self.fig.subplotpars.right - self.fig.subplotpars.left)
+        if time_span <= 0 or axes_width_px <= 0:
+            return None
+        return time_span / axes_width_px * pixel_width
     
     def _draw_gaps(self):
         """
@@ -116,7 +197,8 @@ class DrawChart:
 class GanttChartGenerator:
     """간트차트 생성 및 저장 관리"""
     
-    def generate(self, machines, gap_analyzer=None, save_path="data/output/level4_gantt.png"):
+    def generate(self, machines, gap_analyzer=None, save_path="data/output/level4_gantt.png",
+                 dpi=None, figsize=(15, 8), lod=False):
         """
         간트차트 생성 파이프라인 실행
         
@@ -124,6 +206,9 @@ class GanttChartGenerator:
             machines: 스케줄러의 기계 목록 (scheduler.Machines)
             gap_analyzer: 간격 분석기 (선택적)
             save_path (str): 저장 경로
+            dpi (int, optional): 저장 해상도 (기본: config.constants.GANTT_DPI)
+            figsize (tuple): 그림 크기 (인치)
+            lod (bool): 픽셀보다 좁은 연속 작업 병합 여부 (대규모 스케줄용)
             
         Returns:
             str: 생성된 간트차트 파일 경로 (실패시 None)
@@ -140,9 +225,11 @@ class GanttChartGenerator:
             
             # 직접 저장 경로 지정하여 차트 생성
             fig = gantt.plot(
+                figsize=figsize,
                 show_gaps=True if gap_analyzer else False,
                 save_path=save_path,
-                dpi=300
+                dpi=dpi,
+                lod=lod
             )
             
             plt.close('all')  # 모든 figure 닫기
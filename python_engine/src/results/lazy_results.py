@@ -0,0 +1,312 @@
+"""
+지연 계산(lazy) 결과 모듈 (results 전용)
+
+스케줄러 출력 위에서 각 리포트(성과 지표, 지각 요약, 간격 분석, 호기_정보 등)를
+처음 접근할 때 계산하고 캐시합니다. 직렬화(to_dict)와 파일 저장(CSV, 간트차트)은 명시적으로 호출합니다.
+"""
+
+import threading
+from collections import defaultdict
+from .data_cleaner import DataCleaner
+from .merge_processor import create_process_detail_result
+from .gantt_chart_generator import GanttChartGenerator
+from .machine_info_builder import MachineInfoBuilder
+from .performance_metrics import PerformanceMetricsCalculator
+from .machine_detailed_analyzer import MachineDetailedAnalyzer
+from .order_lateness_reporter import OrderLatenessReporter
+from .simplified_gap_analyzer import SimplifiedGapAnalyzer
+
+
+class LazySchedulingResults:
+    """
+    스케줄링 결과 지연 계산 객체
+
+    KPI만 필요한 호출부는 performance_metrics / lateness_summary만 읽으면 되고,
+    호기_정보나 간트차트 등은 접근(또는 명시적 호출)할 때만 계산됩니다.
+
+    Example:
+        results = LazySchedulingResults(result, original_order, sequence_seperated_order,
+                                        machine_mapper, base_date, scheduler)
+        kpi = results.performance_metrics          # 성과 지표만 계산
+        payload = results.to_dict()                # create_results()와 동일한 딕셔너리
+    """
+
+    def __init__(self, raw_scheduling_result, original_order, sequence_seperated_order,
+                 machine_mapper, base_date, scheduler):
+        """
+        Args:
+            raw_scheduling_result (pd.DataFrame): 스케줄러 원본 결과
+            original_order (pd.DataFrame): 원본 주문 데이터
+            sequence_seperated_order (pd.DataFrame): 공정별 분리 주문
+            machine_mapper (MachineMapper): 기계 정보 매핑 관리 객체
+            base_date (datetime): 기준 날짜
+            scheduler: 스케줄러 인스턴스
+        """
+        self.raw_scheduling_result = raw_scheduling_result
+        self.original_order = original_order
+        self.sequence_seperated_order = sequence_seperated_order
+        self.machine_mapper = machine_mapper
+        self.base_date = base_date
+        self.scheduler = scheduler
+
+        self._cache = {}
+        self._locks = defaultdict(threading.Lock)  # 항목별 잠금 (동시 접근 시 한 번만 계산)
+        self.gantt_filename = None
+
+    def _cached(self, key, builder):
+        """key 항목이 없으면 builder()로 계산 후 캐시"""
+        if key not in self._cache:
+            with self._locks[key]:
+                if key not in self._cache:
+                    self._cache[key] = builder()
+        return self._cache[key]
+
+    def is_computed(self, key):
+        """항목 계산 여부 (예: 'machine_info', 'gap_analysis')"""
+        return key in self._cache
+
+    # ===================================================================
+    # 공통 전처리
+    # ===================================================================
+    @property
+    def cleaned_data(self):
+        """가짜 작업 제거된 결과 + makespan (DataCleaner.clean_scheduling_result)"""
+        def build():
+            print("[86%] 공통 전처리 중...")
+            cleaned = DataCleaner.clean_scheduling_result(self.raw_scheduling_result)
+            print(f"[87%] 전처리 완료 - 실제 makespan: {cleaned['actual_makespan']:.1f}, 전체: {cleaned['total_makespan']:.1f}")
+            return cleaned
+        return self._cached('cleaned_data', build)
+
+    @property
+    def result_cleaned(self):
+        return self.cleaned_data['result_cleaned']
+
+    @property
+    def machine_schedule_df(self):
+        """가짜 작업 제거된 기계 스케줄"""
+        return self._cached('machine_schedule_df', lambda: DataCleaner.clean_machine_schedule(self.scheduler))
+
+    # ===================================================================
+    # 상세 공정 결과 / 호기_정보
+    # ===================================================================
+    @property
+    def process_detail_df(self):
+        """Aging 포함 상세 공정 결과"""
+        def build():
+            print("[87.5%] Aging 포함 상세 공정 결과 생성 중...")
+            return create_process_detail_result(
+                self.result_cleaned,
+                self.sequence_seperated_order,
+                self.scheduler
+            )
+        return self._cached('process_detail_df', build)
+
+    @property
+    def machine_info(self):
+        """호기_정보 (MachineInfoBuilder)"""
+        def build():
+            print("[88%] 호기_정보 생성 중...")
+            machine_builder = MachineInfoBuilder(self.machine_mapper, self.base_date)
+            machine_info = machine_builder.create_complete_machine_info(
+                self.machine_schedule_df,
+                self.process_detail_df,
+                self.original_order
+            )
+            print(f"[89%] 호기_정보 완료 - {len(machine_info)}행")
+            return machine_info
+        return self._cached('machine_info', build)
+
+    # ===================================================================
+    # 간격 분석 / 장비별 상세 성과
+    # ===================================================================
+    @property
+    def gap_analyzer(self):
+        return self._cached('gap_analyzer', lambda: SimplifiedGapAnalyzer(
+            self.scheduler,
+            self.scheduler.delay_processor,
+            self.machine_mapper,
+            self.base_date
+        ))
+
+    @property
+    def gap_analysis(self):
+        """간격_분석 (12개 컬럼)"""
+        def build():
+            print("[90%] 간격 분석 중...")
+            gap_analysis = self.gap_analyzer.analyze_all_gaps()
+            print(f"[90%] 간격 분석 완료 - {len(gap_analysis)}개 간격")
+            return gap_analysis
+        return self._cached('gap_analysis', build)
+
+    @property
+    def machine_detailed_performance(self):
+        """장비별_상세_성과 (MachineDetailedAnalyzer)"""
+        def build():
+            print("[92%] 장비별 상세 성과 분석 중...")
+            machine_analyzer = MachineDetailedAnalyzer(
+                self.scheduler,
+                self.gap_analyzer,
+                self.machine_mapper
+            )
+            machine_detailed_performance = machine_analyzer.create_detailed_table()
+            print(f"[92%] 장비별 상세 성과 완료 - {len(machine_detailed_performance)}개 기계")
+            return machine_detailed_performance
+        return self._cached('machine_detailed_performance', build)
+
+    # ===================================================================
+    # 성과 지표
+    # ===================================================================
+    @property
+    def metrics_calculator(self):
+        return self._cached('metrics_calculator', lambda: PerformanceMetricsCalculator(
+            self.result_cleaned,
+            self.original_order,
+            self.scheduler,
+            self.base_date,
+            self.sequence_seperated_order  # ID-PO_NO 매핑용
+        ))
+
+    @property
+    def performance_summary(self):
+        """스케줄링_성과_지표 테이블"""
+        def build():
+            print("[91%] 스케줄링 성과 지표 계산 중...")
+            performance_summary = self.metrics_calculator.create_summary_table()
+            print(f"[91%] 성과 지표 완료")
+            return performance_summary
+        return self._cached('performance_summary', build)
+
+    @property
+    def metrics_dict(self):
+        """성과 지표 원본 값 (PerformanceMetricsCalculator.get_metrics_dict)"""
+        return self._cached('metrics_dict', lambda: self.metrics_calculator.get_metrics_dict())
+
+    @property
+    def performance_metrics(self):
+        """성과 지표 요약 (JSON 직렬화 가능한 dict)"""
+        metrics_dict = self.metrics_dict
+        return {
+            'po_count': int(metrics_dict['po_count']),
+            'makespan_hours': round(float(metrics_dict['makespan_hours']), 2),
+            'ontime_delivery_rate': round(float(metrics_dict['ontime_delivery_rate']), 2),
+            'late_product_count': int(metrics_dict['late_product_count'])
+        }
+
+    # ===================================================================
+    # 주문 지각 정보
+    # ===================================================================
+    @property
+    def lateness_reporter(self):
+        return self._cached('lateness_reporter', lambda: OrderLatenessReporter(
+            self.result_cleaned,
+            self.original_order,
+            self.base_date,
+            self.sequence_seperated_order  # ID-PO_NO 매핑용
+        ))
+
+    @property
+    def order_lateness_report(self):
+        """주문_지각_정보 테이블"""
+        def build():
+            print("[93%] 주문 지각 정보 생성 중...")
+            order_lateness_report = self.lateness_reporter.create_lateness_table()
+            print(f"[93%] 주문 지각 정보 완료 - {len(order_lateness_report)}개 주문")
+            return order_lateness_report
+        return self._cached('order_lateness_report', build)
+
+    @property
+    def raw_lateness_summary(self):
+        """지각 요약 원본 값 (OrderLatenessReporter.get_lateness_summary)"""
+        return self._cached('raw_lateness_summary', lambda: self.lateness_reporter.get_lateness_summary())
+
+    @property
+    def lateness_summary(self):
+        """지각 요약 (JSON 직렬화 가능한 dict)"""
+        lateness_summary = self.raw_lateness_summary
+        return {
+            'total_orders': int(lateness_summary['total_orders']),
+            'ontime_orders': int(lateness_summary['ontime_orders']),
+            'late_orders': int(lateness_summary['late_orders']),
+            'ontime_rate': round(float(lateness_summary['ontime_rate']), 2),
+            'avg_lateness_days': round(float(lateness_summary['avg_lateness_days']), 2)
+        }
+
+    # ===================================================================
+    # 명시적 생성 / 저장 / 직렬화
+    # ===================================================================
+    def generate_gantt(self, save_path="data/output/level4_gantt.png", dpi=None, figsize=(15, 8), lod=False):
+        """
+        간트차트 생성 (명시적 호출 시에만, 한 번만 생성)
+
+        Args:
+            save_path (str): 저장 경로
+            dpi (int, optional): 저장 해상도 (기본: config.constants.GANTT_DPI)
+            figsize (tuple): 그림 크기 (인치)
+            lod (bool): 픽셀보다 좁은 연속 작업 병합 여부 (대규모 스케줄용)
+
+        Returns:
+            str: 생성된 간트차트 파일 경로 (실패시 None)
+        """
+        def build():
+            print("[95%] 간트차트 생성 중...")
+            gantt_generator = GanttChartGenerator()
+            gantt_filename = gantt_generator.generate(
+                self.scheduler.Machines,
+                gap_analyzer=None,  # SimplifiedGapAnalyzer는 간트차트에서 사용 안 함
+                save_path=save_path,
+                dpi=dpi,
+                figsize=figsize,
+                lod=lod
+            )
+            print(f"[95%] 간트차트 생성 완료 - {gantt_filename}")
+            return gantt_filename
+        self.gantt_filename = self._cached('gantt_filename', build)
+        return self.gantt_filename
+
+    def save_process_detail_csv(self, path="process_detail_df.csv"):
+        """상세 공정 결과 CSV 저장"""
+        self.process_detail_df.to_csv(path, encoding = 'utf-8-sig')
+
+    def save_machine_info_csv(self, path="machine_info.csv"):
+        """호기_정보 CSV 저장"""
+        self.machine_info.to_csv(path, encoding = 'utf-8-sig')
+
+    @property
+    def metadata(self):
+        """메타 정보 (간트차트는 generate_gantt() 호출 전이면 None)"""
+        cleaned_data = self.cleaned_data
+        return {
+            'actual_makespan': float(cleaned_data['actual_makespan']),
+            'total_makespan': float(cleaned_data['total_makespan']),
+            'gantt_filename': self.gantt_filename,
+            'total_nodes': len(self.result_cleaned),
+            'total_machines': len(self.machine_detailed_performance)
+        }
+
+    def to_dict(self):
+        """
+        create_results()와 동일한 형태로 직렬화 (백엔드 API용 JSON 직렬화 가능 형태)
+
+        필요한 리포트는 이 시점에 계산됩니다. 간트차트는 generate_gantt()를 먼저 호출한 경우에만 파일명이 포함됩니다.
+
+        Returns:
+            dict: 5개 테이블 + 메타 정보 + 성과 지표 + 지각 요약
+        """
+        return {
+            # 5개 테이블 (JSON 직렬화 가능한 dict 형태)
+            'machine_info': self.machine_info.to_dict('records'),                          # 호기_정보
+            'performance_summary': self.performance_summary.to_dict('records'),            # 스케줄링_성과_지표
+            'machine_detailed_performance': self.machine_detailed_performance.to_dict('records'),  # 장비별_상세_성과
+            'order_lateness_report': self.order_lateness_report.to_dict('records'),        # 주문_지각_정보
+            'gap_analysis': self.gap_analysis.to_dict('records'),                          # 간격_분석
+
+            # 메타 정보
+            'metadata': self.metadata,
+
+            # 성과 지표 (요약)
+            'performance_metrics': self.performance_metrics,
+
+            # 지각 요약
+            'lateness_summary': self.lateness_summary
+        }
@@ -54,35 +54,28 @@ class MachineDetailedAnalyzer:
 
         return operating_time_minutes
 
-    def extract_gap_times(self, machine_code):
+    def extract_gap_times(self, machine_code, gap_totals=None):
         """
         gap_analyzer에서 특정 기계의 대기시간/셋업시간 추출
 
         Args:
             machine_code (str): 기계 코드 (예: 'A2020', 'C2010')
+            gap_totals (pd.DataFrame, optional): get_gap_totals_by_machine() 결과
+                (여러 기계를 조회할 때 한 번만 가져와 전달, 없으면 여기서 조회)
 
         Returns:
             dict: {'setup_time': float, 'idle_time': float} (분 단위)
         """
-        # SimplifiedGapAnalyzer의 결과 사용
-        gaps_df = self.gap_analyzer.analyze_all_gaps()
+        # SimplifiedGapAnalyzer의 기계별 합계(캐시) 사용
+        if gap_totals is None:
+            gap_totals = self.gap_analyzer.get_gap_totals_by_machine()
 
-        if gaps_df.empty:
+        if machine_code not in gap_totals.index:  # ★ 이미 machine_code이므로 직접 사용
             return {'setup_time': 0.0, 'idle_time': 0.0}
 
-        # 기계 코드로 필터링
-        machine_gaps = gaps_df[gaps_df['기계코드'] == machine_code]  # ★ 이미 machine_code이므로 직접 사용
-
-        if machine_gaps.empty:
-            return {'setup_time': 0.0, 'idle_time': 0.0}
-
-        # 셋업시간 및 대기시간 합계
-        setup_time = machine_gaps['셋업시간(분)'].sum()
-        idle_time = machine_gaps['대기시간(분)'].sum()
-
         return {
-            'setup_time': setup_time,
-            'idle_time': idle_time
+            'setup_time': gap_totals.at[machine_code, '셋업시간(분)'],
+            'idle_time': gap_totals.at[machine_code, '대기시간(분)']
         }
 
     def create_detailed_table(self):
@@ -104,6 +97,8 @@ class MachineDetailedAnalyzer:
             return pd.DataFrame()
 
         rows = []
+        # 기계별 셋업/대기 합계는 루프 밖에서 한 번만 조회 (캐시 검증이 스케줄 전체 크기에 비례)
+        gap_totals = self.gap_analyzer.get_gap_totals_by_machine()
 
         # ★ 딕셔너리 순회로 변경
         for machine_code, machine in self.scheduler.Machines.items():
@@ -113,7 +108,7 @@ class MachineDetailedAnalyzer:
             operating_time = self.calculate_machine_operating_time(machine)
 
             # 대기/셋업시간 추출
-            gap_times = self.extract_gap_times(machine_code)  # ★ machine_code 전달
+            gap_times = self.extract_gap_times(machine_code, gap_totals)  # ★ machine_code 전달
             idle_time = gap_times['idle_time']
             setup_time = gap_times['setup_time']
 
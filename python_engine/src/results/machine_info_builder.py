@@ -87,66 +87,66 @@ class MachineInfoBuilder:
         (MachineScheduleProcessor.machine_info_decorate 로직 기반)
         """
         machine_info = machine_info.copy()
+        process_ids = machine_info[config.columns.PROCESS_ID]
+
+        # PROCESS_ID별 상세 정보를 한 번의 groupby로 집계 (process_detail_df 행 순서 유지)
+        po_lists = self._group_lists(process_detail_df, config.columns.PO_NO)
+        due_dates = process_detail_df[config.columns.DUE_DATE]
+        has_due_date = due_dates.notna()
+        due_date_lists = self._group_lists(
+            process_detail_df[has_due_date], config.columns.DUE_DATE,
+            values=self._format_dates(due_dates[has_due_date])
+        )
 
-        # 각 작업(PROCESS_ID)에 대해 상세 정보 조회
-        po_no_list = []
-        gitem_list = []
-        width_list = []
-        length_list = []
-        chemical_list = []
-        duedate_list = []
-
-        for idx, row in machine_info.iterrows():
-            process_id = row[config.columns.PROCESS_ID]
-
-            # process_detail_df에서 해당 작업 필터링
-            filtered = process_detail_df[
-                process_detail_df[config.columns.PROCESS_ID] == process_id
-            ]
-
-            if filtered.empty:
-                # Aging 노드이거나 매칭 실패
-                po_no_list.append([])
-                gitem_list.append([])
-                width_list.append([])
-                length_list.append([])
-                chemical_list.append([])
-                duedate_list.append([])
-                continue
-
-            # 각 컬럼별로 리스트 추출
-            po_no_list.append(filtered[config.columns.PO_NO].tolist())
-            gitem_list.append(filtered[config.columns.GITEM].tolist())
-            width_list.append(filtered[config.columns.FABRIC_WIDTH].tolist())
-            length_list.append(filtered[config.columns.PRODUCTION_LENGTH].tolist())
-            chemical_list.append(filtered[config.columns.CHEMICAL_LIST].tolist())
-            duedate_list.append(filtered[config.columns.DUE_DATE].tolist())
-
-        # 리스트 정리 함수 (헬퍼)
-        def unique_or_single(lst):
-            if not lst:
-                return None
-            unique_vals = list(dict.fromkeys([x for x in lst if pd.notna(x)]))
-            return unique_vals[0] if len(unique_vals) == 1 else (unique_vals or None)
-
-        def timestamps_to_dates(lst):
-            if not lst:
-                return []
-            return [
-                ts.strftime('%Y-%m-%d') if isinstance(ts, pd.Timestamp) else str(ts)
-                for ts in lst if pd.notna(ts)
-            ]
-
-        # 컬럼 추가
-        machine_info[config.columns.PO_NO] = po_no_list
-        machine_info[config.columns.GITEM] = [unique_or_single(x) for x in gitem_list]
-        machine_info[config.columns.FABRIC_WIDTH] = [unique_or_single(x) for x in width_list]
-        machine_info[config.columns.PRODUCTION_LENGTH] = [unique_or_single(x) for x in length_list]
-        machine_info[config.columns.CHEMICAL_LIST] = [unique_or_single(x) for x in chemical_list]
-        machine_info[config.columns.DUE_DATE] = [timestamps_to_dates(sublist) for sublist in duedate_list]
+        # 컬럼 추가 (Aging 노드이거나 매칭 실패한 작업은 빈 리스트 / None)
+        machine_info[config.columns.PO_NO] = [list(po_lists.get(pid, [])) for pid in process_ids]
+        for column in (config.columns.GITEM, config.columns.FABRIC_WIDTH,
+                       config.columns.PRODUCTION_LENGTH, config.columns.CHEMICAL_LIST):
+            unique_values = self._group_unique_or_single(process_detail_df, column)
+            machine_info[column] = [unique_values.get(pid) for pid in process_ids]
+        machine_info[config.columns.DUE_DATE] = [list(due_date_lists.get(pid, [])) for pid in process_ids]
 
         return machine_info
 
+    @staticmethod
+    def _group_lists(process_detail_df, column, values=None):
+        """
+        PROCESS_ID별 값 리스트
+
+        Args:
+            process_detail_df (pd.DataFrame): Aging 포함 긴 형식 결과
+            column (str): 집계할 컬럼
+            values (pd.Series, optional): column 대신 사용할 값 (process_detail_df와 같은 인덱스)
+
+        Returns:
+            dict: {PROCESS_ID: [값, ...]}
+        """
+        if values is None:
+            values = process_detail_df[column]
+        grouped = values.groupby(process_detail_df[config.columns.PROCESS_ID].to_numpy(), sort=False)
+        return {process_id: group.tolist() for process_id, group in grouped}
+
+    @classmethod
+    def _group_unique_or_single(cls, process_detail_df, column):
+        """
+        PROCESS_ID별 결측 제외 고유값 (등장 순서). 고유값이 하나면 스칼라, 여럿이면 리스트
+
+        Returns:
+            dict: {PROCESS_ID: 값 또는 [값, ...]} (값이 없는 PROCESS_ID는 제외)
+        """
+        unique_rows = process_detail_df[[config.columns.PROCESS_ID, column]].dropna(subset=[column]).drop_duplicates()
+        return {
+            process_id: values[0] if len(values) == 1 else values
+            for process_id, values in cls._group_lists(unique_rows, column).items()
+        }
+
+    @staticmethod
+    def _format_dates(due_dates):
+        """납기일을 'YYYY-MM-DD' 문자열로 변환 (Timestamp가 아닌 값은 str 변환)"""
+        if pd.api.types.is_datetime64_any_dtype(due_dates):
+            return due_dates.dt.strftime('%Y-%m-%d')
+        return due_dates.map(lambda ts: ts.strftime('%Y-%m-%d') if isinstance(ts, pd.Timestamp) else str(ts))
+
     def add_gitem_names(self, machine_info, original_order):
         """
         GITEM명 매핑 및 추가 컬럼 생성
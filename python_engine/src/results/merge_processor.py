@@ -60,62 +60,65 @@ def create_process_detail_result(final_result_df, sequence_seperated_order, sche
             - machine, start_time, end_time, processing_time
             - fabric_width, production_length, chemical_list, duedate
     """
-    results = []
-
     # sequence_seperated_order를 ID 기준으로 인덱싱 (중복 고려 - 첫 번째 것만 사용)
-    seq_dict = {}
-    for _, row in sequence_seperated_order.iterrows():
-        node_id = row[config.columns.PROCESS_ID]
-        if node_id not in seq_dict:  # 중복 시 첫 번째만 저장
-            seq_dict[node_id] = row.to_dict()
-
-    for _, row in final_result_df.iterrows():
-        node_id = row['id']
-
-        # Aging 여부 확인
-        machine_info = scheduler.machine_dict.get(node_id)
-        is_aging = machine_info and set(machine_info.keys()) == {'AGING'}
-
-        # sequence_seperated_order에서 추가 정보 가져오기
-        if is_aging and '_AGING' in node_id:
-            # Aging 노드는 부모 노드 ID에서 정보 상속
-            parent_node_id = node_id.replace('_AGING', '')
-            extra_info = seq_dict.get(parent_node_id, {})
-        else:
-            # 일반 노드는 직접 조회
-            extra_info = seq_dict.get(node_id, {})
-
-        # 컬럼명: node_start, node_end (lowercase)
-        node_start = row.get('node_start', 0)
-        node_end = row.get('node_end', 0)
-
-        results.append({
-            config.columns.PO_NO: extra_info.get(config.columns.PO_NO, ''),
-            config.columns.GITEM: extra_info.get(config.columns.GITEM, ''),
-            config.columns.DEPTH: row[config.columns.DEPTH],
-            config.columns.PROCESS_ID: node_id,
-            config.columns.OPERATION_CODE: extra_info.get(config.columns.OPERATION_CODE, ''),
-            'is_aging': is_aging,
-            config.columns.MACHINE_CODE: row.get(config.columns.MACHINE_CODE, row.get('machine', None)),  # ★ MACHINE_INDEX → MACHINE_CODE
-            'node_start': node_start,
-            config.columns.NODE_END: node_end,
-            'processing_time': row.get('processing_time', node_end - node_start),
-            config.columns.FABRIC_WIDTH: extra_info.get(config.columns.FABRIC_WIDTH, None),
-            config.columns.PRODUCTION_LENGTH: extra_info.get(config.columns.PRODUCTION_LENGTH, None),
-            config.columns.CHEMICAL_LIST: extra_info.get(config.columns.CHEMICAL_LIST, None),
-            config.columns.DUE_DATE: extra_info.get(config.columns.DUE_DATE, None),
-        })
-
-    df = pd.DataFrame(results)
+    extra_cols = [
+        config.columns.PO_NO, config.columns.GITEM, config.columns.OPERATION_CODE,
+        config.columns.FABRIC_WIDTH, config.columns.PRODUCTION_LENGTH, config.columns.CHEMICAL_LIST, config.columns.DUE_DATE,
+    ]
+    seq_info = sequence_seperated_order.drop_duplicates(subset=config.columns.PROCESS_ID, keep='first')
+    seq_info = seq_info[[config.columns.PROCESS_ID] + extra_cols].rename(columns={config.columns.PROCESS_ID: '__LOOKUP_ID__'})
+
+    node_ids = final_result_df['id']
+
+    # Aging 여부 확인 (machine_dict에 AGING 기계만 있는 노드)
+    aging_ids = {
+        node_id for node_id, machine_info in scheduler.machine_dict.items()
+        if machine_info and set(machine_info.keys()) == {'AGING'}
+    }
+    is_aging = node_ids.isin(aging_ids)
+
+    # Aging 노드는 부모 노드 ID에서 정보 상속
+    inherit_parent = is_aging & node_ids.str.contains('_AGING', regex=False)
+    lookup_ids = node_ids.where(~inherit_parent, node_ids.str.replace('_AGING', '', regex=False))
+
+    df = pd.DataFrame({'__LOOKUP_ID__': lookup_ids.to_numpy()}).merge(seq_info, on='__LOOKUP_ID__', how='left', indicator=True)
+    matched = (df.pop('_merge') == 'both').to_numpy()
+
+    # 정보가 없는 노드: 문자열 컬럼은 빈 문자열
+    for col in [config.columns.PO_NO, config.columns.GITEM, config.columns.OPERATION_CODE]:
+        df[col] = df[col].where(matched, '')
+
+    # 컬럼명: node_start, node_end (lowercase)
+    columns = final_result_df.columns
+    node_start = final_result_df['node_start'].to_numpy() if 'node_start' in columns else 0
+    node_end = final_result_df['node_end'].to_numpy() if 'node_end' in columns else 0
+    if config.columns.MACHINE_CODE in columns:
+        machine = final_result_df[config.columns.MACHINE_CODE].to_numpy()  # ★ MACHINE_INDEX → MACHINE_CODE
+    else:
+        machine = final_result_df['machine'].to_numpy() if 'machine' in columns else None
+    processing_time = final_result_df['processing_time'].to_numpy() if 'processing_time' in columns else node_end - node_start
+
+    df = pd.DataFrame({
+        config.columns.PO_NO: df[config.columns.PO_NO].to_numpy(),
+        config.columns.GITEM: df[config.columns.GITEM].to_numpy(),
+        config.columns.DEPTH: final_result_df[config.columns.DEPTH].to_numpy(),
+        config.columns.PROCESS_ID: node_ids.to_numpy(),
+        config.columns.OPERATION_CODE: df[config.columns.OPERATION_CODE].to_numpy(),
+        'is_aging': is_aging.to_numpy(),
+        config.columns.MACHINE_CODE: machine,
+        'node_start': node_start,
+        config.columns.NODE_END: node_end,
+        'processing_time': processing_time,
+        config.columns.FABRIC_WIDTH: df[config.columns.FABRIC_WIDTH].to_numpy(),
+        config.columns.PRODUCTION_LENGTH: df[config.columns.PRODUCTION_LENGTH].to_numpy(),
+        config.columns.CHEMICAL_LIST: df[config.columns.CHEMICAL_LIST].to_numpy(),
+        config.columns.DUE_DATE: df[config.columns.DUE_DATE].to_numpy(),
+    })
 
     # 정렬: PO번호 → 시작시간 순
     df = df.sort_values([config.columns.PO_NO, 'node_start']).reset_index(drop=True)
 
     print(f"[병합처리] 긴 형식 결과 생성 완료 - 총 {len(df)}행 (Aging 포함: {df['is_aging'].sum()}개)")
-    print(f"[DEBUG] process_detail_df의 빈 PO_NO 개수: {(df[config.columns.PO_NO] == '').sum()}")
-    print(f"[DEBUG] process_detail_df의 NaN PO_NO 개수: {df[config.columns.PO_NO].isna().sum()}")
-    print(f"[DEBUG] process_detail_df의 unique PO_NO: {df[config.columns.PO_NO].nunique()}")
-    print(f"[DEBUG] process_detail_df의 PO 목록: {sorted(df[config.columns.PO_NO].unique())}")
 
     return df
 
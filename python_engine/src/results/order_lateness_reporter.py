@@ -4,6 +4,7 @@
 전체 주문의 납기일, 완성시각, 지각여부, 지각시간 제공
 """
 
+import numpy as np
 import pandas as pd
 from config import config
 
@@ -81,20 +82,13 @@ class OrderLatenessReporter:
                 merged[config.columns.DUE_DATE]
             )
 
-        # 지각 여부 판정
-        merged['지각여부'] = merged.apply(
-            lambda row: '지각' if row['completion_datetime'] > row[config.columns.DUE_DATE] else '준수',
-            axis=1
-        )
+        # 지각 여부 판정 (납기일 결측은 준수)
+        is_late = merged['completion_datetime'] > merged[config.columns.DUE_DATE]
+        merged['지각여부'] = np.where(is_late, '지각', '준수')
 
-        # 지각시간 계산 (일 단위, 소수점 포함)
-        merged['지각시간(일)'] = merged.apply(
-            lambda row: max(
-                0,
-                (row['completion_datetime'] - row[config.columns.DUE_DATE]).total_seconds() / 86400
-            ),
-            axis=1
-        ).round(2)
+        # 지각시간 계산 (일 단위, 소수점 포함, 납기 준수/결측은 0)
+        lateness_days = (merged['completion_datetime'] - merged[config.columns.DUE_DATE]).dt.total_seconds() / 86400
+        merged['지각시간(일)'] = lateness_days.clip(lower=0).fillna(0).round(2)
 
         return merged
 
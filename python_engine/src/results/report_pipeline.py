@@ -0,0 +1,100 @@
+"""
+결과 리포트 단계 실행 모듈 (results 전용)
+
+create_results의 각 리포트 생성 단계를 의존성 그래프로 선언하고
+순차 실행 또는 스레드 풀 동시 실행으로 수행하며 단계별 소요시간을 측정합니다.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+EXECUTION_MODES = ('sequential', 'concurrent')
+
+
+class ReportStage:
+    """리포트 생성 단계 (이름, 실행 함수, 선행 단계)"""
+
+    def __init__(self, name, func, depends_on=()):
+        """
+        Args:
+            name (str): 단계 이름 (결과 딕셔너리 키)
+            func (callable): func(outputs) -> 결과. outputs는 완료된 단계 결과 딕셔너리
+            depends_on (tuple): 먼저 완료되어야 하는 단계 이름들
+        """
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+
+    def __repr__(self):
+        return f"ReportStage({self.name}, depends_on={list(self.depends_on)})"
+
+
+def _validate_stages(stages):
+    """단계 이름 중복 / 미정의 선행 단계 / 순환 의존성 검사 (선언 순서에서 선행 단계가 먼저 와야 함)"""
+    seen = set()
+    for stage in stages:
+        if stage.name in seen:
+            raise ValueError(f"중복된 리포트 단계: {stage.name}")
+        missing = [dep for dep in stage.depends_on if dep not in seen]
+        if missing:
+            raise ValueError(f"리포트 단계 '{stage.name}'의 선행 단계가 먼저 선언되지 않았습니다: {missing}")
+        seen.add(stage.name)
+
+
+def _run_timed(stage, outputs):
+    """단계 실행 후 (결과, 소요시간) 반환"""
+    started = time.perf_counter()
+    result = stage.func(outputs)
+    return result, time.perf_counter() - started
+
+
+def run_report_stages(stages, execution_mode='sequential', max_workers=None):
+    """
+    리포트 단계 실행
+
+    Args:
+        stages (list[ReportStage]): 실행할 단계 (선행 단계가 먼저 오도록 선언)
+        execution_mode (str): 'sequential' (선언 순서대로 실행) 또는
+            'concurrent' (선행 단계가 끝난 단계들을 스레드 풀에서 동시 실행)
+        max_workers (int, optional): concurrent 모드의 최대 스레드 수
+
+    Returns:
+        tuple: (outputs, timings)
+            - outputs (dict): 단계 이름 → 결과
+            - timings (dict): 단계 이름 → 소요시간(초), 'total' → 전체 소요시간(초)
+    """
+    if execution_mode not in EXECUTION_MODES:
+        raise ValueError(f"지원하지 않는 실행 모드: {execution_mode} (가능: {EXECUTION_MODES})")
+    _validate_stages(stages)
+
+    outputs = {}
+    timings = {}
+    started = time.perf_counter()
+
+    if execution_mode == 'sequential':
+        for stage in stages:
+            outputs[stage.name], timings[stage.name] = _run_timed(stage, outputs)
+    else:
+        pending = list(stages)
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                # 선행 단계가 모두 끝난 단계 제출 (outputs는 메인 스레드에서만 갱신)
+                for stage in [s for s in pending if all(dep in outputs for dep in s.depends_on)]:
+                    pending.remove(stage)
+                    running[executor.submit(_run_timed, stage, dict(outputs))] = stage
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    outputs[stage.name], timings[stage.name] = future.result()
+
+    timings['total'] = time.perf_counter() - started
+    return outputs, timings
+
+
+def format_stage_timings(timings):
+    """단계별 소요시간 출력 문자열"""
+    stage_parts = [f"{name} {seconds:.2f}s" for name, seconds in timings.items() if name != 'total']
+    return f"{', '.join(stage_parts)} | 전체 {timings['total']:.2f}s"
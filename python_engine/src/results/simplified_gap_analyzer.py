@@ -5,6 +5,7 @@
 "변경사유" 컬럼을 추가하여 한눈에 셋업 발생 원인을 파악할 수 있도록 개선
 """
 
+import numpy as np
 import pandas as pd
 from config import config
 
@@ -33,156 +34,210 @@ class SimplifiedGapAnalyzer:
             for code in machine_mapper.get_all_codes()
         }
 
+        # 간격 분석 결과 캐시 (스케줄러 상태가 바뀌면 재계산)
+        self._gap_table = None
+        self._gap_totals = None
+        self._gap_signature = None
+
+    def _schedule_signature(self):
+        """스케줄러 상태 식별값 (기계별 할당 작업, 시작/종료 시각)"""
+        return tuple(
+            (machine_code, tuple(map(tuple, machine.assigned_task)), tuple(machine.O_start), tuple(machine.O_end))
+            for machine_code, machine in self.scheduler.Machines.items()
+        )
+
+    def invalidate_cache(self):
+        """간격 분석 캐시 무효화 (스케줄 외 정보 - 배합액 선택 등 - 변경 시 명시적으로 호출)"""
+        self._gap_table = None
+        self._gap_totals = None
+        self._gap_signature = None
+
+    def _ensure_gap_table(self):
+        """캐시된 간격 테이블이 없거나 스케줄러 상태가 바뀌었으면 재계산"""
+        signature = self._schedule_signature()
+        if self._gap_table is None or signature != self._gap_signature:
+            self._gap_table = self._build_gap_table()
+            self._gap_totals = None
+            self._gap_signature = signature
+        return self._gap_table
+
     def analyze_all_gaps(self):
         """
         모든 기계의 간격을 분석하여 간결한 DataFrame 반환
         ⭐ 리팩토링: 딕셔너리 순회로 변경
 
+        스케줄러 상태당 한 번만 계산하고, 이후 호출은 캐시된 결과의 복사본을 반환합니다.
+
         Returns:
             pd.DataFrame: 12개 컬럼의 간격 분석 결과
         """
-        gaps = []
+        return self._ensure_gap_table().copy()
 
-        # ★ 딕셔너리 순회로 변경
-        for machine_code, machine in self.scheduler.Machines.items():
-            machine_gaps = self._analyze_machine_gaps(machine)
-            gaps.extend(machine_gaps)
-
-        df = pd.DataFrame(gaps)
+    def get_gap_totals_by_machine(self):
+        """
+        기계별 셋업시간/대기시간 합계 (단일 groupby, 캐시)
 
-        # 시간순 정렬
-        if not df.empty and '간격시작시각' in df.columns:
-            df = df.sort_values(['기계코드', '간격시작시각']).reset_index(drop=True)
+        Returns:
+            pd.DataFrame: index=기계코드, columns=['셋업시간(분)', '대기시간(분)']
+        """
+        gaps_df = self._ensure_gap_table()
+        if self._gap_totals is None:
+            if gaps_df.empty:
+                self._gap_totals = pd.DataFrame(columns=['셋업시간(분)', '대기시간(분)'], dtype=float)
+            else:
+                self._gap_totals = gaps_df.groupby('기계코드')[['셋업시간(분)', '대기시간(분)']].sum()
+        return self._gap_totals
 
-        return df
+    def _build_gap_table(self):
+        """
+        모든 기계의 간격 분석 테이블 생성 (컬럼형 처리)
 
-    def _analyze_machine_gaps(self, machine):
+        기계별 (시작, 종료, 작업) 배열에서 간격을 한 번에 구하고, 이론 셋업시간은
+        DelayProcessor.delay_calc_pairs로 일괄 조회한 뒤 분류/시각 변환을 배열 연산으로 처리합니다.
         """
-        단일 기계의 간격 분석
+        machine_gaps = []
 
-        Args:
-            machine: Machine_Time_window 객체
+        # ★ 딕셔너리 순회로 변경
+        for machine_code, machine in self.scheduler.Machines.items():
+            gaps = self._analyze_machine_gaps(machine)
+            if gaps is not None:
+                machine_gaps.append(gaps)
 
-        Returns:
-            list: 간격 정보 딕셔너리 리스트
-        """
-        gaps = []
+        if not machine_gaps:
+            return pd.DataFrame()
 
-        # 작업이 2개 미만이면 간격 없음
-        if len(machine.assigned_task) < 2:
-            return gaps
+        machine_codes = np.concatenate([gaps['machine_code'] for gaps in machine_gaps])
+        prev_ids = np.concatenate([gaps['prev_id'] for gaps in machine_gaps])
+        next_ids = np.concatenate([gaps['next_id'] for gaps in machine_gaps])
+        gap_start = np.concatenate([gaps['gap_start'] for gaps in machine_gaps])
+        gap_end = np.concatenate([gaps['gap_end'] for gaps in machine_gaps])
+        theoretical_setup = np.concatenate([gaps['theoretical_setup'] for gaps in machine_gaps])
+        gap_duration = gap_end - gap_start
 
-        # 시간순 정렬
-        sorted_indices = sorted(
-            range(len(machine.O_start)),
-            key=lambda i: machine.O_start[i]
+        # 셋업시간 vs 대기시간 분류
+        pure_idle = theoretical_setup == 0
+        pure_setup = ~pure_idle & (gap_duration <= theoretical_setup)
+        gap_type = np.select([pure_idle, pure_setup], ["순수대기", "순수셋업"], default="혼합(셋업+대기)")
+        setup_time = np.where(pure_idle, 0, np.where(pure_setup, gap_duration, theoretical_setup))
+        idle_time = np.where(pure_idle, gap_duration, np.where(pure_setup, 0, gap_duration - theoretical_setup))
+
+        # 작업 요약 (고유 작업별로 한 번씩만 계산)
+        opnode_dict = self.delay_processor.opnode_dict
+        task_codes, task_ids = pd.factorize(np.concatenate([prev_ids, next_ids]))
+        task_infos = [opnode_dict.get(task_id, {}) for task_id in task_ids]
+        task_summaries = np.array([self._format_task_summary(info) for info in task_infos], dtype=object)
+        prev_codes, next_codes = task_codes[:len(prev_ids)], task_codes[len(prev_ids):]
+
+        # 변경사유는 (작업 속성 코드쌍, 배합액 변경 여부) 조합이 같으면 동일하므로 조합별 대표 쌍으로 한 번씩만 계산
+        attribute_codes = {}
+        task_attributes = np.array([
+            attribute_codes.setdefault(self._reason_attribute_key(info), len(attribute_codes)) for info in task_infos
+        ])
+        chemicals = np.empty(len(task_infos), dtype=object)
+        chemicals[:] = [info.get("SELECTED_CHEMICAL") if info else None for info in task_infos]
+        has_chemical = np.array([bool(chemical) for chemical in chemicals])
+        chemical_changed = (
+            has_chemical[prev_codes] & has_chemical[next_codes]
+            & (chemicals[prev_codes] != chemicals[next_codes]).astype(bool)
         )
+        reason_keys = (task_attributes[prev_codes] * len(attribute_codes) + task_attributes[next_codes]) * 2 + chemical_changed
+        _, first_rows, reason_codes = np.unique(reason_keys, return_index=True, return_inverse=True)
+        change_reasons = np.array([
+            self._analyze_change_reason(task_infos[prev_codes[row]], task_infos[next_codes[row]])
+            for row in first_rows
+        ], dtype=object)
 
-        for i in range(len(sorted_indices) - 1):
-            curr_idx = sorted_indices[i]
-            next_idx = sorted_indices[i + 1]
-
-            gap_start = machine.O_end[curr_idx]
-            gap_end = machine.O_start[next_idx]
-            gap_duration = gap_end - gap_start
+        # 시간 변환 (TIME_MULTIPLIER → 분)
+        time_mult = config.constants.TIME_MULTIPLIER
 
-            if gap_duration <= 0:
-                continue  # 간격 없음
+        df = pd.DataFrame({
+            '기계코드': machine_codes,  # ★ 이미 machine_code이므로 직접 사용
+            '기계명': [self.machine_code_to_name.get(code, f'기계{code}') for code in machine_codes],  # ★ code → name 매핑
+            '간격시작시각': self._to_datetimes(gap_start),
+            '간격종료시각': self._to_datetimes(gap_end),
+            '간격시간(분)': np.round(gap_duration * time_mult, 1),
+            '간격유형': gap_type,
+            '셋업시간(분)': np.round(setup_time * time_mult, 1),
+            '대기시간(분)': np.round(idle_time * time_mult, 1),
+            '이전작업': task_summaries[prev_codes],
+            '다음작업': task_summaries[next_codes],
+            '변경사유': change_reasons[reason_codes],
+            '셋업비율(%)': np.round(setup_time / gap_duration * 100, 1)
+        })
 
-            # 간격 정보 계산
-            gap_info = self._calculate_gap_info(
-                machine.Machine_code,  # ★ Machine_index → Machine_code
-                machine.assigned_task[curr_idx],
-                machine.assigned_task[next_idx],
-                gap_start,
-                gap_end,
-                gap_duration
-            )
+        # 시간순 정렬
+        return df.sort_values(['기계코드', '간격시작시각']).reset_index(drop=True)
 
-            if gap_info:
-                gaps.append(gap_info)
+    def _to_datetimes(self, times):
+        """
+        TIME_MULTIPLIER 단위 시각 배열을 실제 datetime으로 일괄 변환
 
-        return gaps
+        base_date + pd.Timedelta(minutes=...)와 같은 절사 규칙(나노초 절사, datetime 기준이면 마이크로초 절사)을 따릅니다.
+        """
+        nanoseconds = np.trunc(times * config.constants.TIME_MULTIPLIER * 60 * 1_000_000_000).astype(np.int64)
+        if not isinstance(self.base_date, pd.Timestamp):
+            nanoseconds = nanoseconds // 1000 * 1000
+        return self.base_date + pd.to_timedelta(nanoseconds, unit='ns')
 
-    def _calculate_gap_info(self, machine_code, prev_task, next_task,
-                           gap_start, gap_end, gap_duration):
+    def _analyze_machine_gaps(self, machine):
         """
-        간격 정보 계산 (핵심 로직)
-        ⭐ 리팩토링: machine_idx → machine_code
+        단일 기계의 간격 배열 추출
 
         Args:
-            machine_code (str): 기계 코드 (예: 'A2020', 'C2010')
-            prev_task (tuple): (depth, task_id)
-            next_task (tuple): (depth, task_id)
-            gap_start (float): 간격 시작 시간 (TIME_MULTIPLIER 단위)
-            gap_end (float): 간격 종료 시간 (TIME_MULTIPLIER 단위)
-            gap_duration (float): 간격 시간 (TIME_MULTIPLIER 단위)
+            machine: Machine_Time_window 객체
 
         Returns:
-            dict or None: 간격 정보 딕셔너리 (12개 키)
+            dict or None: 간격별 배열 (machine_code, prev_id, next_id, gap_start, gap_end, theoretical_setup).
+                간격이 없으면 None
         """
-        # 시스템 작업 (depth == -1) 제외
-        if prev_task[0] == -1 or next_task[0] == -1:
+        # 작업이 2개 미만이면 간격 없음
+        if len(machine.assigned_task) < 2:
             return None
 
-        prev_task_id = prev_task[1]
-        next_task_id = next_task[1]
+        # 시간순 정렬 (동일 시작시각은 할당 순서 유지)
+        starts = np.asarray(machine.O_start, dtype=float)
+        ends = np.asarray(machine.O_end, dtype=float)
+        order = np.argsort(starts, kind='stable')
+        curr_idx, next_idx = order[:-1], order[1:]
 
-        # 이론적 셋업시간 계산 (machine_code 전달)
-        theoretical_setup = self.delay_processor.delay_calc_whole_process(
-            prev_task_id, next_task_id, machine_code  # ★ machine_idx → machine_code
-        )
+        depths = np.array([task[0] for task in machine.assigned_task])
+        task_ids = np.empty(len(machine.assigned_task), dtype=object)
+        task_ids[:] = [task[1] for task in machine.assigned_task]
 
-        # 셋업시간 vs 대기시간 분류
-        if theoretical_setup == 0:
-            gap_type = "순수대기"
-            setup_time = 0
-            idle_time = gap_duration
-        elif gap_duration <= theoretical_setup:
-            gap_type = "순수셋업"
-            setup_time = gap_duration
-            idle_time = 0
-        else:
-            gap_type = "혼합(셋업+대기)"
-            setup_time = theoretical_setup
-            idle_time = gap_duration - theoretical_setup
-
-        # 작업 정보 추출
-        prev_info = self.delay_processor.opnode_dict.get(prev_task_id, {})
-        next_info = self.delay_processor.opnode_dict.get(next_task_id, {})
-
-        # 변경사유 분석
-        change_reason = self._analyze_change_reason(prev_info, next_info)
+        gap_start = ends[curr_idx]
+        gap_end = starts[next_idx]
 
-        # 작업 요약
-        prev_work = self._format_task_summary(prev_info)
-        next_work = self._format_task_summary(next_info)
-
-        # 시간 변환 (TIME_MULTIPLIER → 분)
-        time_mult = config.constants.TIME_MULTIPLIER
+        # 간격 없음 / 시스템 작업 (depth == -1) 제외
+        valid = (gap_end - gap_start > 0) & (depths[curr_idx] != -1) & (depths[next_idx] != -1)
+        if not valid.any():
+            return None
 
-        # 실제 datetime 변환
-        gap_start_dt = self.base_date + pd.Timedelta(minutes=gap_start * time_mult)
-        gap_end_dt = self.base_date + pd.Timedelta(minutes=gap_end * time_mult)
+        prev_ids = task_ids[curr_idx[valid]]
+        next_ids = task_ids[next_idx[valid]]
 
-        # 셋업비율 계산
-        setup_ratio = (setup_time / gap_duration * 100) if gap_duration > 0 else 0
+        # 이론적 셋업시간 일괄 계산 (machine_code 전달)
+        theoretical_setup = self.delay_processor.delay_calc_pairs(
+            prev_ids, next_ids, machine.Machine_code  # ★ machine_idx → machine_code
+        )
 
         return {
-            '기계코드': machine_code,  # ★ 이미 machine_code이므로 직접 사용
-            '기계명': self.machine_code_to_name.get(machine_code, f'기계{machine_code}'),  # ★ code → name 매핑
-            '간격시작시각': gap_start_dt,
-            '간격종료시각': gap_end_dt,
-            '간격시간(분)': round(gap_duration * time_mult, 1),
-            '간격유형': gap_type,
-            '셋업시간(분)': round(setup_time * time_mult, 1),
-            '대기시간(분)': round(idle_time * time_mult, 1),
-            '이전작업': prev_work,
-            '다음작업': next_work,
-            '변경사유': change_reason,
-            '셋업비율(%)': round(setup_ratio, 1)
+            'machine_code': np.full(len(prev_ids), machine.Machine_code, dtype=object),
+            'prev_id': prev_ids,
+            'next_id': next_ids,
+            'gap_start': gap_start[valid],
+            'gap_end': gap_end[valid],
+            'theoretical_setup': theoretical_setup,
         }
 
+    @staticmethod
+    def _reason_attribute_key(task_info):
+        """변경사유 계산에 쓰이는 작업 속성(공정분류, 폭) 키 (정보 없음은 None, 값 표기가 같도록 타입까지 구분)"""
+        if not task_info:
+            return None
+        op_type = task_info.get("OPERATION_CLASSIFICATION")
+        width = task_info.get("FABRIC_WIDTH")
+        return (type(op_type), op_type, type(width), width)
+
     def _analyze_change_reason(self, prev_info, next_info):
         """
         변경사유 분석 (핵심!)
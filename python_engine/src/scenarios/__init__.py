@@ -0,0 +1,15 @@
+"""
+시나리오 모듈
+
+여러 스케줄링 시나리오(window_days, 기간 설정, 시나리오 제약조건 파일)를
+공통 앞단을 공유하며 병렬 실행하고 KPI 비교표를 생성합니다.
+"""
+
+from .scenario_runner import (
+    Scenario,
+    run_scenarios,
+    load_input_tables,
+    load_scenario_tables,
+)
+
+__all__ = ['Scenario', 'run_scenarios', 'load_input_tables', 'load_scenario_tables']
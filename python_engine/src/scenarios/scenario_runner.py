@@ -0,0 +1,262 @@
+"""
+다중 시나리오 실행 모듈
+
+window_days, LINESPEED_PERIOD/YIELD_PERIOD, 시나리오 제약조건 시트 조합을 비교할 때
+공통 앞단(Excel 로딩, Validation, 주문 시퀀스 생성, 수율 예측, DAG 생성)은 한 번만 수행하고
+스케줄링 + 결과 KPI 계산만 프로세스 풀로 나눠 실행합니다.
+
+공통 앞단 결과는 fork 전에 모듈 전역에 올려두고 자식 프로세스가 그대로 참조하므로
+(copy-on-write) 큰 데이터프레임/DAG를 pickle로 전달하지 않습니다.
+"""
+
+import copy
+import time
+
+import pandas as pd
+from config import config
+from src.validation import preprocess_production_data
+from src.order_sequencing import generate_order_sequences
+from src.yield_management import yield_prediction
+from src.dag_management import create_complete_dag_system
+from src.scheduler import run_scheduler_pipeline
+from src.results import LazySchedulingResults
+from src.utils import run_forked, quiet_call
+
+
+DEFAULT_INPUT_FILE = "data/input/생산계획 입력정보.xlsx"
+DEFAULT_GLOBAL_CONSTRAINT_FILE = "data/input/tb_commomconstraint.xlsx"
+DEFAULT_SCENARIO_FILE = "data/input/시나리오_공정제약조건.xlsx"
+
+
+class Scenario:
+    """비교할 시나리오 하나 (None인 항목은 config 기본값 사용)"""
+
+    def __init__(self, name, window_days=None, linespeed_period=None, yield_period=None,
+                 scenario_file=None):
+        """
+        Args:
+            name (str): 시나리오 이름 (비교표 행 이름)
+            window_days (int, optional): 디스패칭 window 크기 (기본: config.constants.WINDOW_DAYS)
+            linespeed_period (str, optional): 라인스피드 기간 (기본: config.constants.LINESPEED_PERIOD)
+            yield_period (str, optional): 수율 기간 (기본: config.constants.YIELD_PERIOD)
+            scenario_file (str, optional): 시나리오 제약조건 파일
+                (machine_limit / machine_allocate / machine_rest 시트, 기본: DEFAULT_SCENARIO_FILE)
+        """
+        self.name = name
+        self.window_days = window_days if window_days is not None else config.constants.WINDOW_DAYS
+        self.linespeed_period = linespeed_period or config.constants.LINESPEED_PERIOD
+        self.yield_period = yield_period or config.constants.YIELD_PERIOD
+        self.scenario_file = scenario_file or DEFAULT_SCENARIO_FILE
+
+    @property
+    def preprocess_key(self):
+        """Validation 결과 공유 키"""
+        return (self.linespeed_period, self.yield_period)
+
+    @property
+    def prefix_key(self):
+        """주문 시퀀스/수율 예측/DAG 결과 공유 키"""
+        return (self.preprocess_key, self.scenario_file)
+
+    def __repr__(self):
+        return (f"Scenario({self.name}, window_days={self.window_days}, "
+                f"linespeed_period={self.linespeed_period}, yield_period={self.yield_period}, "
+                f"scenario_file={self.scenario_file})")
+
+
+def load_input_tables(input_file=DEFAULT_INPUT_FILE, global_constraint_file=DEFAULT_GLOBAL_CONSTRAINT_FILE):
+    """
+    생산계획 입력 Excel 로딩 (main.py와 동일한 시트/타입)
+
+    Returns:
+        dict: preprocess_production_data()의 *_df 인자 이름 → 데이터프레임
+    """
+    print("Excel 파일 로딩 중...")
+    tables = {
+        'order_df': pd.read_excel(input_file, sheet_name="tb_polist", dtype={config.columns.GITEM: str}, parse_dates=[config.columns.DUE_DATE]),
+        'gitem_sitem_df': pd.read_excel(input_file, sheet_name="tb_itemspec", dtype={config.columns.GITEM: str}),
+        'linespeed_df': pd.read_excel(input_file, sheet_name="tb_linespeed", dtype={config.columns.GITEM: str, config.columns.OPERATION_CODE: str}),
+        'operation_df': pd.read_excel(input_file, sheet_name="tb_itemproc", dtype={config.columns.GITEM: str, config.columns.OPERATION_CODE: str}),
+        'yield_df': pd.read_excel(input_file, sheet_name="tb_productionyield", dtype={config.columns.GITEM: str, config.columns.OPERATION_CODE: str}),
+        'chemical_df': pd.read_excel(input_file, sheet_name="tb_chemical", dtype={config.columns.GITEM: str, config.columns.OPERATION_CODE: str}),
+        'operation_delay_df': pd.read_excel(input_file, sheet_name="tb_changetime"),
+        'width_change_df': pd.read_excel(input_file, sheet_name="tb_changewidth"),
+        'aging_gitem_df': pd.read_excel(input_file, sheet_name="tb_agingtime_gitem", dtype={config.columns.GITEM: str}),
+        'aging_gbn_df': pd.read_excel(input_file, sheet_name="tb_agingtime_gbn"),
+        'global_machine_limit_df': pd.read_excel(global_constraint_file),
+    }
+    print("Excel 파일 로딩 완료!")
+    return tables
+
+
+def load_scenario_tables(scenario_file=DEFAULT_SCENARIO_FILE):
+    """
+    시나리오 제약조건 파일 로딩
+
+    Returns:
+        tuple: (local_machine_limit, machine_allocate, machine_rest)
+    """
+    local_machine_limit = pd.read_excel(scenario_file, sheet_name="machine_limit")
+    machine_allocate = pd.read_excel(scenario_file, sheet_name="machine_allocate")
+    machine_rest = pd.read_excel(
+        scenario_file, sheet_name="machine_rest",
+        parse_dates=[config.columns.MACHINE_REST_START, config.columns.MACHINE_REST_END]
+    )
+    return local_machine_limit, machine_allocate, machine_rest
+
+
+def _build_shared_prefixes(scenarios, input_tables, machine_mapper):
+    """
+    시나리오들이 공유하는 앞단 결과를 키별로 한 번씩 계산
+
+    Returns:
+        dict: prefix_key → 스케줄링 입력 (sequence_seperated_order, dag_df, manager 등)
+    """
+    processed_by_key = {}
+    scenario_tables_by_file = {}
+    prefixes = {}
+
+    for scenario in scenarios:
+        if scenario.preprocess_key not in processed_by_key:
+            print(f"[시나리오] Validation 실행 (linespeed={scenario.linespeed_period}, yield={scenario.yield_period})")
+            processed_by_key[scenario.preprocess_key] = preprocess_production_data(
+                **{name: df.copy() for name, df in input_tables.items()},
+                linespeed_period=scenario.linespeed_period,
+                yield_period=scenario.yield_period,
+                validate=True,
+                save_output=False
+            )
+        if scenario.scenario_file not in scenario_tables_by_file:
+            scenario_tables_by_file[scenario.scenario_file] = load_scenario_tables(scenario.scenario_file)
+
+        if scenario.prefix_key in prefixes:
+            continue
+
+        processed_data = processed_by_key[scenario.preprocess_key]
+        local_machine_limit, machine_allocate, machine_rest = scenario_tables_by_file[scenario.scenario_file]
+
+        print(f"[시나리오] 주문 시퀀스 / 수율 예측 / DAG 생성 ({scenario.scenario_file})")
+        sequence_seperated_order, linespeed, unable_gitems, unable_order, unable_details = generate_order_sequences(
+            processed_data['order_data'], processed_data['operation_sequence'], processed_data['operation_types'],
+            local_machine_limit, processed_data['global_machine_limit'], machine_allocate,
+            processed_data['linespeed'], processed_data['chemical_data'])
+        sequence_seperated_order = yield_prediction(processed_data['yield_data'], sequence_seperated_order)
+        dag_df, opnode_dict, manager, machine_dict, merged_df = create_complete_dag_system(
+            sequence_seperated_order, linespeed, machine_mapper, processed_data['aging_data'])
+
+        prefixes[scenario.prefix_key] = {
+            'order': processed_data['order_data'],
+            'width_change_df': processed_data['width_change'],
+            'operation_delay_df': processed_data['operation_delay'],
+            'machine_rest': machine_rest,
+            'unable_order_count': len(unable_order),
+            'sequence_seperated_order': sequence_seperated_order,
+            'dag_df': dag_df,
+            'opnode_dict': opnode_dict,
+            'manager': manager,
+            'machine_dict': machine_dict,
+        }
+
+    return prefixes
+
+
+def _schedule_scenario(scenario, prefix, machine_mapper, base_date):
+    """시나리오 하나의 스케줄링 + KPI 계산 (prefix는 호출 측에서 격리된 사본이어야 함)"""
+    started = time.perf_counter()
+    result, scheduler = run_scheduler_pipeline(
+        dag_df=prefix['dag_df'],
+        sequence_seperated_order=prefix['sequence_seperated_order'],
+        width_change_df=prefix['width_change_df'],
+        machine_mapper=machine_mapper,
+        opnode_dict=prefix['opnode_dict'],
+        operation_delay_df=prefix['operation_delay_df'],
+        machine_dict=prefix['machine_dict'],
+        machine_rest=prefix['machine_rest'],
+        base_date=base_date,
+        manager=prefix['manager'],
+        window_days=scenario.window_days,
+    )
+
+    # KPI만 계산 (호기_정보/간격 분석/간트차트/CSV 저장 없음 → 프로세스 간 파일 충돌 없음)
+    results = LazySchedulingResults(
+        result, prefix['order'], prefix['sequence_seperated_order'], machine_mapper, base_date, scheduler
+    )
+    metrics = results.performance_metrics
+    lateness = results.lateness_summary
+
+    return {
+        '시나리오': scenario.name,
+        'window_days': scenario.window_days,
+        'linespeed_period': scenario.linespeed_period,
+        'yield_period': scenario.yield_period,
+        '시나리오파일': scenario.scenario_file,
+        'PO제품수': metrics['po_count'],
+        '불가주문수': prefix['unable_order_count'],
+        'makespan(시간)': metrics['makespan_hours'],
+        '실제makespan': round(float(results.cleaned_data['actual_makespan']), 1),
+        '납기준수율(%)': metrics['ontime_delivery_rate'],
+        '납기지각제품수': metrics['late_product_count'],
+        '지각주문수': lateness['late_orders'],
+        '평균지각일수': lateness['avg_lateness_days'],
+        '소요시간(초)': round(time.perf_counter() - started, 2),
+        '오류': None
+    }
+
+
+def _run_scenario_safely(scenario, prefix, machine_mapper, base_date, quiet):
+    """시나리오 실행 (오류는 비교표 '오류' 컬럼으로 기록, quiet면 진행 로그 숨김)"""
+    try:
+        return quiet_call(quiet, _schedule_scenario, scenario, prefix, machine_mapper, base_date)
+    except Exception as e:
+        print(f"[ERROR] 시나리오 '{scenario.name}' 실행 중 오류: {e}")
+        return {'시나리오': scenario.name, 'window_days': scenario.window_days,
+                'linespeed_period': scenario.linespeed_period, 'yield_period': scenario.yield_period,
+                '시나리오파일': scenario.scenario_file, '오류': str(e)}
+
+
+def _run_scenario_worker(state, index):
+    """run_forked 작업 함수: 공유 상태에서 시나리오 index 실행"""
+    scenario = state['scenarios'][index]
+    # 스케줄링이 DAG/노드 상태를 변경하고 한 작업 프로세스가 여러 시나리오를 실행할 수 있으므로 사본 사용
+    prefix = copy.deepcopy(state['prefixes'][scenario.prefix_key])
+    return _run_scenario_safely(scenario, prefix, state['machine_mapper'], state['base_date'], state['quiet'])
+
+
+def run_scenarios(scenarios, base_date, machine_mapper, input_tables=None, max_workers=None, quiet=True):
+    """
+    다중 시나리오 실행 및 KPI 비교표 생성
+
+    Args:
+        scenarios (list[Scenario]): 비교할 시나리오 (이름 중복 불가)
+        base_date (datetime): 기준 날짜
+        machine_mapper (MachineMapper): 기계 정보 매핑 관리 객체
+        input_tables (dict, optional): load_input_tables() 결과 (없으면 기본 경로에서 로딩)
+        max_workers (int, optional): 프로세스 수. 1이거나 fork를 지원하지 않는 플랫폼이면 현재 프로세스에서 순차 실행
+        quiet (bool): 시나리오별 스케줄링 진행 로그 숨김
+
+    Returns:
+        pd.DataFrame: 시나리오별 KPI 비교표 (입력 순서 유지)
+    """
+    names = [scenario.name for scenario in scenarios]
+    if len(set(names)) != len(names):
+        raise ValueError(f"시나리오 이름이 중복되었습니다: {names}")
+    if not scenarios:
+        return pd.DataFrame()
+
+    started = time.perf_counter()
+    if input_tables is None:
+        input_tables = load_input_tables()
+
+    prefixes = _build_shared_prefixes(scenarios, input_tables, machine_mapper)
+    prefix_elapsed = time.perf_counter() - started
+    print(f"[시나리오] 공통 앞단 완료: 시나리오 {len(scenarios)}개, 공유 입력 {len(prefixes)}개 ({prefix_elapsed:.2f}s)")
+
+    # 공통 앞단 결과는 fork로 물려주고 시나리오 index만 전달
+    shared_state = dict(scenarios=scenarios, prefixes=prefixes, machine_mapper=machine_mapper,
+                        base_date=base_date, quiet=quiet)
+    rows, use_processes = run_forked(shared_state, _run_scenario_worker, range(len(scenarios)), max_workers)
+
+    comparison = pd.DataFrame(rows)
+    print(f"[시간] 시나리오 실행 완료 ({'process' if use_processes else 'sequential'}): "
+          f"전체 {time.perf_counter() - started:.2f}s")
+    return comparison
@@ -1,9 +1,15 @@
+import random
 from config import config
+import numpy as np
 import pandas as pd
 from .delay_dict import DelayProcessor
 from .scheduler import Scheduler
 from .dispatch_rules import create_dispatch_rule
-from .scheduling_core import DispatchPriorityStrategy
+from .scheduling_core import DispatchPriorityStrategy, IncrementalRescheduleStrategy, freeze_schedule
+from .local_search import LocalSearchImprover, improve_schedule
+from .schedule_kernel import ScheduleKernel
+from .genetic_optimizer import GeneticOptimizer, optimize_schedule_ga
+from .multistart import run_multistart_dispatch
 
 # def run_schedule(dag_df, sequence_seperated_order, machine_dict, manager, window_days, opnode_dict, machine_limit, base_date, operation_delay_df, width_change_df, use_level4=False):
 #     """
@@ -98,6 +104,9 @@ def run_scheduler_pipeline(
     base_date,
     manager,
     window_days,
+    local_search_seconds=0,
+    local_search_iterations=0,
+    tie_break_seed=None,
 ):
     """스케줄링 준비 및 실행 파이프라인을 수행하고 결과와 스케줄러를 반환합니다.
 
@@ -115,6 +124,14 @@ def run_scheduler_pipeline(
     base_date : datetime
     manager : object
     window_days : int
+    local_search_seconds : float, optional
+        0보다 크면 디스패치 결과에 이 시간(초) 동안 지역 탐색 개선을 적용 (기본 0: 미적용)
+        시간 예산은 기계 부하에 따라 결과가 달라지므로 재현/캐시가 필요하면 local_search_iterations 사용
+    local_search_iterations : int, optional
+        0보다 크면 이 횟수만큼 지역 탐색 이동을 시도 (seed 0 고정, 같은 입력이면 같은 결과, 기본 0: 미적용)
+        local_search_seconds와 함께 주면 먼저 도달하는 쪽에서 종료
+    tie_break_seed : int, optional
+        지정하면 디스패치 동순위(납기일/원단너비 동일)와 배합액 동수 선택을 이 시드로 무작위화 (멀티스타트용)
 
     Returns
     -------
@@ -123,7 +140,7 @@ def run_scheduler_pipeline(
 
     # 디스패치 룰 생성
     print("[65%] 디스패치 규칙 생성 중...")
-    dispatch_rule_ans, dag_df = create_dispatch_rule(dag_df, sequence_seperated_order)
+    dispatch_rule_ans, dag_df = create_dispatch_rule(dag_df, sequence_seperated_order, tie_break_seed=tie_break_seed)
 
 
 
@@ -155,6 +172,131 @@ def run_scheduler_pipeline(
         dag_df=dag_df,
         priority_order=dispatch_rule_ans,
         window_days=window_days,
+        tie_break_rng=random.Random(tie_break_seed) if tie_break_seed is not None else None,
+    )
+
+    if local_search_seconds > 0 or local_search_iterations > 0:
+        print("[80%] 지역 탐색으로 스케줄 개선 중...")
+        result, _ = improve_schedule(
+            scheduler, manager, sequence_seperated_order, base_date,
+            time_budget=local_search_seconds if local_search_seconds > 0 else None,
+            max_iterations=local_search_iterations if local_search_iterations > 0 else None,
+        )
+
+    return result, scheduler
+
+
+def to_time_slot(timestamp, base_date):
+    """datetime → 기준 날짜 대비 시간 슬롯 (TIME_MULTIPLIER분 단위, 내림)"""
+    slot_seconds = config.constants.TIME_MULTIPLIER * 60
+    return int((pd.Timestamp(timestamp) - pd.Timestamp(base_date)).total_seconds() // slot_seconds)
+
+
+def run_incremental_reschedule(
+    scheduler,
+    manager,
+    dag_df,
+    sequence_seperated_order,
+    freeze_time,
+    base_date,
+    window_days,
+    machine_rest=None,
+):
+    """기존 스케줄에서 freeze_time 이전에 시작한 작업은 고정하고 나머지만 재스케줄링합니다.
+
+    기계 자원을 새로 할당하지 않고 run_scheduler_pipeline이 반환한 scheduler/manager 상태를 그대로 갱신하므로
+    재스케줄링 시간은 전체 기간이 아니라 영향 받는 작업 수에 비례합니다.
+
+    Parameters
+    ----------
+    scheduler : Scheduler
+        run_scheduler_pipeline이 반환한 스케줄러 (스케줄 완료 상태)
+    manager : DAGGraphManager
+        같은 스케줄의 DAG 관리자
+    dag_df : pd.DataFrame
+    sequence_seperated_order : pd.DataFrame
+    freeze_time : datetime or int
+        고정 기준 시각 (datetime이면 base_date 기준 시간 슬롯으로 변환)
+    base_date : datetime
+    window_days : int
+    machine_rest : pd.DataFrame, optional
+        새로 추가할 기계 중단시간 (예: 주중 고장, machine_rest 시트와 같은 형식)
+
+    Returns
+    -------
+    (result_df, scheduler)
+    """
+    if not isinstance(freeze_time, (int, float, np.integer, np.floating)):
+        freeze_time = to_time_slot(freeze_time, base_date)
+
+    print(f"[75%] 증분 재스케줄링 실행 중... (고정 기준 슬롯: {freeze_time})")
+    strategy = IncrementalRescheduleStrategy()
+    result = strategy.execute(
+        dag_manager=manager,
+        scheduler=scheduler,
+        freeze_time=freeze_time,
+        dag_df=dag_df,
+        sequence_seperated_order=sequence_seperated_order,
+        window_days=window_days,
+        machine_rest=machine_rest,
+        base_date=base_date,
+    )
+
+    return result, scheduler
+
+
+def run_order_insertion(
+    scheduler,
+    manager,
+    new_dag_df,
+    new_sequence_seperated_order,
+    window_days,
+    release_time=0,
+    base_date=None,
+):
+    """기존 스케줄에 신규 주문 노드만 추가로 할당합니다 (이미 할당된 작업은 이동하지 않음).
+
+    신규 노드만으로 디스패치 우선순위를 만들고 기존과 같은 DispatchPriorityStrategy로 배치하므로,
+    기계 선택 시 기존 작업 사이의 빈 시간 창(공정 교체시간 포함)에 먼저 삽입됩니다.
+
+    Parameters
+    ----------
+    scheduler : Scheduler
+        run_scheduler_pipeline이 반환한 스케줄러 (스케줄 완료 상태)
+    manager : DAGGraphManager
+        신규 노드가 추가된 DAG 관리자 (extend_dag_system 결과)
+    new_dag_df : pd.DataFrame
+        신규 노드만의 DAG 데이터프레임
+    new_sequence_seperated_order : pd.DataFrame
+        신규 주문의 공정별 분리 주문
+    window_days : int
+    release_time : datetime or int
+        신규 주문 작업의 최초 시작 가능 시각 (datetime이면 base_date 기준 시간 슬롯으로 변환, 기본 0)
+    base_date : datetime, optional
+        release_time이 datetime인 경우 필수
+
+    Returns
+    -------
+    (result_df, scheduler)
+    """
+    if not isinstance(release_time, (int, float, np.integer, np.floating)):
+        if base_date is None:
+            raise ValueError("release_time이 datetime인 경우 base_date가 필요합니다")
+        release_time = to_time_slot(release_time, base_date)
+
+    new_ids = new_dag_df[config.columns.PROCESS_ID].tolist()
+    for node_id in new_ids:
+        manager.nodes[node_id].parent_node_end = [release_time]
+
+    print(f"[75%] 신규 주문 노드 {len(new_ids)}개 스케줄링 중... (시작 가능 슬롯: {release_time})")
+    priority_order, new_dag_df = create_dispatch_rule(new_dag_df, new_sequence_seperated_order)
+    strategy = DispatchPriorityStrategy()
+    result = strategy.execute(
+        dag_manager=manager,
+        scheduler=scheduler,
+        dag_df=new_dag_df,
+        priority_order=priority_order,
+        window_days=window_days,
     )
 
     return result, scheduler
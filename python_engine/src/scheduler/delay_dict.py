@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from itertools import product
 from typing import List, Dict, Tuple, Union
@@ -17,6 +18,7 @@ class DelayProcessor:
             width_change_df: 폭 변경 지연시간 규칙 데이터프레임
         """
         self.opnode_dict = opnode_dict
+        self.node_table = getattr(opnode_dict, 'table', None)  # NodeAttributeDict인 경우 배열 조회 사용
         self.machine_code_list = machine_code_list  # ★ 코드 리스트로 변경
         self.base_df = self._generate_base_df(operation_delay_df, width_change_df)
         self.final_df = self._apply_delay_conditions(operation_delay_df, width_change_df)
@@ -38,6 +40,10 @@ class DelayProcessor:
         if machine_code not in self.machine_code_list:  # ★ 코드 비교로 변경
             return 0
 
+        # NodeAttributeTable 기반 opnode_dict이면 배열에서 직접 조회
+        if self.node_table is not None:
+            return self.delay_dict.get(self._table_delay_key(item_id1, item_id2, machine_code), 0)
+
         # 기본값 딕셔너리 생성
         empty_dict = {
             "OPERATION_ORDER": 0,
@@ -55,6 +61,82 @@ class DelayProcessor:
         delay_time = self.delay_dict.get(input_key, 0)
         return delay_time
 
+    def delay_calc_pairs(self, item_ids1, item_ids2, machine_code):
+        """
+        여러 (이전, 다음) 아이템 쌍의 지연시간을 한 번에 계산 (delay_calc_whole_process의 배열 버전)
+
+        NodeAttributeTable 기반이면 지연 키 구성요소를 배열 연산으로 만든 뒤
+        고유 키 조합만 delay_dict에서 조회합니다.
+
+        Args:
+            item_ids1: 이전 아이템 ID 시퀀스
+            item_ids2: 다음 아이템 ID 시퀀스 (item_ids1과 같은 길이)
+            machine_code: 사용 기계 코드
+
+        Returns:
+            np.ndarray: 쌍별 지연시간 (float)
+        """
+        count = len(item_ids1)
+        if machine_code not in self.machine_code_list or count == 0:
+            return np.zeros(count, dtype=float)
+
+        if self.node_table is None:
+            return np.array([
+                self.delay_calc_whole_process(item_id1, item_id2, machine_code)
+                for item_id1, item_id2 in zip(item_ids1, item_ids2)
+            ], dtype=float)
+
+        table = self.node_table
+        idx1 = table.indices_of(item_ids1)
+        idx2 = table.indices_of(item_ids2)
+
+        # 인덱스 -1(미존재 노드)은 마지막에 덧붙인 기본값(empty_dict와 동일)을 가리킴
+        # 공정분류 코드: 범주 코드, -1=결측(NaN), -2=미존재 노드("")
+        type_codes = np.append(table.classification_codes, -2)
+        type_values = np.array(list(table.classification_categories) + ["", np.nan], dtype=object)  # 음수 코드로 끝에서부터 조회
+        node_widths = np.append(table.fabric_width, 0)
+        node_chemicals = np.append(table.selected_chemical, None)
+
+        earlier_codes, later_codes = type_codes[idx1], type_codes[idx2]
+        earlier_widths, later_widths = node_widths[idx1], node_widths[idx2]
+        long_to_short = earlier_widths > later_widths
+        short_to_long = earlier_widths < later_widths
+        same_type = (type_values[earlier_codes] == type_values[later_codes]).astype(bool)
+        same_chemical = (node_chemicals[idx1] == node_chemicals[idx2]).astype(bool)
+
+        # 지연 키를 정수 하나로 묶어 고유 조합별로 한 번씩만 조회
+        num_types = len(type_values)
+        packed_keys = (
+            ((earlier_codes.astype(np.int64) + 2) * num_types + (later_codes + 2)) * 16
+            + long_to_short * 8 + short_to_long * 4 + same_type * 2 + same_chemical
+        )
+        unique_keys, inverse = np.unique(packed_keys, return_inverse=True)
+
+        unique_delays = np.empty(len(unique_keys), dtype=float)
+        for i, packed_key in enumerate(unique_keys.tolist()):
+            type_pair, flags = divmod(packed_key, 16)
+            earlier, later = divmod(type_pair, num_types)
+            unique_delays[i] = self.delay_dict.get(
+                (machine_code, type_values[earlier - 2], type_values[later - 2],
+                 bool(flags & 8), bool(flags & 4), bool(flags & 2), bool(flags & 1)), 0)
+        return unique_delays[inverse]
+
+    def _node_delay_attributes(self, node_id):
+        """지연 계산에 필요한 (공정분류, 원단너비, 선택 배합액)을 테이블 배열에서 조회"""
+        table = self.node_table
+        idx = table.index_of(node_id)
+        if idx < 0:
+            return "", 0, None  # delay_calc_whole_process의 empty_dict 기본값과 동일
+        return table.classification_at(idx), table.fabric_width[idx], table.selected_chemical[idx]
+
+    def _table_delay_key(self, item_id1, item_id2, machine_code):
+        """calculate_delay()와 동일한 지연 키를 배열 조회로 계산"""
+        earlier_type, earlier_width, earlier_chemical = self._node_delay_attributes(item_id1)
+        later_type, later_width, later_chemical = self._node_delay_attributes(item_id2)
+        return (machine_code, earlier_type, later_type,
+                bool(earlier_width > later_width), bool(earlier_width < later_width),
+                earlier_type == later_type, earlier_chemical == later_chemical)
+
     def _generate_base_df(self, operation_delay_df, width_change_df) -> pd.DataFrame:
         """
         지연 규칙 관련 컬럼으로 기본 데이터프레임 생성 (V5 방식)
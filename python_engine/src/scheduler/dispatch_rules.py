@@ -1,62 +1,164 @@
 import heapq
 import pandas as pd
 import numpy as np
-from collections import defaultdict
 from config import config
+from src.dag_management.dag_manager import DAGGraphManager
 
-def create_dispatch_rule(dag_df, sequence_seperated_order):
+def build_csr_adjacency(parent_idx, child_idx, num_nodes):
+    """
+    (부모, 자식) 정수 간선 목록을 CSR 인접 배열로 변환
+
+    같은 부모의 자식 순서는 입력 간선 순서를 유지합니다 (stable 정렬).
+
+    Args:
+        parent_idx (np.ndarray): 간선의 부모 정수 ID
+        child_idx (np.ndarray): 간선의 자식 정수 ID
+        num_nodes (int): 노드 수
+
+    Returns:
+        tuple: (indptr, indices) - 노드 i의 자식은 indices[indptr[i]:indptr[i+1]]
+    """
+    order = np.argsort(parent_idx, kind='stable')
+    indices = np.asarray(child_idx, dtype=np.int64)[order]
+    counts = np.bincount(parent_idx, minlength=num_nodes)
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    return indptr, indices
+
+
+class _DispatchKeys:
+    """
+    정렬 키 (납기일, -원단너비, ID)의 배열 보관 및 비교
+
+    결측 키(납기일 NaT, 너비 NaN)가 없는 노드는 lexsort 순위(정수)로 비교하고,
+    결측 키가 있는 노드(숙성 노드 등)는 기존 튜플 비교와 동일한 규칙으로 비교합니다.
+    - NaT끼리는 같은 값(동일 객체)으로 보고 다음 키로 넘어감
+    - NaT와 날짜, NaN과 숫자/NaN 비교는 항상 False
+    """
+
+    def __init__(self, due, neg_width, id_rank):
+        self.due_nat = np.isnat(due)
+        self.due = due.astype(np.int64)
+        self.width_nan = np.isnan(neg_width)
+        self.neg_width = neg_width
+        self.id_rank = id_rank
+        self.has_missing = self.due_nat | self.width_nan
+
+        # 결측 없는 노드: (납기일, -너비, ID) lexsort 순위
+        complete = np.flatnonzero(~self.has_missing)
+        order = complete[np.lexsort((id_rank[complete], neg_width[complete], self.due[complete]))]
+        self.rank = np.full(len(due), -1, dtype=np.int64)
+        self.rank[order] = np.arange(len(order))
+        self.node_of_rank = order
+
+    def heap_item(self, node):
+        if self.has_missing[node]:
+            return _MissingKeyItem(node, self)
+        return int(self.rank[node])
+
+    def node_of(self, item):
+        if isinstance(item, _MissingKeyItem):
+            return item.node
+        return int(self.node_of_rank[item])
+
+    def less(self, a, b):
+        """기존 (due, -width, id) 튜플의 a < b 결과"""
+        if self.due_nat[a] or self.due_nat[b]:
+            if not (self.due_nat[a] and self.due_nat[b]):
+                return False
+        elif self.due[a] != self.due[b]:
+            return bool(self.due[a] < self.due[b])
+        if self.width_nan[a] or self.width_nan[b]:
+            return False
+        if self.neg_width[a] != self.neg_width[b]:
+            return bool(self.neg_width[a] < self.neg_width[b])
+        return bool(self.id_rank[a] < self.id_rank[b])
+
+
+class _MissingKeyItem:
+    """결측 키 노드의 heap 항목 (정수 순위 항목과 섞여 비교됨)"""
+
+    __slots__ = ("node", "keys")
+
+    def __init__(self, node, keys):
+        self.node = node
+        self.keys = keys
+
+    def __lt__(self, other):
+        return self.keys.less(self.node, self.keys.node_of(other))
+
+    def __gt__(self, other):
+        return self.keys.less(self.keys.node_of(other), self.node)
+
+
+def create_dispatch_rule(dag_df, sequence_seperated_order, tie_break_seed=None):
+    """
+    디스패치 우선순위 생성 (납기일 → 원단너비 내림차순 → ID 순 위상정렬)
+
+    노드 ID를 정수로 인턴하고, 인접 관계는 CSR 배열, 진입차수는 NumPy 배열로 처리합니다.
+
+    Args:
+        dag_df (pd.DataFrame): DAG 데이터프레임
+        sequence_seperated_order (pd.DataFrame): 공정별 분리 주문 데이터
+        tie_break_seed (int, optional): 지정하면 마지막 키(ID 순)를 이 시드의 무작위 순서로 대체
+            (납기일/원단너비가 같은 노드의 순서만 바뀜, 멀티스타트 디스패치용)
+
+    Returns:
+        tuple: (우선순위 노드 ID 리스트, 납기일/원단너비가 병합된 dag_df)
+    """
     # --- 전처리 ---
     dag_df = pd.merge(dag_df, sequence_seperated_order[[config.columns.DUE_DATE, config.columns.FABRIC_WIDTH, config.columns.PROCESS_ID]], on=config.columns.PROCESS_ID, how='left')
-    dag_df[config.columns.CHILDREN] = dag_df[config.columns.CHILDREN].apply(lambda x: x if isinstance(x, list) else eval(x) if isinstance(x, str) and len(x)>0 else [])
-    
-    # child → parent 맵, 그리고 parent → children 맵 구축
-    children_map = defaultdict(list)
-    parents_map = defaultdict(list)
-    for idx, row in dag_df.iterrows():
-        parent = row[config.columns.PROCESS_ID]
-        for child in row[config.columns.CHILDREN]:
-            children_map[parent].append(child)
-            parents_map[child].append(parent)
-    
-    all_ids = sorted(dag_df[config.columns.PROCESS_ID])
-    # set 사용시 비결정적 순서 발생 가능성 있음
-    # all_ids = set(dag_df[config.columns.PROCESS_ID])
-    
-    # 본인 기준 parents 개수 계산: 선행해야 하는 작업수
-    in_degree = {}
-    for idx, row in dag_df.iterrows():
-        node = row[config.columns.PROCESS_ID]
-        # depth 기준으로 진입차수(선행 필요 갯수) 설정
-        if row[config.columns.DEPTH] == 1:
-            in_degree[node] = 0  # 바로 처리 가능
-        else:
-            # 자신을 child로 가지고 있는 노드 수 → 부모 수
-            in_degree[node] = len(parents_map[node])
-    
-    # 납기일, 너비, id 정보 dict 빠르게 접근
-    due_dict = dag_df.set_index(config.columns.PROCESS_ID)[config.columns.DUE_DATE].to_dict()
-    width_dict = dag_df.set_index(config.columns.PROCESS_ID)[config.columns.FABRIC_WIDTH].to_dict()
-    
+    dag_df[config.columns.CHILDREN] = dag_df[config.columns.CHILDREN].apply(DAGGraphManager.parse_list)
+
+    # 노드 ID 정수 인턴
+    row_ids = dag_df[config.columns.PROCESS_ID].to_numpy(dtype=object)
+    row_nodes, node_ids = pd.factorize(row_ids)
+    node_ids = np.asarray(node_ids, dtype=object)
+    num_nodes = len(node_ids)
+    node_index = pd.Index(node_ids)
+
+    # parent → children CSR (행 순서, 자식 리스트 순서 유지)
+    children = dag_df[config.columns.CHILDREN]
+    child_counts = children.str.len().to_numpy(dtype=np.int64)
+    edge_parent = np.repeat(row_nodes, child_counts)
+    edge_child = node_index.get_indexer(children.explode().dropna().to_numpy(dtype=object)) if child_counts.sum() else np.empty(0, dtype=np.int64)
+    # dag_df에 없는 자식 노드는 제외
+    valid_edge = edge_child >= 0
+    edge_parent, edge_child = edge_parent[valid_edge], edge_child[valid_edge]
+    indptr, indices = build_csr_adjacency(edge_parent, edge_child, num_nodes)
+
+    # 진입차수: 부모 수, depth 1은 바로 처리 가능 (중복 행은 마지막 행 기준)
+    in_degree = np.bincount(edge_child, minlength=num_nodes).astype(np.int64)
+    last_rows = dag_df.drop_duplicates(subset=config.columns.PROCESS_ID, keep='last')
+    last_nodes = node_index.get_indexer(last_rows[config.columns.PROCESS_ID].to_numpy(dtype=object))
+    in_degree[last_nodes[last_rows[config.columns.DEPTH].to_numpy() == 1]] = 0
+
+    # 정렬 키 배열 (노드별 마지막 행 값)
+    due = np.empty(num_nodes, dtype='datetime64[ns]')
+    due[last_nodes] = pd.to_datetime(last_rows[config.columns.DUE_DATE]).to_numpy(dtype='datetime64[ns]')
+    neg_width = np.empty(num_nodes, dtype=np.float64)
+    neg_width[last_nodes] = -last_rows[config.columns.FABRIC_WIDTH].to_numpy(dtype=np.float64)
+    id_rank = np.empty(num_nodes, dtype=np.int64)
+    id_rank[np.argsort(node_ids, kind='stable')] = np.arange(num_nodes)
+    if tie_break_seed is not None:
+        id_rank = np.random.default_rng(tie_break_seed).permutation(num_nodes)
+    keys = _DispatchKeys(due, neg_width, id_rank)
+
     # --- 우선순위 큐 활용 Topological Sort ---
-    # heap 항목: (납기일, -원단너비, ID 순)로 heapq 사용
     ready = []
-    for node in all_ids:
+    for node in row_nodes[np.argsort(id_rank[row_nodes], kind='stable')].tolist():
         if in_degree[node] == 0:
-            heapq.heappush(ready, (due_dict[node], -width_dict[node], node))
-    
+            heapq.heappush(ready, keys.heap_item(node))
+
     answer = []
+    in_degree, indptr, indices = in_degree.tolist(), indptr.tolist(), indices.tolist()
     while ready:
-        # 우선순위 조건대로 pop
-        _, _, current = heapq.heappop(ready)
-        answer.append(current)
-        # current가 child로 있는 parent의 in_degree 줄이기
-        for child in children_map[current]:
+        current = keys.node_of(heapq.heappop(ready))
+        answer.append(node_ids[current])
+        for child in indices[indptr[current]:indptr[current + 1]]:
             in_degree[child] -= 1
             if in_degree[child] == 0:
-                heapq.heappush(
-                    ready,
-                    (due_dict[child], -width_dict[child], child)
-                )
+                heapq.heappush(ready, keys.heap_item(child))
 
     return answer, dag_df
 
@@ -0,0 +1,274 @@
+"""
+병렬 유전 알고리즘(GA) 스케줄 최적화 모듈
+
+염색체 = (노드별 우선순위 키, 노드별 기계 배정). 우선순위 키로 DAG 위상 순서를 만들고
+기계별로 걸러 작업 순서를 얻은 뒤 ScheduleKernel로 평가합니다 (위상 순서 기반이라 순환이 생기지 않음).
+
+- 적합도 평가는 프로세스 풀(src.utils.ForkPool)에서 수행하며, 커널/디코더는 fork 전에 공유 상태로 올려두고
+  자식 프로세스가 읽기 전용으로 참조합니다 (DAG를 pickle로 전달하지 않음)
+- 난수는 부모 프로세스의 seed 하나로만 생성하므로 같은 seed + 세대 수면 같은 결과
+- 초기 집단에 디스패치 결과를 넣고 엘리트를 보존하며, 탐색으로 찾은 해가 objective 기준으로
+  현재 스케줄보다 나은 경우에만 반영 (비교 키 앞쪽 지표만 보장하며, 예를 들어 'lateness'는 교체시간을
+  줄이려고 makespan을 늘릴 수 있음. makespan을 우선하려면 objective='makespan')
+"""
+
+import heapq
+import time
+
+import numpy as np
+from src.utils import ForkPool
+from .schedule_kernel import ScheduleKernel, OBJECTIVES, UNAVAILABLE_PROCESSING_TIME
+
+
+class ChromosomeDecoder:
+    """염색체 (우선순위 키, 기계 배정) → 기계별 작업 순서"""
+
+    def __init__(self, kernel, objective_key=ScheduleKernel.objective):
+        self.kernel = kernel
+        self.objective_key = objective_key
+        count = len(kernel.node_ids)
+        self.children = [
+            kernel.child_idx[kernel.child_ptr[i]:kernel.child_ptr[i + 1]].tolist() for i in range(count)
+        ]
+        self.parent_count = kernel.parent_count.tolist()
+        # 노드별 처리 가능 기계 인덱스 (Aging은 빈 배열)
+        self.eligible = [
+            np.array([], dtype=np.int64) if kernel.is_aging[i]
+            else np.flatnonzero(kernel.processing_times[i] != UNAVAILABLE_PROCESSING_TIME)
+            for i in range(count)
+        ]
+
+    def decode(self, keys, machines):
+        """
+        우선순위 키가 작은 준비 노드부터 꺼내는 위상 정렬 후 기계별로 분리
+
+        Returns:
+            dict: {machine_code: [node_id, ...]}
+        """
+        kernel = self.kernel
+        remaining = list(self.parent_count)
+        keys = keys.tolist()
+        ready = [(keys[i], i) for i, count in enumerate(remaining) if count == 0]
+        heapq.heapify(ready)
+
+        sequences = {machine_code: [] for machine_code in kernel.machine_codes}
+        while ready:
+            _, i = heapq.heappop(ready)
+            if machines[i] >= 0:
+                sequences[kernel.machine_codes[machines[i]]].append(kernel.node_ids[i])
+            for child in self.children[i]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    heapq.heappush(ready, (keys[child], child))
+        return sequences
+
+    def fitness(self, chromosome):
+        """염색체 비교 키 (objective_key(평가 지표), 작을수록 좋음)"""
+        keys, machines = chromosome
+        return self.objective_key(self.kernel.evaluate(self.decode(keys, machines)))
+
+
+def _evaluate_worker(state, chromosomes):
+    """ForkPool 작업 함수: fork로 물려받은 디코더로 염색체 묶음 평가"""
+    decoder = state['decoder']
+    return [decoder.fitness(chromosome) for chromosome in chromosomes]
+
+
+class GeneticOptimizer:
+    """
+    디스패치 결과를 초기 해로 포함하는 엘리트 보존 GA
+
+    Example:
+        optimizer = GeneticOptimizer(scheduler, manager, sequence_seperated_order, base_date, seed=0)
+        stats = optimizer.run(time_budget=30.0, max_workers=4)   # 개선된 경우 scheduler / manager에 반영
+    """
+
+    def __init__(self, scheduler, dag_manager, sequence_seperated_order, base_date,
+                 population_size=40, elite_size=4, crossover_rate=0.9, mutation_rate=0.05,
+                 tournament_size=3, seed=0, objective='lateness'):
+        """
+        Args:
+            scheduler: 스케줄링 완료된 Scheduler 인스턴스 (DispatchPriorityStrategy 결과)
+            dag_manager: 같은 스케줄의 DAGGraphManager
+            sequence_seperated_order (pd.DataFrame): 공정별 분리 주문
+            base_date (datetime): 기준 날짜
+            population_size (int): 집단 크기
+            elite_size (int): 다음 세대로 그대로 넘기는 상위 염색체 수
+            crossover_rate (float): 교차 확률 (균등 교차)
+            mutation_rate (float): 유전자별 변이 확률
+            tournament_size (int): 토너먼트 선택 크기
+            seed (int): 난수 시드
+            objective (str or callable): 'lateness'(지각 주문 수 → 총 지각시간 → 교체시간 → makespan), 'makespan', 'setup'
+                또는 평가 지표 dict를 받아 비교 키를 반환하는 함수 (run_multistart_dispatch와 같음)
+        """
+        if elite_size >= population_size:
+            raise ValueError("elite_size는 population_size보다 작아야 합니다")
+        self.scheduler = scheduler
+        self.dag_manager = dag_manager
+        self.kernel = ScheduleKernel(scheduler, dag_manager, sequence_seperated_order, base_date)
+        self.objective_key = OBJECTIVES[objective] if isinstance(objective, str) else objective
+        self.decoder = ChromosomeDecoder(self.kernel, self.objective_key)
+        self.population_size = population_size
+        self.elite_size = elite_size
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.tournament_size = tournament_size
+        self.rng = np.random.default_rng(seed)
+
+    # ===================================================================
+    # 염색체 연산
+    # ===================================================================
+    def _incumbent_chromosome(self):
+        """현재 스케줄 → 염색체 (키 = 시작 시간 순위, 기계 = 배정 기계)"""
+        kernel = self.kernel
+        nodes = self.dag_manager.nodes
+        order = sorted(
+            range(len(kernel.node_ids)),
+            key=lambda i: (nodes[kernel.node_ids[i]].node_start, nodes[kernel.node_ids[i]].node_end, i),
+        )
+        keys = np.empty(len(order), dtype=float)
+        keys[order] = np.arange(len(order)) / max(len(order), 1)
+        machines = np.array([
+            -1 if kernel.is_aging[i] else kernel.machine_index[nodes[node_id].machine]
+            for i, node_id in enumerate(kernel.node_ids)
+        ], dtype=np.int64)
+        return keys, machines
+
+    def _random_machine(self, i):
+        eligible = self.decoder.eligible[i]
+        return eligible[self.rng.integers(len(eligible))] if len(eligible) else -1
+
+    def _random_chromosome(self):
+        count = len(self.kernel.node_ids)
+        return self.rng.random(count), np.array([self._random_machine(i) for i in range(count)], dtype=np.int64)
+
+    def _mutate(self, chromosome, rate):
+        keys, machines = chromosome[0].copy(), chromosome[1].copy()
+        key_mask = self.rng.random(len(keys)) < rate
+        keys[key_mask] = self.rng.random(int(key_mask.sum()))
+        for i in np.flatnonzero(self.rng.random(len(machines)) < rate).tolist():
+            machines[i] = self._random_machine(i)
+        return keys, machines
+
+    def _crossover(self, first, second):
+        mask = self.rng.random(len(first[0])) < 0.5
+        return np.where(mask, first[0], second[0]), np.where(mask, first[1], second[1])
+
+    def _tournament(self, fitness):
+        contestants = self.rng.integers(len(fitness), size=self.tournament_size).tolist()
+        return min(contestants, key=lambda index: fitness[index])
+
+    # ===================================================================
+    # 실행
+    # ===================================================================
+    def _evaluate(self, chromosomes, pool):
+        if not pool.use_processes:
+            return [self.decoder.fitness(chromosome) for chromosome in chromosomes]
+        chunk_size = -(-len(chromosomes) // pool.max_workers)
+        chunks = [chromosomes[i:i + chunk_size] for i in range(0, len(chromosomes), chunk_size)]
+        return [value for chunk in pool.map(_evaluate_worker, chunks) for value in chunk]
+
+    def run(self, time_budget=30.0, max_generations=None, max_workers=None):
+        """
+        시간 예산 안에서 세대 반복 (예산은 세대 단위로 확인)
+
+        Args:
+            time_budget (float): 탐색 시간 예산 (초, wall-clock)
+            max_generations (int, optional): 최대 세대 수 (지정하면 같은 seed에서 결과 재현)
+            max_workers (int, optional): 적합도 평가 프로세스 수. 1이거나 fork를 지원하지 않으면 현재 프로세스에서 평가
+
+        Returns:
+            dict: {'generations', 'evaluations', 'initial_objective', 'decoded_objective', 'objective', 'elapsed', 'applied'}
+                objective 계열 = objective 비교 키 (기본 (지각 주문 수, 총 지각시간(슬롯), 총 공정교체시간, makespan)),
+                decoded_objective = 디스패치 해 염색체를 커널로 다시 계산한 값 (재타이밍이라 현재 스케줄과 다를 수 있음)
+        """
+        started = time.perf_counter()
+        deadline = started + time_budget
+
+        incumbent = self._incumbent_chromosome()
+        incumbent_objective = self.objective_key(self.kernel.schedule_metrics(self.scheduler, self.dag_manager))
+        print(f"[GA] 시작 - 현재 목적함수 {incumbent_objective}, 집단 {self.population_size}, 예산 {time_budget:.1f}s")
+
+        # 초기 집단: 디스패치 해 + 디스패치 변형 절반 + 무작위
+        population = [incumbent]
+        while len(population) < self.population_size:
+            if len(population) < self.population_size // 2:
+                population.append(self._mutate(incumbent, self.mutation_rate * 4))
+            else:
+                population.append(self._random_chromosome())
+
+        # 디코더(커널/DAG)는 fork로 물려주고 염색체만 전달
+        with ForkPool({'decoder': self.decoder}, max_workers=max_workers) as pool:
+            fitness = self._evaluate(population, pool)
+            decoded_objective = fitness[0]
+            evaluations = len(population)
+            generations = 0
+            while time.perf_counter() < deadline and (max_generations is None or generations < max_generations):
+                generations += 1
+                ranked = sorted(range(len(population)), key=lambda index: fitness[index])
+                next_population = [population[index] for index in ranked[:self.elite_size]]
+                next_fitness = [fitness[index] for index in ranked[:self.elite_size]]
+
+                offspring = []
+                while len(next_population) + len(offspring) < self.population_size:
+                    first = population[self._tournament(fitness)]
+                    if self.rng.random() < self.crossover_rate:
+                        child = self._crossover(first, population[self._tournament(fitness)])
+                    else:
+                        child = first
+                    offspring.append(self._mutate(child, self.mutation_rate))
+
+                population = next_population + offspring
+                fitness = next_fitness + self._evaluate(offspring, pool)
+                evaluations += len(offspring)
+
+        best = min(range(len(population)), key=lambda index: fitness[index])
+        best_objective = fitness[best]
+        # 디스패치 해를 다시 계산한 것(재타이밍)보다 나은 탐색 결과이면서 현재 스케줄보다 나을 때만 반영
+        applied = best_objective < decoded_objective and best_objective < incumbent_objective
+        if applied:
+            sequences = self.decoder.decode(*population[best])
+            self.kernel.write_back(self.scheduler, self.dag_manager, sequences, self.kernel.evaluate(sequences))
+
+        elapsed = time.perf_counter() - started
+        final_objective = best_objective if applied else incumbent_objective
+        print(f"[GA] 완료 - {generations}세대, 평가 {evaluations}회 ({'process' if pool.use_processes else 'sequential'}), "
+              f"목적함수 {incumbent_objective} → {final_objective} ({elapsed:.2f}s)")
+        return {
+            'generations': generations,
+            'evaluations': evaluations,
+            'initial_objective': incumbent_objective,
+            'decoded_objective': decoded_objective,
+            'objective': final_objective,
+            'elapsed': elapsed,
+            'applied': applied,
+        }
+
+
+def optimize_schedule_ga(scheduler, dag_manager, sequence_seperated_order, base_date,
+                         time_budget=30.0, population_size=40, seed=0, max_generations=None, max_workers=None,
+                         objective='lateness'):
+    """
+    디스패치 결과에 GA 최적화를 적용 (개선된 경우에만 scheduler / dag_manager 제자리 갱신)
+
+    Args:
+        scheduler: 스케줄링 완료된 Scheduler 인스턴스
+        dag_manager: 같은 스케줄의 DAGGraphManager
+        sequence_seperated_order (pd.DataFrame): 공정별 분리 주문
+        base_date (datetime): 기준 날짜
+        time_budget (float): 탐색 시간 예산 (초)
+        population_size (int): 집단 크기
+        seed (int): 난수 시드
+        max_generations (int, optional): 최대 세대 수
+        max_workers (int, optional): 적합도 평가 프로세스 수 (1이면 순차 평가)
+        objective (str or callable): 비교 기준 ('lateness' | 'makespan' | 'setup' | 평가 지표 dict → 비교 키 함수)
+
+    Returns:
+        tuple: (result_df, stats) - result_df는 dag_manager.to_dataframe()
+    """
+    optimizer = GeneticOptimizer(
+        scheduler, dag_manager, sequence_seperated_order, base_date,
+        population_size=population_size, seed=seed, objective=objective
+    )
+    stats = optimizer.run(time_budget=time_budget, max_generations=max_generations, max_workers=max_workers)
+    return dag_manager.to_dataframe(), stats
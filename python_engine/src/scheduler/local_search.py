@@ -0,0 +1,508 @@
+"""
+시간 예산 기반 지역 탐색(local search) 개선 모듈
+
+DispatchPriorityStrategy 결과(기계별 작업 순서)를 시작점으로 이동을 반복 적용해
+지각 주문 수 → 총 지각시간 → 총 공정교체시간 → makespan 순(사전식)으로 스케줄을 개선합니다.
+
+- 이동: 같은 기계 내 swap / insert, 기계 간 이동 / swap, 같은 배합액 작업 그룹 병합
+- 평가: 이동으로 순서가 바뀐 위치 이후 작업과 그 DAG/기계 후속 작업만 다시 계산하는 증분 평가
+- 시간 예산(wall-clock)이 끝나면 지금까지의 최선 해를 Scheduler / DAGNode 상태에 반영
+
+반영되는 스케줄은 최선 순서를 평가기로 다시 계산한 시간(재타이밍)입니다. 디스패치는 작업 배치 당시의
+배합액으로 교체시간을 잡고 이후 SELECTED_CHEMICAL이 바뀌기도 하므로, 이동이 없어도 재계산 시간은
+디스패치 시간과 다를 수 있습니다. 그래서 채택된 이동이 있을 때만 반영합니다.
+이동 후 배합액 선택은 다시 하지 않습니다 (디스패치 때의 SELECTED_CHEMICAL 기준으로 교체시간 평가).
+"""
+
+import random
+import time
+from collections import defaultdict
+
+import numpy as np
+from .schedule_kernel import ScheduleKernel, UNAVAILABLE_PROCESSING_TIME
+
+
+MOVE_TYPES = ('swap', 'insert', 'move_machine', 'swap_machine', 'chemical_merge')
+
+
+class ScheduleEvaluator:
+    """
+    기계별 작업 순서 → 시작/종료 시간 및 목적함수 증분 평가기
+
+    시간 계산 규칙은 ScheduleKernel과 같습니다 (전체 평가는 ScheduleKernel.evaluate,
+    증분 평가도 커널의 교체시간 캐시와 DOWNTIME 배치(place)를 사용):
+        - 일반 작업: max(부모 종료, 같은 기계 직전 작업 종료 + 공정교체시간)에 시작하며,
+          DOWNTIME 구간과 겹치면 DOWNTIME 종료 + 교체시간 이후로 밀림
+        - Aging 작업: 모든 부모 종료 즉시 시작 (aging 기계는 중복 허용)
+    노드는 커널의 정수 인덱스를 그대로 쓰고 시간/교체시간은 리스트로 보관합니다.
+    """
+
+    def __init__(self, scheduler, dag_manager, sequence_seperated_order, base_date, kernel=None):
+        """
+        Args:
+            scheduler: 스케줄링 완료된 Scheduler 인스턴스
+            dag_manager: 같은 스케줄의 DAGGraphManager
+            sequence_seperated_order (pd.DataFrame): 공정별 분리 주문 (납기일, P/O 매핑)
+            base_date (datetime): 기준 날짜
+            kernel (ScheduleKernel, optional): 같은 스케줄로 만든 커널 (없으면 생성)
+        """
+        self.scheduler = scheduler
+        self.dag_manager = dag_manager
+        self.kernel = kernel or ScheduleKernel(scheduler, dag_manager, sequence_seperated_order, base_date)
+        kernel = self.kernel
+
+        self.ids = kernel.node_ids.tolist()
+        self.index = kernel.index
+        count = len(self.ids)
+
+        self.is_aging = kernel.is_aging.tolist()
+        self.children = kernel.children
+        self.parents = [[] for _ in range(count)]
+        for i, child_list in enumerate(self.children):
+            for child in child_list:
+                self.parents[child].append(i)
+        self._processing_times = kernel.processing_times.tolist()
+        self._aging_times = kernel.aging_time.tolist()
+        self._eligible = [
+            [kernel.machine_codes[m] for m, processing_time in enumerate(row) if processing_time != UNAVAILABLE_PROCESSING_TIME]
+            for row in self._processing_times
+        ]
+
+        # 기계별 작업 순서 (DOWNTIME 제외)
+        self.sequences = {
+            machine_code: [self.index[node_id] for node_id in sequence]
+            for machine_code, sequence in kernel.current_sequences(scheduler).items()
+        }
+
+        self.machine_of = [None] * count
+        self.position_of = [0] * count
+        for machine_code, sequence in self.sequences.items():
+            self._reindex(machine_code)
+        for i, node_id in enumerate(self.ids):
+            if self.is_aging[i]:
+                self.machine_of[i] = 'AGING'
+
+        # P/O별 노드 / 납기 (커널의 P/O CSR에서 구성, 결과 리포트와 같이 P/O 기준으로 지각 판정)
+        self.order_nodes = {}
+        self.order_due = {}
+        self.orders_of = defaultdict(list)
+        for k, po_no in enumerate(kernel.order_numbers):
+            node_indices = set(kernel.order_node_idx[kernel.order_ptr[k]:kernel.order_ptr[k + 1]].tolist())
+            self.order_nodes[po_no] = node_indices
+            if not np.isnan(kernel.order_due[k]):
+                self.order_due[po_no] = float(kernel.order_due[k])
+            for i in node_indices:
+                self.orders_of[i].append(po_no)
+
+        self.start = [0] * count
+        self.end = [0] * count
+        self.setup = [0] * count
+        self.completion = {}
+        self.objective = None
+        self.evaluate_all()
+
+    # ===================================================================
+    # 준비
+    # ===================================================================
+    def _reindex(self, machine_code):
+        for position, i in enumerate(self.sequences[machine_code]):
+            self.machine_of[i] = machine_code
+            self.position_of[i] = position
+
+    def processing_time(self, i, machine_code):
+        """machine_code에서 노드 i의 처리시간 (불가능하면 9999)"""
+        return self._processing_times[i][self.kernel.machine_index[machine_code]]
+
+    def eligible_machines(self, i):
+        """노드 i를 처리할 수 있는 기계 코드 목록"""
+        return self._eligible[i]
+
+    # ===================================================================
+    # 시간 계산
+    # ===================================================================
+    def _predecessors(self, i):
+        predecessors = list(self.parents[i])
+        if not self.is_aging[i] and self.position_of[i] > 0:
+            predecessors.append(self.sequences[self.machine_of[i]][self.position_of[i] - 1])
+        return predecessors
+
+    def _successors(self, i):
+        successors = list(self.children[i])
+        if not self.is_aging[i]:
+            sequence = self.sequences[self.machine_of[i]]
+            if self.position_of[i] + 1 < len(sequence):
+                successors.append(sequence[self.position_of[i] + 1])
+        return successors
+
+    def _task_times(self, i, ready, end_of):
+        """노드 i의 (시작, 종료, 교체시간) 계산. end_of(j)는 갱신 중인 종료 시간 조회"""
+        if self.is_aging[i]:
+            return ready, ready + self._aging_times[i], 0
+
+        machine_code = self.machine_of[i]
+        m = self.kernel.machine_index[machine_code]
+        processing_time = self._processing_times[i][m]
+        position = self.position_of[i]
+        if position > 0:
+            previous = self.sequences[machine_code][position - 1]
+            setup = self.kernel.pair_setup(m, previous, i)
+            start = max(ready, end_of(previous) + setup)
+        else:
+            setup = 0
+            start = ready
+
+        # DOWNTIME 구간과 겹치면 구간 종료 후로 이동 (DOWNTIME 다음 작업의 교체시간 적용)
+        if self.kernel.machine_downtimes[m]:
+            start, setup = self.kernel.place(i, m, start, processing_time, setup)
+        return start, start + processing_time, setup
+
+    def _propagate(self, seeds):
+        """
+        seeds와 그 후속 작업(DAG 자식 + 같은 기계 다음 작업)의 시간만 위상 순서로 다시 계산
+
+        Returns:
+            dict or None: {노드: (시작, 종료, 교체시간)} (순환이 생겨 계산할 수 없으면 None)
+        """
+        affected = set(seeds)
+        stack = list(seeds)
+        while stack:
+            for successor in self._successors(stack.pop()):
+                if successor not in affected:
+                    affected.add(successor)
+                    stack.append(successor)
+
+        indegree = {}
+        for i in affected:
+            indegree[i] = sum(1 for predecessor in self._predecessors(i) if predecessor in affected)
+        ready_nodes = [i for i, degree in indegree.items() if degree == 0]
+
+        updated = {}
+        end_of = lambda j: updated[j][1] if j in updated else self.end[j]
+        while ready_nodes:
+            i = ready_nodes.pop()
+            ready = max((end_of(parent) for parent in self.parents[i]), default=0)
+            updated[i] = self._task_times(i, ready, end_of)
+            for successor in self._successors(i):
+                if successor in indegree:
+                    indegree[successor] -= 1
+                    if indegree[successor] == 0:
+                        ready_nodes.append(successor)
+
+        if len(updated) < len(affected):
+            return None
+        return updated
+
+    # ===================================================================
+    # 목적함수
+    # ===================================================================
+    def _order_state(self, po_no, end_of):
+        completion = max(end_of(i) for i in self.order_nodes[po_no])
+        due = self.order_due.get(po_no)
+        tardiness = max(0.0, completion - due) if due is not None else 0.0
+        return completion, tardiness
+
+    def evaluate_all(self):
+        """전체 노드 시간과 목적함수 계산 (ScheduleKernel.evaluate, 순환이면 ValueError)"""
+        evaluation = self.kernel.evaluate(self.node_sequences())
+        self.start = evaluation['start'].tolist()
+        self.end = evaluation['end'].tolist()
+        self.setup = evaluation['setup'].tolist()
+
+        end_of = self.end.__getitem__
+        self.completion = {po_no: self._order_state(po_no, end_of) for po_no in self.order_nodes}
+        self.objective = ScheduleKernel.objective(evaluation)
+        return self.objective
+
+    def node_sequences(self):
+        """현재 기계별 순서 (노드 ID, ScheduleKernel.evaluate 입력 형식)"""
+        return {machine_code: [self.ids[i] for i in sequence] for machine_code, sequence in self.sequences.items()}
+
+    def try_change(self, seeds):
+        """
+        순서가 바뀐 위치의 노드(seeds)로 증분 평가
+
+        Returns:
+            tuple or None: (목적함수, 갱신 정보) - commit()에 전달. 순환이면 None
+        """
+        updated = self._propagate(seeds)
+        if updated is None:
+            return None
+
+        end_of = lambda j: updated[j][1] if j in updated else self.end[j]
+        late, total_tardiness, total_setup, makespan = self.objective
+
+        order_changes = {}
+        for po_no in {po_no for i in updated for po_no in self.orders_of[i]}:
+            old_completion, old_tardiness = self.completion[po_no]
+            new_completion, new_tardiness = self._order_state(po_no, end_of)
+            order_changes[po_no] = (new_completion, new_tardiness)
+            late += (new_tardiness > 0) - (old_tardiness > 0)
+            total_tardiness += new_tardiness - old_tardiness
+
+        total_setup += sum(setup - self.setup[i] for i, (_, _, setup) in updated.items())
+
+        new_max = max(end for _, end, _ in updated.values())
+        if new_max >= makespan:
+            makespan = new_max
+        elif any(self.end[i] == makespan for i in updated):
+            makespan = max(max(end_of(j) for j in range(len(self.ids)) if j not in updated), new_max)
+
+        return (late, total_tardiness, total_setup, makespan), (updated, order_changes)
+
+    def commit(self, objective, change):
+        """try_change 결과 반영"""
+        updated, order_changes = change
+        for i, (start, end, setup) in updated.items():
+            self.start[i], self.end[i], self.setup[i] = start, end, setup
+        self.completion.update(order_changes)
+        self.objective = objective
+
+    # ===================================================================
+    # 이동 적용 / 되돌리기
+    # ===================================================================
+    def apply_sequences(self, new_sequences):
+        """
+        기계 작업 순서 교체 후 바뀐 위치의 노드 반환
+
+        Args:
+            new_sequences (dict): {machine_code: 새 순서 리스트}
+
+        Returns:
+            tuple: (seeds, 되돌리기용 이전 순서)
+        """
+        previous = {}
+        seeds = []
+        for machine_code, sequence in new_sequences.items():
+            old_sequence = self.sequences[machine_code]
+            previous[machine_code] = old_sequence
+            first_changed = 0
+            while (first_changed < len(old_sequence) and first_changed < len(sequence)
+                   and old_sequence[first_changed] == sequence[first_changed]):
+                first_changed += 1
+            self.sequences[machine_code] = sequence
+            self._reindex(machine_code)
+            seeds.extend(sequence[first_changed:])
+        return seeds, previous
+
+    def restore_sequences(self, previous):
+        for machine_code, sequence in previous.items():
+            self.sequences[machine_code] = sequence
+            self._reindex(machine_code)
+
+    def snapshot(self):
+        """현재 해 (기계 순서, 시간) 복사본"""
+        return {machine_code: list(sequence) for machine_code, sequence in self.sequences.items()}, \
+            list(self.start), list(self.end)
+
+
+class LocalSearchImprover:
+    """
+    디스패치 결과를 시작점으로 한 시간 예산 지역 탐색
+
+    Example:
+        improver = LocalSearchImprover(scheduler, manager, sequence_seperated_order, base_date, seed=0)
+        stats = improver.run(time_budget=10.0)   # 개선된 경우 scheduler / manager에 반영
+    """
+
+    def __init__(self, scheduler, dag_manager, sequence_seperated_order, base_date, seed=0):
+        self.scheduler = scheduler
+        self.dag_manager = dag_manager
+        self.evaluator = ScheduleEvaluator(scheduler, dag_manager, sequence_seperated_order, base_date)
+        self.kernel = self.evaluator.kernel
+        self.rng = random.Random(seed)
+        self._late_nodes_cache = None  # 이동 채택 시 무효화
+
+    # ===================================================================
+    # 이동 생성
+    # ===================================================================
+    def _late_nodes(self):
+        """지각 주문의 (aging 제외) 노드 목록 (채택된 이동이 없으면 캐시 사용)"""
+        if self._late_nodes_cache is None:
+            evaluator = self.evaluator
+            self._late_nodes_cache = [
+                i for po_no, (_, tardiness) in evaluator.completion.items() if tardiness > 0
+                for i in evaluator.order_nodes[po_no] if not evaluator.is_aging[i]
+            ]
+        return self._late_nodes_cache
+
+    def _chemical_of(self, i):
+        node_id = self.evaluator.ids[i]
+        opnode_dict = self.dag_manager.opnode_dict
+        return opnode_dict[node_id]["SELECTED_CHEMICAL"] if node_id in opnode_dict else None
+
+    def _propose(self):
+        """무작위 이동 하나 → {machine_code: 새 순서} (불가능하면 None)"""
+        evaluator = self.evaluator
+        rng = self.rng
+        busy = [machine_code for machine_code, sequence in evaluator.sequences.items() if sequence]
+        if not busy:
+            return None
+
+        # 절반은 지각 주문 작업을 앞당기는 이동에 집중
+        late_nodes = self._late_nodes()
+        if late_nodes and rng.random() < 0.5:
+            i = rng.choice(late_nodes)
+            machine_code = evaluator.machine_of[i]
+            position = evaluator.position_of[i]
+            target = rng.choice(evaluator.eligible_machines(i) or [machine_code])
+            if target == machine_code:
+                if position == 0:
+                    return None
+                sequence = list(evaluator.sequences[machine_code])
+                sequence.pop(position)
+                sequence.insert(rng.randrange(position), i)
+                return {machine_code: sequence}
+            source = list(evaluator.sequences[machine_code])
+            source.pop(position)
+            destination = list(evaluator.sequences[target])
+            destination.insert(rng.randint(0, len(destination)), i)
+            return {machine_code: source, target: destination}
+
+        move = rng.choice(MOVE_TYPES)
+        machine_code = rng.choice(busy)
+        sequence = list(evaluator.sequences[machine_code])
+
+        if move in ('swap', 'insert'):
+            if len(sequence) < 2:
+                return None
+            a, b = rng.sample(range(len(sequence)), 2)
+            if move == 'swap':
+                sequence[a], sequence[b] = sequence[b], sequence[a]
+            else:
+                sequence.insert(b, sequence.pop(a))
+            return {machine_code: sequence}
+
+        if move == 'move_machine':
+            i = rng.choice(sequence)
+            targets = [m for m in evaluator.eligible_machines(i) if m != machine_code]
+            if not targets:
+                return None
+            target = rng.choice(targets)
+            sequence.remove(i)
+            destination = list(evaluator.sequences[target])
+            destination.insert(rng.randint(0, len(destination)), i)
+            return {machine_code: sequence, target: destination}
+
+        if move == 'swap_machine':
+            i = rng.choice(sequence)
+            targets = [m for m in evaluator.eligible_machines(i) if m != machine_code and evaluator.sequences[m]]
+            if not targets:
+                return None
+            target = rng.choice(targets)
+            destination = list(evaluator.sequences[target])
+            candidates = [j for j in destination if machine_code in evaluator.eligible_machines(j)]
+            if not candidates:
+                return None
+            j = rng.choice(candidates)
+            sequence[sequence.index(i)] = j
+            destination[destination.index(j)] = i
+            return {machine_code: sequence, target: destination}
+
+        # chemical_merge: 같은 배합액의 떨어진 두 연속 구간 중 뒤 구간을 앞 구간 바로 뒤로 이동
+        blocks = []
+        for position, i in enumerate(sequence):
+            chemical = self._chemical_of(i)
+            if blocks and blocks[-1][0] == chemical and blocks[-1][2] == position:
+                blocks[-1][2] = position + 1
+            else:
+                blocks.append([chemical, position, position + 1])
+        by_chemical = defaultdict(list)
+        for chemical, begin, finish in blocks:
+            if chemical is not None:
+                by_chemical[chemical].append((begin, finish))
+        mergeable = [spans for spans in by_chemical.values() if len(spans) >= 2]
+        if not mergeable:
+            return None
+        spans = rng.choice(mergeable)
+        first, second = sorted(rng.sample(spans, 2))
+        moved = sequence[second[0]:second[1]]
+        remaining = sequence[:second[0]] + sequence[second[1]:]
+        return {machine_code: remaining[:first[1]] + moved + remaining[first[1]:]}
+
+    # ===================================================================
+    # 실행
+    # ===================================================================
+    def run(self, time_budget=5.0, max_iterations=None):
+        """
+        시간 예산 안에서 개선 이동을 반복 (개선된 이동만 채택)
+
+        채택된 이동이 있고 최선 해가 현재 스케줄보다 나을 때만 반영합니다. 반영되는 시간은 최선 순서를
+        평가기로 다시 계산한 값이므로 이동하지 않은 작업의 시간도 바뀔 수 있습니다.
+
+        Args:
+            time_budget (float, optional): 탐색 시간 예산 (초, wall-clock). None이면 max_iterations만 사용
+            max_iterations (int, optional): 최대 이동 시도 횟수
+
+        Returns:
+            dict: {'iterations', 'accepted', 'initial_objective', 'decoded_objective', 'objective', 'elapsed', 'applied'}
+                objective = (지각 주문 수, 총 지각시간(슬롯), 총 공정교체시간, makespan)
+                decoded_objective = 이동 없이 현재 순서를 평가기로 다시 계산한 목적함수
+        """
+        if time_budget is None and max_iterations is None:
+            raise ValueError("time_budget 또는 max_iterations 중 하나는 지정해야 합니다")
+        started = time.perf_counter()
+        deadline = started + time_budget if time_budget is not None else float('inf')
+        evaluator = self.evaluator
+        current_objective = self.kernel.schedule_objective(self.scheduler, self.dag_manager)
+        decoded_objective = evaluator.objective
+        budget = f"{time_budget:.1f}s" if time_budget is not None else f"{max_iterations}회"
+        print(f"[지역탐색] 시작 - 현재 목적함수 {current_objective}, 재계산 {decoded_objective}, 예산 {budget}")
+
+        iterations = accepted = 0
+        while time.perf_counter() < deadline and (max_iterations is None or iterations < max_iterations):
+            iterations += 1
+            new_sequences = self._propose()
+            if not new_sequences:
+                continue
+            seeds, previous = evaluator.apply_sequences(new_sequences)
+            trial = evaluator.try_change(seeds) if seeds else None
+            if trial is not None and trial[0] < evaluator.objective:
+                evaluator.commit(*trial)
+                self._late_nodes_cache = None
+                accepted += 1
+            else:
+                evaluator.restore_sequences(previous)
+
+        # 이동 없이 다시 계산만 한 스케줄은 반영하지 않음 (디스패치 결과 유지)
+        applied = accepted > 0 and evaluator.objective < current_objective
+        if applied:
+            self._write_back()
+        elapsed = time.perf_counter() - started
+        print(f"[지역탐색] 완료 - 시도 {iterations}회, 채택 {accepted}회, "
+              f"목적함수 {current_objective} → {evaluator.objective if applied else current_objective} ({elapsed:.2f}s)")
+        return {
+            'iterations': iterations,
+            'accepted': accepted,
+            'initial_objective': current_objective,
+            'decoded_objective': decoded_objective,
+            'objective': evaluator.objective if applied else current_objective,
+            'elapsed': elapsed,
+            'applied': applied,
+        }
+
+    def _write_back(self):
+        """최선 해를 Machine_Time_window / aging 기계 / DAGNode에 반영 (ScheduleKernel.write_back)"""
+        sequences = self.evaluator.node_sequences()
+        self.kernel.write_back(self.scheduler, self.dag_manager, sequences, self.kernel.evaluate(sequences))
+
+
+def improve_schedule(scheduler, dag_manager, sequence_seperated_order, base_date,
+                     time_budget=5.0, seed=0, max_iterations=None):
+    """
+    디스패치 결과에 시간 예산 지역 탐색을 적용 (개선된 경우에만 scheduler / dag_manager 제자리 갱신)
+
+    Args:
+        scheduler: 스케줄링 완료된 Scheduler 인스턴스
+        dag_manager: 같은 스케줄의 DAGGraphManager
+        sequence_seperated_order (pd.DataFrame): 공정별 분리 주문
+        base_date (datetime): 기준 날짜
+        time_budget (float, optional): 탐색 시간 예산 (초). None이면 max_iterations만 사용
+        seed (int): 이동 선택 난수 시드 (같은 시드/반복 횟수면 같은 결과)
+        max_iterations (int, optional): 최대 이동 시도 횟수
+
+    Returns:
+        tuple: (result_df, stats) - result_df는 dag_manager.to_dataframe()
+    """
+    improver = LocalSearchImprover(scheduler, dag_manager, sequence_seperated_order, base_date, seed=seed)
+    stats = improver.run(time_budget=time_budget, max_iterations=max_iterations)
+    return dag_manager.to_dataframe(), stats
@@ -1,3 +1,6 @@
+import bisect
+
+
 class Machine_Time_window:
     """
     Machine_Time_window 클래스는 특정 기계(machine)의 공정(operation) 할당 상태와 빈 시간 창을 관리하는 클래스
@@ -189,3 +192,86 @@ class Machine_Time_window:
 
 
         
+
+
+    def insert_fixed_task(self, depth, node_id, start_time, end_time):
+        """
+        이미 작업이 할당된 기계에 고정 작업(예: 고장 DOWNTIME)을 시작 시간 순서 위치에 삽입
+        force_Input과 달리 assigned_task 순서를 O_start/O_end 정렬 순서와 맞춰 유지한다. (증분 재스케줄링용)
+        세 리스트 모두 같은 위치에 삽입하므로 기존 작업과 겹치는 구간은 ValueError (겹치지 않게 나눠서 전달)
+        """
+        position = bisect.bisect_right(self.O_start, start_time)
+        # 기존 작업끼리는 겹치지 않으므로 바로 앞/뒤 작업만 확인하면 된다
+        overlapping = [
+            self.assigned_task[i][1] for i in (position - 1, position)
+            if 0 <= i < len(self.O_start) and self.O_start[i] < end_time and start_time < self.O_end[i]
+        ]
+        if overlapping:
+            raise ValueError(
+                f"기계 {self.Machine_code}: 고정 작업 구간 [{start_time}, {end_time})이 기존 작업과 겹칩니다: {overlapping}"
+            )
+        self.assigned_task.insert(position, [depth, node_id])
+        self.O_start.insert(position, start_time)
+        self.O_end.insert(position, end_time)
+        self.End_time = max(self.End_time, end_time)
+
+
+    def uncovered_intervals(self, depth, start_time, end_time):
+        """
+        [start_time, end_time) 중 depth가 같은 기존 작업(예: DOWNTIME)이 차지하지 않는 구간 목록
+
+        Returns:
+            list: [(시작, 종료), ...] (시작 시간 순)
+        """
+        intervals = [(start_time, end_time)]
+        for task, task_start, task_end in zip(self.assigned_task, self.O_start, self.O_end):
+            if task[0] != depth:
+                continue
+            remaining = []
+            for interval_start, interval_end in intervals:
+                if task_end <= interval_start or interval_end <= task_start:
+                    remaining.append((interval_start, interval_end))
+                    continue
+                if interval_start < task_start:
+                    remaining.append((interval_start, task_start))
+                if task_end < interval_end:
+                    remaining.append((task_end, interval_end))
+            intervals = remaining
+        return intervals
+
+
+    def remove_tasks(self, node_ids, task_times=None):
+        """
+        지정한 노드의 작업을 기계에서 제거 (증분 재스케줄링용)
+
+        Args:
+            node_ids (set): 제거할 노드 ID
+            task_times (dict, optional): {node_id: (start, end)}
+                overlapping 기계(aging)는 O_start/O_end가 작업 순서와 별도로 정렬되어 있으므로 필수
+
+        Returns:
+            int: 제거된 작업 수
+        """
+        if self.allow_overlapping:
+            kept_task = [task for task in self.assigned_task if task[1] not in node_ids]
+            for task in self.assigned_task:
+                if task[1] in node_ids:
+                    start_time, end_time = task_times[task[1]]
+                    self.O_start.remove(start_time)
+                    self.O_end.remove(end_time)
+            removed = len(self.assigned_task) - len(kept_task)
+            self.assigned_task = kept_task
+            self.End_time = max(self.O_end, default=0)
+            return removed
+
+        kept = [
+            (task, start_time, end_time)
+            for task, start_time, end_time in zip(self.assigned_task, self.O_start, self.O_end)
+            if task[1] not in node_ids
+        ]
+        removed = len(self.assigned_task) - len(kept)
+        self.assigned_task = [task for task, _, _ in kept]
+        self.O_start = [start_time for _, start_time, _ in kept]
+        self.O_end = [end_time for _, _, end_time in kept]
+        self.End_time = self.O_end[-1] if self.O_end else 0
+        return removed
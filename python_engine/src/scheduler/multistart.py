@@ -0,0 +1,142 @@
+"""
+멀티스타트 디스패치 모듈
+
+create_dispatch_rule의 동순위(납기일/원단너비 동일) 순서와 find_best_chemical의 배합액 동수 선택을
+시드별로 무작위화(선택적으로 window_days도 변경)한 디스패치를 N번 독립 실행하고,
+목적함수 기준 최선 스케줄을 선택합니다.
+
+- 실행(pass)별 시드는 전체 seed 하나에서 SeedSequence로 파생하므로 같은 seed면 같은 결과
+- 0번 실행은 무작위화 없는 기본 디스패치이므로 결과가 기본 디스패치보다 나빠지지 않음
+- 각 실행은 fork 프로세스 풀(src.utils.run_forked)에서 입력 사본으로 수행하고 목적함수만 돌려받으며,
+  최선 실행만 호출 측 객체(opnode_dict/manager)에서 다시 실행해 반환합니다 (디스패치는 결정적)
+"""
+
+import copy
+import time
+
+import numpy as np
+import pandas as pd
+from src.utils import run_forked, quiet_call
+from .schedule_kernel import ScheduleKernel, OBJECTIVES
+
+
+def _dispatch_pass(inputs, tie_break_seed, window_days):
+    """디스패치 1회 실행 → (result, scheduler, 평가 지표 dict). inputs는 이 실행 전용이어야 함 (제자리 변경)"""
+    from . import run_scheduler_pipeline
+
+    result, scheduler = run_scheduler_pipeline(
+        **inputs['pipeline'], window_days=window_days, tie_break_seed=tie_break_seed
+    )
+    kernel = ScheduleKernel(scheduler, inputs['pipeline']['manager'],
+                            inputs['pipeline']['sequence_seperated_order'], inputs['pipeline']['base_date'])
+    return result, scheduler, kernel.schedule_metrics(scheduler, inputs['pipeline']['manager'])
+
+
+def _run_pass_safely(inputs, tie_break_seed, window_days, quiet):
+    """실행 1회의 평가 지표 (오류는 'error' 키로 기록, quiet면 진행 로그 숨김)"""
+    try:
+        _, _, metrics = quiet_call(quiet, _dispatch_pass, inputs, tie_break_seed, window_days)
+        return {**metrics, 'error': None}
+    except Exception as e:
+        print(f"[ERROR] 멀티스타트 디스패치 (seed={tie_break_seed}) 실행 중 오류: {e}")
+        return {'error': str(e)}
+
+
+def _run_pass_worker(state, index):
+    """run_forked 작업 함수: 공유 상태에서 index번째 실행 (스케줄링이 입력을 변경하므로 사본 사용)"""
+    tie_break_seed, window_days = state['passes'][index]
+    return _run_pass_safely(copy.deepcopy(state['inputs']), tie_break_seed, window_days, state['quiet'])
+
+
+def run_multistart_dispatch(
+    dag_df,
+    sequence_seperated_order,
+    width_change_df,
+    machine_mapper,
+    opnode_dict,
+    operation_delay_df,
+    machine_dict,
+    machine_rest,
+    base_date,
+    manager,
+    window_days,
+    num_starts=8,
+    seed=0,
+    window_days_choices=None,
+    objective='lateness',
+    max_workers=None,
+    quiet=True,
+):
+    """무작위 동순위 디스패치를 num_starts번 실행하고 objective 기준 최선 스케줄을 반환합니다.
+
+    Parameters
+    ----------
+    dag_df ~ window_days :
+        run_scheduler_pipeline과 동일 (최선 실행 결과로 opnode_dict/manager가 제자리 갱신됨)
+    num_starts : int
+        디스패치 실행 횟수 (0번은 무작위화 없는 기본 디스패치)
+    seed : int
+        실행별 시드를 파생하는 전체 시드
+    window_days_choices : list of int, optional
+        지정하면 1번 이후 실행마다 이 중에서 window_days를 무작위 선택
+    objective : str or callable
+        'lateness'(지각 주문 수 → 총 지각시간 → 교체시간 → makespan), 'makespan', 'setup'
+        또는 평가 지표 dict(late_orders, total_tardiness, total_setup, makespan)를 받아 비교 키를 반환하는 함수 (작을수록 좋음)
+    max_workers : int, optional
+        프로세스 수. 1이거나 fork를 지원하지 않는 플랫폼이면 현재 프로세스에서 순차 실행
+    quiet : bool
+        실행별 스케줄링 진행 로그 숨김
+
+    Returns
+    -------
+    (result_df, scheduler, summary_df)
+        summary_df: 실행별 시드/window_days/평가 지표/선택 여부
+    """
+    objective_key = OBJECTIVES[objective] if isinstance(objective, str) else objective
+    if num_starts < 1:
+        raise ValueError("num_starts는 1 이상이어야 합니다")
+
+    started = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    pass_seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(num_starts - 1)]
+    passes = [(None, window_days)] + [
+        (pass_seed, int(rng.choice(window_days_choices)) if window_days_choices else window_days)
+        for pass_seed in pass_seeds
+    ]
+
+    inputs = {'pipeline': dict(
+        dag_df=dag_df,
+        sequence_seperated_order=sequence_seperated_order,
+        width_change_df=width_change_df,
+        machine_mapper=machine_mapper,
+        opnode_dict=opnode_dict,
+        operation_delay_df=operation_delay_df,
+        machine_dict=machine_dict,
+        machine_rest=machine_rest,
+        base_date=base_date,
+        manager=manager,
+    )}
+
+    # 입력은 fork로 물려주고 실행 index만 전달
+    rows, use_processes = run_forked(dict(inputs=inputs, passes=passes, quiet=quiet),
+                                     _run_pass_worker, range(num_starts), max_workers)
+
+    summary = pd.DataFrame([
+        {'실행': index, 'seed': tie_break_seed, 'window_days': pass_window_days, **row}
+        for index, ((tie_break_seed, pass_window_days), row) in enumerate(zip(passes, rows))
+    ])
+    summary['seed'] = summary['seed'].astype('Int64')
+    succeeded = [index for index, row in enumerate(rows) if row['error'] is None]
+    if not succeeded:
+        raise RuntimeError("멀티스타트 디스패치의 모든 실행이 실패했습니다")
+    best = min(succeeded, key=lambda index: (objective_key(rows[index]), index))
+    summary['선택'] = summary['실행'] == best
+
+    # 최선 실행을 호출 측 객체에서 다시 수행 (결정적이므로 같은 스케줄)
+    tie_break_seed, best_window_days = passes[best]
+    result, scheduler, _ = _dispatch_pass(inputs, tie_break_seed, best_window_days)
+    print(f"[멀티스타트] {num_starts}회 실행 ({'process' if use_processes else 'sequential'}), "
+          f"최선 {best}번 (seed={tie_break_seed}, window_days={best_window_days}), "
+          f"기본 대비 {objective_key(rows[0]) if rows[0]['error'] is None else '-'} → {objective_key(rows[best])} "
+          f"({time.perf_counter() - started:.2f}s)")
+    return result, scheduler, summary
@@ -0,0 +1,377 @@
+"""
+배열 기반 스케줄 평가 커널
+
+기계별 작업 순서(후보 스케줄)를 받아 Machine_Time_window / DAGNode를 건드리지 않고
+시작/종료 시간, 공정교체시간, makespan, 지각 지표를 계산합니다.
+
+- 노드 ID는 정수 인덱스로 인턴되고 부모/자식 관계는 CSR 배열(+ 노드별 자식 리스트)로 보관
+- 평가는 (DAG 선후관계 + 같은 기계 직전 작업) 그래프를 Kahn 큐로 한 번 훑는 O(노드 + 간선) 계산
+- 공정교체시간은 DelayProcessor.delay_calc_pairs로 기계별 연속 쌍을 한 번에 조회
+
+메타휴리스틱이나 what-if 분석에서 후보 스케줄을 대량으로 비교할 때 사용합니다.
+"""
+
+import numpy as np
+import pandas as pd
+from config import config
+
+
+UNAVAILABLE_PROCESSING_TIME = 9999
+
+# 목적함수 이름 → 평가 지표 dict(evaluate() / schedule_metrics() 결과)의 비교 키 (작을수록 좋음)
+OBJECTIVES = {
+    'lateness': lambda m: (m['late_orders'], m['total_tardiness'], m['total_setup'], m['makespan']),
+    'makespan': lambda m: (m['makespan'], m['late_orders'], m['total_tardiness'], m['total_setup']),
+    'setup': lambda m: (m['total_setup'], m['late_orders'], m['total_tardiness'], m['makespan']),
+}
+
+
+class ScheduleKernel:
+    """
+    후보 스케줄 순수 평가기
+
+    생성 시 DAG 구조, 기계별 처리시간, DOWNTIME 구간, P/O 납기를 배열로 고정하고
+    evaluate()는 입력 순서만으로 결과를 계산합니다 (스케줄러 상태를 읽기만 하고 수정하지 않음).
+
+    시간 계산 규칙 (디스패치와 동일한 제약, 가능한 가장 이른 시각에 배치):
+        - 일반 작업: max(부모 종료, 같은 기계 직전 작업 종료 + 공정교체시간)에 시작하며,
+          DOWNTIME 구간과 겹치면 DOWNTIME 종료 + 교체시간 이후로 밀림
+        - Aging 작업: 모든 부모 종료 즉시 시작, 기계 순서에 포함하지 않음
+        - 공정교체시간은 현재(최종) SELECTED_CHEMICAL 기준. 디스패치는 배치 당시의 배합액으로 교체시간을
+          잡으므로, 순서를 바꾸지 않은 디스패치 결과도 다시 계산하면 시간이 다를 수 있음
+          (현재 스케줄 그대로의 지표는 schedule_objective)
+
+    Example:
+        kernel = ScheduleKernel(scheduler, manager, sequence_seperated_order, base_date)
+        evaluation = kernel.evaluate(kernel.current_sequences(scheduler))
+        evaluation['makespan'], evaluation['late_orders']
+    """
+
+    def __init__(self, scheduler, dag_manager, sequence_seperated_order, base_date):
+        """
+        Args:
+            scheduler: 기계 자원/DOWNTIME이 할당된 Scheduler 인스턴스
+            dag_manager: DAGGraphManager
+            sequence_seperated_order (pd.DataFrame): 공정별 분리 주문 (납기일, P/O 매핑)
+            base_date (datetime): 기준 날짜
+        """
+        self.delay_processor = scheduler.delay_processor
+        self.machine_codes = list(scheduler.Machines)
+        self.machine_index = {machine_code: m for m, machine_code in enumerate(self.machine_codes)}
+
+        nodes = dag_manager.nodes
+        self.node_ids = np.array(list(nodes), dtype=object)
+        self.index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        count = len(self.node_ids)
+
+        machine_dict = scheduler.machine_dict
+        self.is_aging = np.array([
+            nodes[node_id].is_aging or 'AGING' in machine_dict.get(node_id, {}) for node_id in self.node_ids
+        ], dtype=bool)
+        self.aging_time = np.array([
+            machine_dict[node_id]['AGING'] if is_aging else 0
+            for node_id, is_aging in zip(self.node_ids, self.is_aging)
+        ], dtype=float)
+
+        # 기계별 처리시간 행렬 (불가능 = 9999)
+        self.processing_times = np.full((count, len(self.machine_codes)), UNAVAILABLE_PROCESSING_TIME, dtype=float)
+        for i, node_id in enumerate(self.node_ids):
+            for machine_code, processing_time in machine_dict.get(node_id, {}).items():
+                m = self.machine_index.get(machine_code)
+                if m is not None:
+                    self.processing_times[i, m] = processing_time
+
+        # 자식 CSR / 부모 수
+        child_lists = [[self.index[child.id] for child in nodes[node_id].children] for node_id in self.node_ids]
+        self.child_ptr = np.zeros(count + 1, dtype=np.int64)
+        self.child_ptr[1:] = np.cumsum([len(children) for children in child_lists])
+        self.child_idx = np.array([c for children in child_lists for c in children], dtype=np.int64)
+        self.parent_count = np.bincount(self.child_idx, minlength=count)
+        self.children = child_lists
+
+        # 기계별 DOWNTIME 구간 [(시작, 종료, ID)] - 시작 시각 순
+        self.machine_downtimes = [[] for _ in self.machine_codes]
+        for machine_code, machine in scheduler.Machines.items():
+            for task, start_time, end_time in zip(machine.assigned_task, machine.O_start, machine.O_end):
+                if task[0] == config.constants.FAKE_OPERATION_DEPTH:
+                    self.machine_downtimes[self.machine_index[machine_code]].append((start_time, end_time, task[1]))
+        for downtimes in self.machine_downtimes:
+            downtimes.sort()
+
+        # DOWNTIME 다음 교체시간 (기계, DOWNTIME ID) → 노드별 리스트 (가능 노드만 계산)
+        self.downtime_setups = {}
+        for m, downtimes in enumerate(self.machine_downtimes):
+            for _, _, down_id in downtimes:
+                if (m, down_id) not in self.downtime_setups:
+                    eligible = np.flatnonzero(self.processing_times[:, m] != UNAVAILABLE_PROCESSING_TIME)
+                    delays = np.zeros(count, dtype=float)
+                    delays[eligible] = self.delay_processor.delay_calc_pairs(
+                        [down_id] * len(eligible), self.node_ids[eligible], self.machine_codes[m])
+                    self.downtime_setups[(m, down_id)] = delays.tolist()
+
+        # 기계별 (이전, 다음) 노드 쌍 교체시간 캐시 {기계 인덱스: {이전 * 노드 수 + 다음: 교체시간}}
+        self._pair_setups = {m: {} for m in range(len(self.machine_codes))}
+
+        self._build_orders(sequence_seperated_order, base_date)
+
+    def _build_orders(self, sequence_seperated_order, base_date):
+        """P/O별 노드 CSR과 납기 슬롯 (결과 리포트와 같이 P/O 완료 시각 기준으로 지각 판정)"""
+        rows = sequence_seperated_order[[config.columns.PROCESS_ID, config.columns.PO_NO, config.columns.DUE_DATE]].copy()
+        rows = rows[rows[config.columns.PROCESS_ID].isin(self.index)]
+        rows[config.columns.PO_NO] = rows[config.columns.PO_NO].astype(str).str.split(',')
+        rows = rows.explode(config.columns.PO_NO)
+        rows[config.columns.PO_NO] = rows[config.columns.PO_NO].str.strip()
+        rows['due_slot'] = (
+            (pd.to_datetime(rows[config.columns.DUE_DATE]) - pd.Timestamp(base_date)).dt.total_seconds()
+            / 60 / config.constants.TIME_MULTIPLIER
+        )
+        rows['node_index'] = rows[config.columns.PROCESS_ID].map(self.index)
+        rows = rows.sort_values(config.columns.PO_NO, kind='stable')
+
+        grouped = rows.groupby(config.columns.PO_NO, sort=True)
+        self.order_numbers = np.array(list(grouped.groups), dtype=object)
+        sizes = grouped.size().to_numpy()
+        self.order_ptr = np.zeros(len(sizes) + 1, dtype=np.int64)
+        self.order_ptr[1:] = np.cumsum(sizes)
+        self.order_node_idx = rows['node_index'].to_numpy(dtype=np.int64)
+        self.order_due = grouped['due_slot'].min().to_numpy(dtype=float)  # 납기 없음 = NaN
+
+    def current_sequences(self, scheduler):
+        """Scheduler에 할당된 기계별 작업 순서 (DOWNTIME 제외)"""
+        return {
+            machine_code: [task[1] for task in machine.assigned_task if task[0] != config.constants.FAKE_OPERATION_DEPTH]
+            for machine_code, machine in scheduler.Machines.items()
+        }
+
+    def _sequence_setups(self, m, positions):
+        """기계 m 순서의 연속 쌍 교체시간 (처음 보는 쌍만 delay_calc_pairs로 한 번에 조회)"""
+        cache = self._pair_setups[m]
+        keys = (positions[:-1] * len(self.node_ids) + positions[1:]).tolist()
+        missing = [k for k in dict.fromkeys(keys) if k not in cache]
+        if missing:
+            earlier, later = np.divmod(np.array(missing, dtype=np.int64), len(self.node_ids))
+            delays = self.delay_processor.delay_calc_pairs(self.node_ids[earlier], self.node_ids[later], self.machine_codes[m])
+            cache.update(zip(missing, delays.tolist()))
+        return [cache[k] for k in keys]
+
+    def pair_setup(self, m, earlier, later):
+        """기계 m에서 노드 earlier 다음 later의 교체시간 (_sequence_setups와 같은 캐시)"""
+        delay = self._pair_setups[m].get(earlier * len(self.node_ids) + later)
+        if delay is None:
+            delay = self._sequence_setups(m, np.array([earlier, later], dtype=np.int64))[0]
+        return delay
+
+    def place(self, i, m, start, processing_time, setup):
+        """
+        기계 m의 DOWNTIME 구간과 겹치면 구간 종료 + DOWNTIME 다음 교체시간 이후로 이동
+
+        Args:
+            i (int): 노드 인덱스
+            m (int): 기계 인덱스
+            start (float): DOWNTIME을 고려하기 전 시작 시각
+            processing_time (float): 처리시간
+            setup (float): 직전 작업 기준 교체시간
+
+        Returns:
+            tuple: (시작 시각, 적용된 교체시간)
+        """
+        for down_start, down_end, down_id in self.machine_downtimes[m]:
+            if down_end <= start:
+                continue
+            if start + processing_time <= down_start:
+                break
+            setup = self.downtime_setups[(m, down_id)][i]
+            start = max(start, down_end + setup)
+        return start, setup
+
+    def evaluate(self, sequences):
+        """
+        기계별 작업 순서로 스케줄 평가
+
+        Args:
+            sequences (dict): {machine_code: [node_id, ...]} - Aging이 아닌 모든 노드가 정확히 한 번씩 포함되어야 함
+
+        Returns:
+            dict: {
+                'start', 'end', 'setup' (np.ndarray, node_ids 순서), 'machine' (기계 인덱스, Aging -1),
+                'makespan', 'total_setup', 'total_tardiness', 'late_orders', 'order_completion' (order_numbers 순서)
+            }
+
+        Raises:
+            ValueError: 노드 누락/중복, 처리 불가능한 기계 배정, 순서와 선후관계의 순환
+        """
+        count = len(self.node_ids)
+        machine = np.full(count, -1, dtype=np.int64)
+        previous = np.full(count, -1, dtype=np.int64)
+        following = np.full(count, -1, dtype=np.int64)
+        setup = np.zeros(count, dtype=float)
+
+        assigned = 0
+        for machine_code, sequence in sequences.items():
+            if not sequence:
+                continue
+            m = self.machine_index[machine_code]
+            positions = np.fromiter((self.index[node_id] for node_id in sequence), dtype=np.int64, count=len(sequence))
+            if (machine[positions] != -1).any() or len(np.unique(positions)) != len(positions):
+                raise ValueError(f"기계 순서에 중복 노드가 있습니다: {machine_code}")
+            machine[positions] = m
+            previous[positions[1:]] = positions[:-1]
+            following[positions[:-1]] = positions[1:]
+            assigned += len(positions)
+
+            setup[positions[1:]] = self._sequence_setups(m, positions)
+
+        if assigned != int((~self.is_aging).sum()) or (machine[~self.is_aging] == -1).any():
+            raise ValueError("Aging이 아닌 노드가 모두 기계 순서에 포함되어야 합니다")
+        on_machine = machine >= 0
+        processing_time = self.aging_time.copy()
+        processing_time[on_machine] = self.processing_times[on_machine.nonzero()[0], machine[on_machine]]
+        if (processing_time[on_machine] == UNAVAILABLE_PROCESSING_TIME).any():
+            raise ValueError("처리할 수 없는 기계에 배정된 노드가 있습니다")
+
+        # Kahn 큐: 선행(부모 + 기계 직전 작업)이 모두 끝난 노드만 계산하고, 간선마다 한 번씩 진입차수 감소
+        machine_list, previous_list, following_list = machine.tolist(), previous.tolist(), following.tolist()
+        time_list, setup_list = processing_time.tolist(), setup.tolist()
+        start_list = [0.0] * count
+        end_list = [0.0] * count
+        ready = [0.0] * count
+        indegree = (self.parent_count + (previous >= 0)).tolist()
+        queue = [i for i in range(count) if indegree[i] == 0]
+        children = self.children
+        machine_downtimes = self.machine_downtimes
+        processed = 0
+
+        while queue:
+            i = queue.pop()
+            processed += 1
+            task_start = ready[i]
+            before = previous_list[i]
+            if before >= 0:
+                task_start = max(task_start, end_list[before] + setup_list[i])
+            m = machine_list[i]
+            if m >= 0 and machine_downtimes[m]:
+                task_start, setup_list[i] = self.place(i, m, task_start, time_list[i], setup_list[i])
+            task_end = task_start + time_list[i]
+            start_list[i] = task_start
+            end_list[i] = task_end
+
+            for child in children[i]:
+                if task_end > ready[child]:
+                    ready[child] = task_end
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+            after = following_list[i]
+            if after >= 0:
+                indegree[after] -= 1
+                if indegree[after] == 0:
+                    queue.append(after)
+
+        if processed < count:
+            raise ValueError("기계 작업 순서와 DAG 선후관계가 순환합니다")
+
+        start = np.array(start_list, dtype=float)
+        end = np.array(end_list, dtype=float)
+        setup = np.array(setup_list, dtype=float)
+        setup[~on_machine] = 0
+        if len(self.order_node_idx):
+            order_completion = np.maximum.reduceat(end[self.order_node_idx], self.order_ptr[:-1])
+        else:
+            order_completion = np.zeros(0, dtype=float)
+        tardiness = np.nan_to_num(np.maximum(order_completion - self.order_due, 0.0))
+
+        return {
+            'start': start,
+            'end': end,
+            'setup': setup,
+            'machine': machine,
+            'makespan': float(end.max()) if count else 0.0,
+            'total_setup': float(setup.sum()),
+            'total_tardiness': float(tardiness.sum()),
+            'late_orders': int((tardiness > 0).sum()),
+            'order_completion': order_completion,
+        }
+
+    @staticmethod
+    def objective(evaluation):
+        """평가 결과 → 사전식 비교용 목적함수 (지각 주문 수, 총 지각시간, 총 공정교체시간, makespan)"""
+        return OBJECTIVES['lateness'](evaluation)
+
+    def schedule_objective(self, scheduler, dag_manager):
+        """Scheduler에 반영된 현재 스케줄(노드 시간 그대로)의 목적함수"""
+        return ScheduleKernel.objective(self.schedule_metrics(scheduler, dag_manager))
+
+    def schedule_metrics(self, scheduler, dag_manager):
+        """
+        Scheduler에 반영된 현재 스케줄(노드 시간 그대로)의 평가 지표
+
+        지각/makespan은 DAGNode 종료 시간, 교체시간은 같은 기계 순서의 커널 계산값을 사용합니다.
+
+        Returns:
+            dict: {'late_orders', 'total_tardiness', 'total_setup', 'makespan'}
+        """
+        nodes = dag_manager.nodes
+        end = np.array([nodes[node_id].node_end for node_id in self.node_ids], dtype=float)
+        evaluation = self.evaluate(self.current_sequences(scheduler))
+        if len(self.order_node_idx):
+            completion = np.maximum.reduceat(end[self.order_node_idx], self.order_ptr[:-1])
+        else:
+            completion = np.zeros(0, dtype=float)
+        tardiness = np.nan_to_num(np.maximum(completion - self.order_due, 0.0))
+        return {
+            'late_orders': int((tardiness > 0).sum()),
+            'total_tardiness': float(tardiness.sum()),
+            'total_setup': evaluation['total_setup'],
+            'makespan': float(end.max()),
+        }
+
+    def write_back(self, scheduler, dag_manager, sequences, evaluation):
+        """
+        평가한 스케줄을 Machine_Time_window / aging 기계 / DAGNode에 반영 (DOWNTIME 유지)
+
+        Args:
+            scheduler: 반영할 Scheduler (생성 시와 같은 DOWNTIME 상태)
+            dag_manager: 반영할 DAGGraphManager
+            sequences (dict): evaluate()에 전달한 기계별 작업 순서
+            evaluation (dict): evaluate() 결과
+        """
+        start, end = evaluation['start'].tolist(), evaluation['end'].tolist()
+        nodes = dag_manager.nodes
+
+        for machine_code, machine in scheduler.Machines.items():
+            entries = [
+                (start_time, 0, task, end_time)
+                for task, start_time, end_time in zip(machine.assigned_task, machine.O_start, machine.O_end)
+                if task[0] == config.constants.FAKE_OPERATION_DEPTH
+            ]
+            entries += [
+                (start[self.index[node_id]], 1, [nodes[node_id].depth, node_id], end[self.index[node_id]])
+                for node_id in sequences.get(machine_code, [])
+            ]
+            entries.sort(key=lambda entry: (entry[0], entry[1]))
+            machine.assigned_task = [entry[2] for entry in entries]
+            machine.O_start = [entry[0] for entry in entries]
+            machine.O_end = [entry[3] for entry in entries]
+            machine.End_time = machine.O_end[-1] if machine.O_end else 0
+
+        aging_machine = scheduler.aging_machine
+        if aging_machine is not None and aging_machine.assigned_task:
+            aging_indices = [self.index[task[1]] for task in aging_machine.assigned_task]
+            aging_machine.O_start = sorted(start[i] for i in aging_indices)
+            aging_machine.O_end = sorted(end[i] for i in aging_indices)
+            aging_machine.End_time = aging_machine.O_end[-1]
+
+        parent_ends = [[] for _ in range(len(self.node_ids))]
+        for i in range(len(self.node_ids)):
+            for child in self.child_idx[self.child_ptr[i]:self.child_ptr[i + 1]].tolist():
+                parent_ends[child].append(end[i])
+
+        machine = evaluation['machine']
+        for i, node_id in enumerate(self.node_ids):
+            node = nodes[node_id]
+            node.machine = 'AGING' if self.is_aging[i] else self.machine_codes[machine[i]]
+            node.node_start = start[i]
+            node.node_end = end[i]
+            node.processing_time = end[i] - start[i]
+            node.parent_node_end = [0] + parent_ends[i]
+            node.earliest_start = max(node.parent_node_end)
@@ -319,14 +319,13 @@ class Scheduler:
     #     """
     #     return self.allocate_unable_machine_info(machine_rest, base_date)
     
-    def allocate_machine_downtime(self, machine_rest, base_date):
+    @staticmethod
+    def _downtime_slots(machine_rest, base_date):
         """
-        기계 휴식 시간을 DOWNTIME 가짜 공정으로 차단
+        machine_rest의 시작/종료 시간을 기준 날짜 대비 시간 슬롯(30분 단위)으로 변환
 
-        machine_rest: 기계코드, 불가능한 공정, 시작시간, 종료시간
-        불가능한 공정이 비어있는 경우 모든 공정을 사용 못하는 상태로 판단
+        시작시간이 없으면 전체 스케줄 시작 시간, 종료시간이 없는 행은 제외
         """
-
         # 시작시간 미존재시, 전체 스케줄 시작 시간으로
         machine_rest[config.columns.MACHINE_REST_START] = machine_rest[config.columns.MACHINE_REST_START].fillna(base_date)
         # 종료시간이 없는 경우, 고려 X
@@ -334,12 +333,40 @@ class Scheduler:
 
         machine_rest[config.columns.MACHINE_REST_START] = ((pd.to_datetime(machine_rest[config.columns.MACHINE_REST_START]) - pd.to_datetime(base_date)).dt.total_seconds() // 1800).astype(int)
         machine_rest[config.columns.MACHINE_REST_END] = ((pd.to_datetime(machine_rest[config.columns.MACHINE_REST_END]) - pd.to_datetime(base_date)).dt.total_seconds() // 1800).astype(int)
+        return machine_rest
+
+    def allocate_machine_downtime(self, machine_rest, base_date):
+        """
+        기계 휴식 시간을 DOWNTIME 가짜 공정으로 차단
+
+        machine_rest: 기계코드, 불가능한 공정, 시작시간, 종료시간
+        불가능한 공정이 비어있는 경우 모든 공정을 사용 못하는 상태로 판단
+        """
+        machine_rest = self._downtime_slots(machine_rest, base_date)
 
         for idx, row in machine_rest.iterrows():
             machine_code = row[config.columns.MACHINE_CODE]  # ★ 코드로 변경
             start_time = row[config.columns.MACHINE_REST_START]
             end_time = row[config.columns.MACHINE_REST_END]
-            self.Machines[machine_code].force_Input(-1, "DOWNTIME 기계 사용 불가 시간", start_time, end_time)  # ★ 딕셔너리 접근   
+            self.Machines[machine_code].force_Input(-1, "DOWNTIME 기계 사용 불가 시간", start_time, end_time)  # ★ 딕셔너리 접근
+
+    def allocate_additional_downtime(self, machine_rest, base_date):
+        """
+        스케줄이 이미 할당된 기계에 추가 중단시간(예: 주중 고장)을 DOWNTIME 가짜 공정으로 삽입 (증분 재스케줄링용)
+
+        allocate_machine_downtime과 같은 형식의 machine_rest를 받으며,
+        기존 작업과의 순서를 유지하도록 시작 시간 위치에 삽입한다.
+        기존 DOWNTIME과 겹치는 부분은 이미 막혀 있으므로 겹치지 않는 구간만 삽입하고,
+        고정된(freeze_time 이전 시작) 작업과 겹치면 ValueError
+        """
+        machine_rest = self._downtime_slots(machine_rest.copy(), base_date)
+
+        for idx, row in machine_rest.iterrows():
+            machine = self.Machines[row[config.columns.MACHINE_CODE]]
+            for start_time, end_time in machine.uncovered_intervals(
+                -1, row[config.columns.MACHINE_REST_START], row[config.columns.MACHINE_REST_END]
+            ):
+                machine.insert_fixed_task(-1, "DOWNTIME 기계 사용 불가 시간", start_time, end_time)   
         
 
 
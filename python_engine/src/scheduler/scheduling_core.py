@@ -6,7 +6,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+import heapq
 import numpy as np
 import pandas as pd
 from config import config
@@ -306,7 +307,7 @@ class HighLevelSchedulingStrategy(ABC):
         pass
 
 
-def find_best_chemical(first_node_dict, window_nodes, dag_manager):
+def find_best_chemical(first_node_dict, window_nodes, dag_manager, rng=None):
     """
     첫 노드의 CHEMICAL_LIST에서 최적 배합액 선택
 
@@ -314,6 +315,7 @@ def find_best_chemical(first_node_dict, window_nodes, dag_manager):
         first_node_dict: 첫 노드의 opnode_dict 정보
         window_nodes: 윈도우 내 노드 ID 리스트
         dag_manager: DAG 관리자
+        rng (random.Random, optional): 지정하면 사용 횟수가 같은 배합액 중 무작위 선택 (기본: 리스트 순서)
 
     Returns:
         str or None: 가장 많이 사용 가능한 배합액 (없으면 None)
@@ -333,20 +335,22 @@ def find_best_chemical(first_node_dict, window_nodes, dag_manager):
         return None
 
     # 각 배합액별 사용 가능한 노드 수 카운트
-    chemical_counts = {}
-    for chemical in chemical_list:
-        count = 0
-        for node_id in window_nodes:
-            node_dict = dag_manager.opnode_dict.get(node_id)
-            # NEW: Aging 노드는 opnode_dict에 없으므로 자동 제외됨 (추가 체크)
-            if node_dict and chemical in node_dict["CHEMICAL_LIST"]:
-                count += 1
-        chemical_counts[chemical] = count
+    table = getattr(dag_manager.opnode_dict, 'table', None)
+    if table is not None:
+        # NodeAttributeTable: 배합액 포함 행렬로 한 번에 카운트 (Aging 노드는 인덱스 -1로 제외)
+        counts = table.chemical_counts(chemical_list, table.indices_of(window_nodes))
+        chemical_counts = dict(zip(chemical_list, counts))
+    else:
+        chemical_counts = _count_chemicals_by_dict(chemical_list, window_nodes, dag_manager)
 
     # 가장 많이 사용 가능한 배합액 반환 (동수일 경우 첫 번째)
     if not chemical_counts:
         return None
 
+    if rng is not None:
+        most = max(chemical_counts.values())
+        return rng.choice([c for c in chemical_list if chemical_counts[c] == most])
+
     best_chemical = max(
                         chemical_counts, 
                         key=lambda c: (chemical_counts[c], -chemical_list.index(c))
@@ -356,9 +360,132 @@ def find_best_chemical(first_node_dict, window_nodes, dag_manager):
     return best_chemical
 
 
+def _count_chemicals_by_dict(chemical_list, window_nodes, dag_manager):
+    """opnode_dict가 일반 dict인 경우의 배합액별 사용 가능 노드 수 카운트"""
+    chemical_counts = {}
+    for chemical in chemical_list:
+        count = 0
+        for node_id in window_nodes:
+            node_dict = dag_manager.opnode_dict.get(node_id)
+            # NEW: Aging 노드는 opnode_dict에 없으므로 자동 제외됨 (추가 체크)
+            if node_dict and chemical in node_dict["CHEMICAL_LIST"]:
+                count += 1
+        chemical_counts[chemical] = count
+    return chemical_counts
+
+
+def filter_same_operation_nodes(window, operation_name, dag_manager):
+    """
+    윈도우 내 같은 공정코드의 ready 노드 추출 (Aging 노드는 opnode_dict에 없으므로 제외)
+
+    NodeAttributeTable이 있으면 공정코드 비교를 배열 연산으로 수행합니다.
+    """
+    table = getattr(dag_manager.opnode_dict, 'table', None)
+    if table is None:
+        return [
+            gene for gene in window
+            if dag_manager.opnode_dict.get(gene)
+            and dag_manager.opnode_dict.get(gene)["OPERATION_CODE"] == operation_name
+            and SchedulingCore.validate_ready_node(dag_manager.nodes[gene])
+        ]
+
+    indices = table.indices_of(window)
+    category = np.flatnonzero(table.operation_code_categories == operation_name)
+    if len(category) == 0 or len(indices) == 0:
+        return []
+    same_code = (indices >= 0) & (table.operation_code_codes[np.maximum(indices, 0)] == category[0])
+    return [
+        gene for gene, matched in zip(window, same_code)
+        if matched and SchedulingCore.validate_ready_node(dag_manager.nodes[gene])
+    ]
+
+
+def sort_by_fabric_width(node_ids, dag_manager):
+    """노드들을 원단너비 내림차순으로 정렬 (동일 너비는 기존 순서 유지)"""
+    table = getattr(dag_manager.opnode_dict, 'table', None)
+    if table is None:
+        return sorted(
+            node_ids,
+            key=lambda gene: dag_manager.opnode_dict.get(gene)["FABRIC_WIDTH"],
+            reverse=True
+        )
+    widths = table.fabric_width[table.indices_of(node_ids)]
+    return sorted(node_ids, key=dict(zip(node_ids, widths.tolist())).__getitem__, reverse=True)
+
+
+def freeze_schedule(dag_manager, scheduler, freeze_time):
+    """
+    freeze_time 이전에 시작한 작업은 고정하고, 나머지 노드만 미스케줄 상태로 되돌림 (증분 재스케줄링용)
+
+    - node_start < freeze_time 인 노드: 기계 할당/시간 그대로 유지
+    - Aging 노드: 모든 부모가 고정이면 함께 고정 (부모 종료 직후 시작이 이미 확정)
+    - 나머지 노드: 할당된 기계에서만 작업 제거, 노드 상태/SELECTED_CHEMICAL 초기화
+      parent_node_count는 고정되지 않은 부모 수, parent_node_end는 [freeze_time] + 고정된 부모 종료 시간
+      (재할당 작업은 freeze_time 이후에만 시작)
+
+    Args:
+        dag_manager: DAG 구조 관리자 (스케줄링 완료 상태)
+        scheduler: 해당 DAG를 스케줄링한 Scheduler 인스턴스
+        freeze_time: 고정 기준 시각 (시간 슬롯 단위)
+
+    Returns:
+        list: 초기화된(재스케줄링 대상) 노드 ID 리스트
+    """
+    nodes = dag_manager.nodes
+    parents = defaultdict(list)
+    for node in nodes.values():
+        for child in node.children:
+            parents[child.id].append(node)
+
+    frozen = {
+        node_id for node_id, node in nodes.items()
+        if node.node_start is not None and node.node_start < freeze_time
+    }
+    for node_id, node in nodes.items():
+        if (node.is_aging and node_id not in frozen and node.node_start is not None
+                and parents[node_id] and all(parent.id in frozen for parent in parents[node_id])):
+            frozen.add(node_id)
+
+    reset_ids = [node_id for node_id in nodes if node_id not in frozen]
+
+    # 1. 영향 받는 기계에서만 작업 제거
+    removed_by_machine = defaultdict(set)
+    for node_id in reset_ids:
+        machine_code = nodes[node_id].machine
+        if machine_code is not None:
+            removed_by_machine[machine_code].add(node_id)
+    for machine_code, node_ids in removed_by_machine.items():
+        task_times = {node_id: (nodes[node_id].node_start, nodes[node_id].node_end) for node_id in node_ids}
+        scheduler.get_machine(machine_code).remove_tasks(node_ids, task_times)
+
+    # 2. 노드 상태 초기화
+    for node_id in reset_ids:
+        node = nodes[node_id]
+        node.earliest_start = None
+        node.processing_time = None
+        node.machine = None
+        node.node_start = None
+        node.node_end = None
+        node.parent_node_count = sum(1 for parent in parents[node_id] if parent.id not in frozen)
+        node.parent_node_end = [freeze_time] + [parent.node_end for parent in parents[node_id] if parent.id in frozen]
+        if node_id in dag_manager.opnode_dict:
+            dag_manager.opnode_dict[node_id]["SELECTED_CHEMICAL"] = None
+
+    print(f"[재스케줄링] 고정 {len(frozen)}개 노드, 재할당 대상 {len(reset_ids)}개 노드 "
+          f"(기준 시각 {freeze_time}, 영향 기계 {len(removed_by_machine)}대)")
+    return reset_ids
+
+
 class SetupMinimizedStrategy(HighLevelSchedulingStrategy):
     """셋업 시간 최소화 전략 (dag_scheduler.schedule_minimize_setup 통합)"""
 
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng (random.Random, optional): 배합액 동수 선택용 난수 (None이면 CHEMICAL_LIST 순서)
+        """
+        self.rng = rng
+
     def execute(self, dag_manager, scheduler, start_id, window):
         """
         유사한 공정들을 묶어서 셋업 시간 최소화 스케줄링
@@ -391,15 +518,10 @@ class SetupMinimizedStrategy(HighLevelSchedulingStrategy):
         operation_name = first_node_dict["OPERATION_CODE"]
 
         # NEW: 윈도우 내 같은 공정 노드들만 추출 (ready 필터 + aging 제외)
-        same_operation_nodes = [
-            gene for gene in window
-            if dag_manager.opnode_dict.get(gene)  # Aging 노드는 opnode_dict에 없으므로 제외됨
-            and dag_manager.opnode_dict.get(gene)["OPERATION_CODE"] == operation_name
-            and SchedulingCore.validate_ready_node(dag_manager.nodes[gene])
-        ]
+        same_operation_nodes = filter_same_operation_nodes(window, operation_name, dag_manager)
 
         # 첫 노드의 최적 배합액 결정
-        best_chemical = find_best_chemical(first_node_dict, same_operation_nodes, dag_manager)
+        best_chemical = find_best_chemical(first_node_dict, same_operation_nodes, dag_manager, self.rng)
         dag_manager.opnode_dict[start_id]["SELECTED_CHEMICAL"] = best_chemical
 
         # 3. 같은 배합액 사용 가능한 노드들 그룹화
@@ -416,11 +538,7 @@ class SetupMinimizedStrategy(HighLevelSchedulingStrategy):
                 remaining_operation_queue.append(gene)
 
         # 4. 같은 배합액 그룹 너비 정렬 및 SELECTED_CHEMICAL 설정
-        same_chemical_queue = sorted(
-            same_chemical_queue,
-            key=lambda gene: dag_manager.opnode_dict.get(gene)["FABRIC_WIDTH"],
-            reverse=True
-        )
+        same_chemical_queue = sort_by_fabric_width(same_chemical_queue, dag_manager)
 
         for gene in same_chemical_queue:
             dag_manager.opnode_dict[gene]["SELECTED_CHEMICAL"] = best_chemical
@@ -461,7 +579,7 @@ class SetupMinimizedStrategy(HighLevelSchedulingStrategy):
             leader_dict = dag_manager.opnode_dict.get(leader_id)
 
             # 6-2. 리더의 최적 배합액 선택
-            leader_best_chemical = find_best_chemical(leader_dict, remaining_operation_queue, dag_manager)
+            leader_best_chemical = find_best_chemical(leader_dict, remaining_operation_queue, dag_manager, self.rng)
             dag_manager.opnode_dict[leader_id]["SELECTED_CHEMICAL"] = leader_best_chemical
 
             # 6-3. 같은 배합액 사용 가능한 노드들 그룹화
@@ -479,11 +597,7 @@ class SetupMinimizedStrategy(HighLevelSchedulingStrategy):
                     next_remaining.append(gene)
 
             # 6-4. 현재 그룹 너비 정렬
-            current_chemical_group = sorted(
-                current_chemical_group,
-                key=lambda gene: dag_manager.opnode_dict.get(gene)["FABRIC_WIDTH"],
-                reverse=True
-            )
+            current_chemical_group = sort_by_fabric_width(current_chemical_group, dag_manager)
 
             # 6-5. 현재 그룹 스케줄링
             leader_parent_cnt = getattr(dag_manager.nodes[leader_id], "parent_node_count", None)
@@ -520,7 +634,8 @@ class SetupMinimizedStrategy(HighLevelSchedulingStrategy):
 class DispatchPriorityStrategy(HighLevelSchedulingStrategy):
     """우선순위 디스패치 전략 (dispatch_rules.allocating_schedule_by_dispatching_priority 통합)"""
     
-    def execute(self, dag_manager, scheduler, dag_df=None, priority_order=None, window_days=5, **kwargs):
+    def execute(self, dag_manager, scheduler, dag_df=None, priority_order=None, window_days=5,
+                tie_break_rng=None, **kwargs):
         """
         우선순위 순서대로 윈도우를 만들어 스케줄링 실행
         
@@ -530,6 +645,7 @@ class DispatchPriorityStrategy(HighLevelSchedulingStrategy):
             dag_df: DAG 데이터프레임
             priority_order: 우선순위 정렬된 작업 순서 리스트 (None이면 내부에서 생성)
             window_days: 윈도우 크기 (일 단위)
+            tie_break_rng (random.Random, optional): 배합액 동수 선택용 난수 (멀티스타트 디스패치용)
             **kwargs: 추가 파라미터들
             
         Returns:
@@ -583,7 +699,7 @@ class DispatchPriorityStrategy(HighLevelSchedulingStrategy):
         
         
         # 윈도우별로 셋업 최소화 스케줄링 실행
-        setup_strategy = SetupMinimizedStrategy()
+        setup_strategy = SetupMinimizedStrategy(rng=tie_break_rng)
         
         while result:
             base_date = result[0][1]
@@ -609,42 +725,97 @@ class DispatchPriorityStrategy(HighLevelSchedulingStrategy):
         return dag_manager.to_dataframe()
 
 
+def _released_node_ids(node):
+    """
+    node 완료로 parent_node_count가 줄어든 노드 ID
+    (자식 + schedule_ready_aging_children로 함께 스케줄된 Aging 자식의 자식)
+    """
+    released = []
+    stack = list(node.children)
+    while stack:
+        child = stack.pop()
+        released.append(child.id)
+        if child.is_aging and child.node_start is not None:
+            stack.extend(child.children)
+    return released
+
+
 class UserRescheduleStrategy(HighLevelSchedulingStrategy):
     """사용자 재스케줄링 전략 (dag_scheduler.user_reschedule 통합)"""
     
-    def execute(self, dag_manager, scheduler, machine_queues):
+    def execute(self, dag_manager, scheduler, machine_queues, freeze_time=None):
         """
         사용자가 지정한 기계별 큐 순서로 강제 재스케줄링
         
         Args:
             machine_queues: {machine_code: [node_id, ...]} 형태 딕셔너리
+            freeze_time: 지정하면 이미 스케줄된 상태에서 freeze_time 이전에 시작한 작업은 고정하고
+                (freeze_schedule) 큐에서 나머지 노드만 재할당 (None이면 기존처럼 전체 큐 실행)
             
         Returns:
             DataFrame: 재스케줄링 결과
         """
-        progress = True
-        while progress:
-            progress = False  # 이번 루프에서 실행이 있었는지 추적
-            
-            for machine_code, queue in machine_queues.items():
-                if not queue:  # 큐가 비었으면 스킵
-                    continue
-                
-                node_id = queue[0]  # 큐 맨 앞
-                node = dag_manager.nodes[node_id]
-                
+        if freeze_time is not None:
+            reset_ids = set(freeze_schedule(dag_manager, scheduler, freeze_time))
+            machine_queues = {
+                machine_code: [node_id for node_id in queue if node_id in reset_ids]
+                for machine_code, queue in machine_queues.items()
+            }
+
+        # 이벤트 기반 실행: 기존 라운드 순서(기계 순서대로 큐 맨 앞 1개씩)를 유지하되,
+        # ready가 아닌 큐 맨 앞 노드는 시도하지 않고 대기 등록 후 선행 노드 완료 시에만 다시 시도
+        machine_codes = list(machine_queues.keys())
+        positions = [0] * len(machine_codes)   # 큐별 현재 맨 앞 위치
+        waiting = {}                           # 대기 중인 큐 맨 앞 노드 ID → 큐 번호
+        current_round, next_round = [], []     # 이번 / 다음 라운드에 시도할 큐 번호 (heap)
+
+        def register_head(queue_index, round_heap):
+            queue = machine_queues[machine_codes[queue_index]]
+            if positions[queue_index] >= len(queue):
+                return
+            head = dag_manager.nodes[queue[positions[queue_index]]]
+            if SchedulingCore.validate_ready_node(head):
+                heapq.heappush(round_heap, queue_index)
+            else:
+                waiting[head.id] = queue_index
+
+        for queue_index in range(len(machine_codes)):
+            register_head(queue_index, current_round)
+
+        attempts = 0
+        while current_round:
+            while current_round:
+                queue_index = heapq.heappop(current_round)
+                machine_code = machine_codes[queue_index]
+                node = dag_manager.nodes[machine_queues[machine_code][positions[queue_index]]]
+
                 # 강제 기계 할당 전략 사용 (재스케줄링 모드)
                 strategy = ForcedMachineStrategy(machine_code, use_machine_window=True)
-                success = SchedulingCore.schedule_single_node(node, scheduler, strategy)
-                
-                if success:
-                    queue.pop(0)  # 큐에서 제거
-                    progress = True  # 실행이 있었음
-        
+                attempts += 1
+                if not SchedulingCore.schedule_single_node(node, scheduler, strategy):
+                    continue  # ready 상태의 할당 실패는 다시 시도해도 같으므로 해당 큐는 중단
+
+                positions[queue_index] += 1
+                register_head(queue_index, next_round)
+
+                # 이번 완료로 ready가 된 대기 노드 (자동 스케줄된 Aging 자식을 거쳐 풀린 노드 포함)
+                for released_id in _released_node_ids(node):
+                    released_queue = waiting.get(released_id)
+                    if released_queue is not None and SchedulingCore.validate_ready_node(dag_manager.nodes[released_id]):
+                        del waiting[released_id]
+                        # 이번 라운드에서 아직 차례가 오지 않은 큐면 이번 라운드에, 지난 큐면 다음 라운드에 시도
+                        heapq.heappush(current_round if released_queue > queue_index else next_round, released_queue)
+            current_round, next_round = next_round, []
+
+        # 소비된 노드는 큐에서 제거 (기존과 동일하게 큐를 제자리 갱신)
+        for queue_index, machine_code in enumerate(machine_codes):
+            del machine_queues[machine_code][:positions[queue_index]]
+
         # 통계 출력
         queue_lengths = {mid: len(q) for mid, q in machine_queues.items()}
         total_remaining = sum(queue_lengths.values())
-        
+        print(f"[재스케줄링] 사용자 큐 스케줄링 시도 {attempts}회, 남은 노드 {total_remaining}개")
+
         queue_front_info = {}
         for mid, q in machine_queues.items():
             if q:  # 큐가 비어있지 않으면
@@ -663,6 +834,54 @@ class UserRescheduleStrategy(HighLevelSchedulingStrategy):
         return dag_manager.to_dataframe()
 
 
+class IncrementalRescheduleStrategy(HighLevelSchedulingStrategy):
+    """증분 재스케줄링 전략: freeze_time 이후 작업만 우선순위 디스패치로 재할당"""
+
+    def execute(self, dag_manager, scheduler, freeze_time, dag_df, sequence_seperated_order,
+                window_days=5, machine_rest=None, base_date=None):
+        """
+        이미 스케줄된 상태에서 시작 전 작업만 재스케줄링
+
+        1. freeze_schedule: freeze_time 이전 시작 작업 고정, 나머지 노드 초기화
+        2. (선택) 추가 중단시간(고장 등) 삽입
+        3. 초기화된 노드들만으로 디스패치 우선순위 생성 후 DispatchPriorityStrategy 실행
+
+        Args:
+            freeze_time: 고정 기준 시각 (시간 슬롯 단위)
+            dag_df: DAG 데이터프레임 (create_complete_dag_system 결과)
+            sequence_seperated_order: 공정별 분리 주문 (납기일/원단너비)
+            window_days: 윈도우 크기 (일 단위)
+            machine_rest (pd.DataFrame, optional): 추가 중단시간 (allocate_machine_downtime과 같은 형식)
+            base_date (datetime, optional): machine_rest 변환 기준 날짜 (machine_rest가 있으면 필수)
+
+        Returns:
+            DataFrame: 재스케줄링 결과 (전체 노드)
+        """
+        from .dispatch_rules import create_dispatch_rule
+
+        reset_ids = freeze_schedule(dag_manager, scheduler, freeze_time)
+
+        if machine_rest is not None and not machine_rest.empty:
+            if base_date is None:
+                raise ValueError("machine_rest를 지정한 경우 base_date가 필요합니다")
+            scheduler.allocate_additional_downtime(machine_rest, base_date)
+
+        if not reset_ids:
+            return dag_manager.to_dataframe()
+
+        # 재할당 대상 노드만으로 우선순위 생성 (고정된 부모와의 간선은 제외되어 바로 ready)
+        reset_dag_df = dag_df[dag_df[config.columns.PROCESS_ID].isin(set(reset_ids))]
+        priority_order, reset_dag_df = create_dispatch_rule(reset_dag_df, sequence_seperated_order)
+
+        return DispatchPriorityStrategy().execute(
+            dag_manager=dag_manager,
+            scheduler=scheduler,
+            dag_df=reset_dag_df,
+            priority_order=priority_order,
+            window_days=window_days,
+        )
+
+
 class ForcedMachineStrategy(MachineAssignmentStrategy):
     """특정 기계 강제 할당 전략"""
     
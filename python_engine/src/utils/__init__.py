@@ -5,5 +5,7 @@
 """
 
 from .machine_mapper import MachineMapper
+from .stage_cache import StageCache
+from .fork_pool import ForkPool, run_forked, quiet_call
 
-__all__ = ['MachineMapper']
+__all__ = ['MachineMapper', 'StageCache', 'ForkPool', 'run_forked', 'quiet_call']
@@ -0,0 +1,116 @@
+"""
+fork 프로세스 풀 유틸리티
+
+큰 공통 입력(DAG, 스케줄러, 디코더 등)을 fork 전에 모듈 전역에 올려두고 자식 프로세스가
+그대로 참조(copy-on-write)하게 해 pickle 전송 없이 작업 index / 작은 인자만 넘기는 병렬 실행 도구입니다.
+fork를 지원하지 않는 플랫폼이거나 max_workers=1이면 현재 프로세스에서 순차 실행합니다.
+
+Example:
+    def _worker(state, index):
+        return simulate(copy.deepcopy(state['inputs']), index)
+
+    results, used_processes = run_forked({'inputs': inputs}, _worker, range(8), max_workers=4)
+"""
+
+import contextlib
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+# fork된 작업 프로세스가 참조하는 공통 입력 (부모 프로세스에서 풀 생성 전에 설정)
+_SHARED_STATE = {}
+
+
+def _call_with_shared_state(worker, task):
+    """작업 프로세스 진입점: fork로 물려받은 _SHARED_STATE와 함께 worker 호출"""
+    return worker(_SHARED_STATE, task)
+
+
+def quiet_call(quiet, func, *args, **kwargs):
+    """quiet면 표준 출력을 숨기고 func(*args, **kwargs) 실행"""
+    if quiet:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func(*args, **kwargs)
+    return func(*args, **kwargs)
+
+
+class ForkPool:
+    """
+    공유 상태를 물려받는 fork 프로세스 풀 (with 블록 동안 유지)
+
+    worker는 모듈 최상위 함수 worker(state, task)여야 하며, state는 읽기 전용으로 다룹니다
+    (자식 프로세스의 수정은 부모에 반영되지 않으므로 순차 실행과 결과를 맞추려면 필요한 입력은 사본 사용).
+
+    Example:
+        with ForkPool({'decoder': decoder}, max_workers=4) as pool:
+            fitness = pool.map(_evaluate_worker, chunks)
+    """
+
+    def __init__(self, shared_state, max_workers=None, task_count=None):
+        """
+        Args:
+            shared_state (dict): 작업 함수에 전달할 공통 입력
+            max_workers (int, optional): 프로세스 수 (기본: CPU 수). 1이면 순차 실행
+            task_count (int, optional): 작업 수를 알면 전달 (1개 이하면 순차 실행)
+        """
+        self.shared_state = shared_state
+        self.use_processes = (
+            max_workers != 1
+            and (task_count is None or task_count > 1)
+            and 'fork' in multiprocessing.get_all_start_methods()
+        )
+        self.max_workers = (max_workers or multiprocessing.cpu_count()) if self.use_processes else 1
+        self._executor = None
+        self._previous_state = None
+
+    def __enter__(self):
+        if self.use_processes:
+            # fork 시점의 _SHARED_STATE를 자식이 그대로 물려받음 (작업 인자만 전달)
+            self._previous_state = dict(_SHARED_STATE)
+            _SHARED_STATE.clear()
+            _SHARED_STATE.update(self.shared_state)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context('fork')
+            )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._executor is not None:
+            try:
+                self._executor.shutdown()
+            finally:
+                self._executor = None
+                _SHARED_STATE.clear()
+                _SHARED_STATE.update(self._previous_state)
+        return False
+
+    def map(self, worker, tasks):
+        """
+        tasks 각각에 worker(shared_state, task) 실행
+
+        Returns:
+            list: tasks 순서의 결과
+        """
+        tasks = list(tasks)
+        if self._executor is None:
+            return [worker(self.shared_state, task) for task in tasks]
+        return list(self._executor.map(_call_with_shared_state, [worker] * len(tasks), tasks))
+
+
+def run_forked(shared_state, worker, tasks, max_workers=None):
+    """
+    공유 상태를 fork로 물려준 프로세스 풀에서 tasks를 한 번 실행
+
+    Args:
+        shared_state (dict): 작업 함수에 전달할 공통 입력
+        worker (callable): 모듈 최상위 함수 worker(state, task)
+        tasks (iterable): 작업 인자 (보통 index)
+        max_workers (int, optional): 프로세스 수. 1이거나 fork를 지원하지 않으면 순차 실행
+
+    Returns:
+        tuple: (tasks 순서의 결과 리스트, 프로세스 풀 사용 여부)
+    """
+    tasks = list(tasks)
+    with ForkPool(shared_state, max_workers=max_workers, task_count=len(tasks)) as pool:
+        return pool.map(worker, tasks), pool.use_processes
@@ -0,0 +1,274 @@
+"""
+파이프라인 단계 캐시 모듈
+
+각 단계(preprocess_production_data → generate_order_sequences → yield_prediction →
+create_complete_dag_system → run_scheduler_pipeline)의 출력을
+입력 해시 + 관련 config 값 + 단계 코드 해시로 만든 키로 디스크에 저장합니다.
+
+- 외부 입력(DataFrame, 숫자, 날짜 등)은 내용으로 해시합니다.
+- 이전 단계 출력은 내용 대신 그 단계의 키(출처)로 해시하므로 큰 DAG/노드 객체를 다시 해시하지 않습니다.
+  예: machine_rest나 window_days만 바뀌면 스케줄링 단계만 다시 실행됩니다.
+"""
+
+import ast
+import datetime
+import hashlib
+import os
+import pickle
+import sys
+import time
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+from config import config
+
+
+STAGE_CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = "data/cache"
+# 모든 단계 코드 해시에 포함하는 공용 패키지 (src.utils)
+SHARED_CODE_PACKAGE = "utils"
+
+# 단계 코드(패키지 + import하는 src.* 패키지) 소스 해시 캐시: 코드가 바뀌면 해당 단계 키도 바뀜
+_CODE_FINGERPRINTS = {}
+
+
+def _sha256(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def _package_sources(package_dir):
+    """패키지 디렉토리 아래 .py 파일 경로 (정렬)"""
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(package_dir)
+        for name in names if name.endswith('.py')
+    )
+
+
+def _imported_packages(path, package_parts):
+    """소스 파일이 import하는 같은 최상위 패키지(src)의 하위 패키지 이름 집합
+
+    Args:
+        path (str): .py 파일 경로
+        package_parts (list): 파일이 속한 패키지 이름 (예: ['src', 'scheduler'])
+    """
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+    top = package_parts[0]
+    names = set()
+
+    def add(parts, aliases=()):
+        if not parts or parts[0] != top:
+            return
+        if len(parts) > 1:
+            names.add(parts[1])
+        else:
+            # from src import utils / from .. import utils
+            names.update(alias.name for alias in aliases)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                add(alias.name.split('.'))
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package_parts[:len(package_parts) - (node.level - 1)]
+            else:
+                base = []
+            add(base + (node.module.split('.') if node.module else []), node.names)
+    return names
+
+
+def _code_fingerprint(func):
+    """func가 정의된 패키지와 그 패키지가 (간접적으로) import하는 src.* 패키지 전체의 .py 소스 해시
+
+    단계 함수가 다른 패키지의 코드를 사용하므로 그 코드가 바뀌어도 키가 바뀌어야 합니다.
+    src.utils는 import 없이 인자 객체(MachineMapper 등)로 쓰이기도 하므로 항상 포함합니다.
+    """
+    module_name = func.__module__
+    if module_name not in _CODE_FINGERPRINTS:
+        module_file = getattr(sys.modules.get(module_name), '__file__', None)
+        parts = module_name.split('.')
+        if module_file is None:
+            _CODE_FINGERPRINTS[module_name] = _sha256(module_name, getattr(func, '__qualname__', repr(func)))
+        elif len(parts) < 2:
+            # 최상위 단일 모듈: 해당 파일만
+            with open(module_file, 'rb') as f:
+                _CODE_FINGERPRINTS[module_name] = _sha256(module_name, f.read())
+        else:
+            # module_file에서 패키지 깊이만큼 올라가면 최상위 패키지(src)를 포함하는 디렉토리
+            root_dir = os.path.dirname(module_file)
+            for _ in range(len(parts) - (1 if os.path.basename(module_file) == '__init__.py' else 2)):
+                root_dir = os.path.dirname(root_dir)
+            root_dir = os.path.dirname(root_dir)
+
+            top = parts[0]
+            pending, packages = [parts[1], SHARED_CODE_PACKAGE], set()
+            while pending:
+                package = pending.pop()
+                package_dir = os.path.join(root_dir, top, package)
+                if package in packages or not os.path.isdir(package_dir):
+                    continue
+                packages.add(package)
+                for path in _package_sources(package_dir):
+                    relative = os.path.relpath(os.path.dirname(path), root_dir).split(os.sep)
+                    pending.extend(_imported_packages(path, relative) - packages)
+
+            digest = hashlib.sha256()
+            for package in sorted(packages):
+                for path in _package_sources(os.path.join(root_dir, top, package)):
+                    with open(path, 'rb') as f:
+                        digest.update(os.path.relpath(path, root_dir).encode('utf-8'))
+                        digest.update(f.read())
+            _CODE_FINGERPRINTS[module_name] = digest.hexdigest()
+    return _CODE_FINGERPRINTS[module_name]
+
+
+def _frame_fingerprint(df):
+    """DataFrame / Series 내용 해시 (컬럼, dtype, 인덱스 포함)"""
+    header = (list(df.columns), [str(dtype) for dtype in df.dtypes]) if isinstance(df, pd.DataFrame) \
+        else (df.name, str(df.dtype))
+    try:
+        values = pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()
+    except TypeError:
+        # 리스트 등 해시 불가능한 셀이 있으면 pickle 바이트로 해시
+        values = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+    return _sha256('frame', repr(header), values)
+
+
+class StageCache:
+    """
+    내용 주소 기반 단계 캐시
+
+    Example:
+        cache = StageCache("data/cache")
+        processed_data = cache.run('preprocess', preprocess_production_data, dict(order_df=order_df, ...))
+        result, scheduler = cache.run('schedule', run_scheduler_pipeline, dict(dag_df=dag_df, ...))
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, enabled=True):
+        """
+        Args:
+            cache_dir (str): 캐시 저장 디렉토리 (단계별 하위 디렉토리에 <키>.pkl로 저장)
+            enabled (bool): False면 캐시 없이 항상 실행
+        """
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self._provenance = {}  # id(단계 출력 객체) → (객체, 출처 키)
+        self.last_status = {}  # 단계 이름 → 'hit' / 'miss' / 'disabled'
+
+    # ===================================================================
+    # 키 계산
+    # ===================================================================
+    def fingerprint(self, value):
+        """값 해시 (이전 단계 출력이면 출처 키 사용)"""
+        provenance = self._provenance.get(id(value))
+        if provenance is not None and provenance[0] is value:
+            return provenance[1]
+
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return _frame_fingerprint(value)
+        if value is None or isinstance(value, (bool, int, float, str, datetime.date, datetime.datetime, pd.Timestamp)):
+            return _sha256('scalar', type(value).__name__, repr(value))
+        if isinstance(value, np.ndarray):
+            return _sha256('array', str(value.dtype), value.shape, value.tobytes())
+        if isinstance(value, dict):
+            return _sha256('dict', *(f"{self.fingerprint(k)}={self.fingerprint(v)}" for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return _sha256(type(value).__name__, *(self.fingerprint(v) for v in value))
+        return _sha256('pickle', pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def stage_key(self, stage_name, func, kwargs, constants=()):
+        """
+        단계 키 = 단계 이름 + 코드 해시 + 입력 해시 + config 값
+
+        Args:
+            stage_name (str): 단계 이름
+            func (callable): 단계 함수
+            kwargs (dict): 단계 함수 인자
+            constants (tuple): 키에 포함할 config.constants 필드 이름 (컬럼명 설정은 항상 포함)
+        """
+        input_parts = [f"{name}={self.fingerprint(value)}" for name, value in sorted(kwargs.items())]
+        constant_parts = [f"{name}={getattr(config.constants, name)!r}" for name in sorted(constants)]
+        return _sha256(
+            STAGE_CACHE_VERSION, stage_name, _code_fingerprint(func),
+            repr(sorted(asdict(config.columns).items())), *constant_parts, *input_parts
+        )
+
+    # ===================================================================
+    # 실행
+    # ===================================================================
+    def _register_outputs(self, key, outputs):
+        """출력 객체(튜플 원소 / dict 값 포함)에 출처 키 등록"""
+        self._provenance[id(outputs)] = (outputs, key)
+        if isinstance(outputs, tuple):
+            items = enumerate(outputs)
+        elif isinstance(outputs, dict):
+            items = outputs.items()
+        else:
+            items = ()
+        for name, value in items:
+            self._provenance[id(value)] = (value, _sha256(key, name))
+
+    def _path(self, stage_name, key):
+        return os.path.join(self.cache_dir, stage_name, f"{key}.pkl")
+
+    def run(self, stage_name, func, kwargs, constants=()):
+        """
+        캐시된 출력이 있으면 로딩, 없으면 func(**kwargs) 실행 후 저장
+
+        주의: 출력 객체는 출처 키로 추적되므로, 다음 단계에 넘기기 전에 제자리 수정하지 마세요.
+
+        Args:
+            stage_name (str): 단계 이름 (캐시 하위 디렉토리명)
+            func (callable): 단계 함수
+            kwargs (dict): 단계 함수 인자
+            constants (tuple): 단계가 참조하는 config.constants 필드 이름
+
+        Returns:
+            func(**kwargs)의 반환값 (또는 캐시된 동일한 값)
+        """
+        if not self.enabled:
+            self.last_status[stage_name] = 'disabled'
+            return func(**kwargs)
+
+        started = time.perf_counter()
+        key = self.stage_key(stage_name, func, kwargs, constants)
+        path = self._path(stage_name, key)
+
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                outputs = pickle.load(f)
+            self.last_status[stage_name] = 'hit'
+            print(f"[캐시] {stage_name} 캐시 사용 ({key[:12]}, {time.perf_counter() - started:.2f}s)")
+        else:
+            outputs = func(**kwargs)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 다른 프로세스가 읽는 중 깨진 파일을 보지 않도록 임시 파일에 쓰고 교체
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump(outputs, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+            self.last_status[stage_name] = 'miss'
+            print(f"[캐시] {stage_name} 실행 후 저장 ({key[:12]}, {time.perf_counter() - started:.2f}s)")
+
+        self._register_outputs(key, outputs)
+        return outputs
+
+    def clear(self, stage_name=None):
+        """캐시 파일 삭제 (stage_name이 없으면 전체)"""
+        stage_names = [stage_name] if stage_name else (
+            os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else []
+        )
+        for name in stage_names:
+            stage_dir = os.path.join(self.cache_dir, name)
+            if not os.path.isdir(stage_dir):
+                continue
+            for file_name in os.listdir(stage_dir):
+                if file_name.endswith('.pkl'):
+                    os.remove(os.path.join(stage_dir, file_name))
@@ -154,16 +154,27 @@ def preprocess_production_data(
 
     # 옵션: Excel 파일로 저장
     if save_output:
-        print(f"[Validation] 중간 결과를 {output_file}에 저장 중...")
-        with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
-            for sheet_name, df in processed_data.items():
-                if type(df) == pd.DataFrame: # 데이터프레임 타입만 저장. 이때 validation_result는 딕셔너리이므로 저장하지 않음  
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-        print(f"[Validation] 저장 완료: {output_file}")
+        save_processed_data(processed_data, output_file)
 
     print("[Validation] 전처리 완료!")
 
     return processed_data
 
 
-__all__ = ['preprocess_production_data', 'ProductionDataPreprocessor', 'DataValidator']
+def save_processed_data(processed_data: Dict, output_file: str = "data/input/python_input.xlsx") -> None:
+    """
+    전처리 결과의 DataFrame들을 시트별로 Excel 파일에 저장
+
+    Args:
+        processed_data (Dict): preprocess_production_data 반환값
+        output_file (str): 저장할 파일 경로
+    """
+    print(f"[Validation] 중간 결과를 {output_file}에 저장 중...")
+    with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
+        for sheet_name, df in processed_data.items():
+            if type(df) == pd.DataFrame: # 데이터프레임 타입만 저장. 이때 validation_result는 딕셔너리이므로 저장하지 않음  
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+    print(f"[Validation] 저장 완료: {output_file}")
+
+
+__all__ = ['preprocess_production_data', 'save_processed_data', 'ProductionDataPreprocessor', 'DataValidator']
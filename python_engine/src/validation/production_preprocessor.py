@@ -71,6 +71,38 @@ class ProductionDataPreprocessor:
 
         return df, selected_cols
 
+    def _select_first_valid(self, df: pd.DataFrame, period_cols: list) -> Tuple[pd.Series, pd.Series]:
+        """
+        기간 컬럼 중 첫 번째 유효값(NaN, 0 제외)과 해당 컬럼명 선택
+
+        기간 컬럼만 NumPy 배열로 변환해 유효 여부의 argmax로 첫 유효 위치를 구합니다.
+
+        Args:
+            df: 데이터프레임
+            period_cols: 우선순위 순서의 기간 컬럼 리스트
+
+        Returns:
+            tuple: (선택된 값 Series - 유효값 없으면 NaN, 선택된 컬럼명 Series - 유효값 없으면 None)
+        """
+        if not period_cols:
+            raise ValueError("선택된 기간 컬럼이 없습니다.")
+
+        values = df[period_cols].to_numpy()
+        valid = pd.notna(values) & (values != 0)
+        rows = np.arange(len(df))
+        first = valid.argmax(axis=1)
+        has_valid = valid[rows, first]
+
+        selected_values = pd.Series(values[rows, first], index=df.index)
+        if not valid.all():
+            # 0/NaN이 있으면 기존 NaN 치환 결과와 같이 실수형
+            selected_values = selected_values.where(has_valid).astype(float)
+
+        selected_names = pd.Series(
+            np.where(has_valid, np.asarray(period_cols, dtype=object)[first], None), index=df.index, dtype=object
+        )
+        return selected_values, selected_names
+
     def preprocess_linespeed_data(self, linespeed_df: pd.DataFrame,
                                  linespeed_period: str = '6_months') -> pd.DataFrame:
         """
@@ -100,16 +132,8 @@ class ProductionDataPreprocessor:
             linespeed, linespeed_period, 'l', period_mapping
         )
 
-        # 0을 NaN으로 변경
-        linespeed = linespeed.replace(0, np.nan)
-
-        # NaN이 아닌 첫 번째 값으로 linespeed 컬럼 생성
-        linespeed['selected_linespeed'] = linespeed[linespeed_cols].bfill(axis=1).iloc[:, 0]
-
-        # 선택된 컬럼명 저장
-        linespeed['selected'] = linespeed[linespeed_cols].apply(
-            lambda x: x.first_valid_index(), axis=1
-        )
+        # 0/NaN이 아닌 첫 번째 값으로 linespeed 컬럼 생성 및 선택된 컬럼명 저장
+        linespeed['selected_linespeed'], linespeed['selected'] = self._select_first_valid(linespeed, linespeed_cols)
 
         # L로 시작하는 컬럼 제거
         linespeed = linespeed.drop(
@@ -178,20 +202,12 @@ class ProductionDataPreprocessor:
             yield_data, yield_period, 's', period_mapping
         )
 
-        # 0을 NaN으로 변경
-        yield_data = yield_data.replace(0, np.nan)
-
-        # NaN이 아닌 첫 번째 값으로 yield 컬럼 생성
-        yield_data[config.columns.YIELD] = yield_data[yield_cols].bfill(axis=1).iloc[:, 0]
+        # 0/NaN이 아닌 첫 번째 값으로 yield 컬럼 생성 및 선택된 컬럼명 저장
+        yield_data[config.columns.YIELD], yield_data['selected'] = self._select_first_valid(yield_data, yield_cols)
 
         # 수율이 없으면 100으로 설정
         yield_data[config.columns.YIELD] = yield_data[config.columns.YIELD].replace(np.nan, 100)
 
-        # 선택된 컬럼명 저장
-        yield_data['selected'] = yield_data[yield_cols].apply(
-            lambda x: x.first_valid_index(), axis=1
-        )
-
         # S로 시작하는 컬럼 제거
         yield_data = yield_data.drop(
             columns=yield_data.columns[yield_data.columns.str.startswith("s")]
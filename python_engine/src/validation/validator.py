@@ -120,26 +120,31 @@ class DataValidator:
                 self.errors.append(error_msg)
                 print(f"  - 제품코드: {gitem}")
 
-        # 각 GitemNo별 PROCSEQ 연속성 확인
+        # 각 GitemNo별 PROCSEQ 연속성 확인 (정렬 후 그룹 내 순번과 비교)
+        target_operations = operation_df[operation_df[config.columns.GITEM].isin(operation_gitems & set(unique_gitems))]
+        target_operations = target_operations.sort_values(config.columns.OPERATION_ORDER, kind='stable')
+        gitem_groups = target_operations.groupby(config.columns.GITEM, sort=False)
+        expected_order = gitem_groups.cumcount() + 1
+        is_contiguous = (target_operations[config.columns.OPERATION_ORDER] == expected_order).groupby(
+            target_operations[config.columns.GITEM], sort=False
+        ).all()
+        invalid_gitems = set(is_contiguous.index[~is_contiguous.to_numpy(dtype=bool)])
+
         seq_errors = []
         for gitem in unique_gitems:
-            if gitem not in operation_gitems:
+            if gitem not in invalid_gitems:
                 continue
-
-            gitem_operations = operation_df[operation_df[config.columns.GITEM] == gitem].sort_values(config.columns.OPERATION_ORDER)
-            procseq_values = gitem_operations[config.columns.OPERATION_ORDER].tolist()
-
-            # PROCSEQ가 1부터 시작하고 연속적인지 확인
+            procseq_values = gitem_groups.get_group(gitem)[config.columns.OPERATION_ORDER].tolist()
             expected_seq = list(range(1, len(procseq_values) + 1))
-            if procseq_values != expected_seq:
-                error_msg = f"[GITEM-공정-순서] 제품코드={gitem}의 공정순서(PROCSEQ)가 연속적이지 않습니다. 현재: {procseq_values}, 예상: {expected_seq}"
-                self.errors.append(error_msg)
-                seq_errors.append((gitem, procseq_values, expected_seq))
-
-            else:
-                # 정상이면 (GitemNo, PROCCODE) 쌍 저장
-                for _, row in gitem_operations.iterrows():
-                    self.gitem_proccode_pairs.add((row[config.columns.GITEM], row[config.columns.OPERATION_CODE]))
+            error_msg = f"[GITEM-공정-순서] 제품코드={gitem}의 공정순서(PROCSEQ)가 연속적이지 않습니다. 현재: {procseq_values}, 예상: {expected_seq}"
+            self.errors.append(error_msg)
+            seq_errors.append((gitem, procseq_values, expected_seq))
+
+        # 정상이면 (GitemNo, PROCCODE) 쌍 저장
+        valid_operations = target_operations[~target_operations[config.columns.GITEM].isin(invalid_gitems)]
+        self.gitem_proccode_pairs.update(
+            zip(valid_operations[config.columns.GITEM], valid_operations[config.columns.OPERATION_CODE])
+        )
 
         if seq_errors:
             print(f"[ERROR] 공정순서(PROCSEQ)가 연속적이지 않은 제품코드 ({len(seq_errors)}건)")
@@ -166,13 +171,8 @@ class DataValidator:
         missing_pairs = []
         duplicate_pairs = []
 
-        for gitem, proccode in self.gitem_proccode_pairs:
-            yield_rows = yield_df[
-                (yield_df[config.columns.GITEM] == gitem) &
-                (yield_df[config.columns.OPERATION_CODE] == proccode)
-            ]
-            row_count = len(yield_rows)
-
+        pairs = list(self.gitem_proccode_pairs)
+        for (gitem, proccode), row_count in zip(pairs, self._count_pair_rows(yield_df, pairs)):
             if row_count == 0:
                 error_msg = f"[수율-GITEM등] (제품코드={gitem}, 공정코드={proccode})가 수율-GITEM등 테이블에 존재하지 않습니다."
                 self.errors.append(error_msg)
@@ -210,13 +210,8 @@ class DataValidator:
         missing_pairs = []
         duplicate_pairs = []
 
-        for gitem, proccode in self.gitem_proccode_pairs:
-            linespeed_rows = linespeed_df[
-                (linespeed_df[config.columns.GITEM] == gitem) &
-                (linespeed_df[config.columns.OPERATION_CODE] == proccode)
-            ]
-            row_count = len(linespeed_rows)
-
+        pairs = list(self.gitem_proccode_pairs)
+        for (gitem, proccode), row_count in zip(pairs, self._count_pair_rows(linespeed_df, pairs)):
             if row_count == 0:
                 error_msg = f"[라인스피드-GITEM등] (제품코드={gitem}, 공정코드={proccode})가 라인스피드-GITEM등 테이블에 존재하지 않습니다."
                 self.errors.append(error_msg)
@@ -255,13 +250,8 @@ class DataValidator:
         missing_pairs = []
         duplicate_pairs = []
 
-        for gitem, proccode in self.gitem_proccode_pairs:
-            chemical_rows = chemical_df[
-                (chemical_df[config.columns.GITEM] == gitem) &
-                (chemical_df[config.columns.OPERATION_CODE] == proccode)
-            ]
-            row_count = len(chemical_rows)
-
+        pairs = list(self.gitem_proccode_pairs)
+        for (gitem, proccode), row_count in zip(pairs, self._count_pair_rows(chemical_df, pairs)):
             if row_count == 0:
                 warning_msg = f"[배합액정보] (제품코드={gitem}, 공정코드={proccode})가 배합액정보 테이블에 존재하지 않습니다. (배합액이 필요 없는 공정일 수 있음)"
                 self.warnings.append(warning_msg)
@@ -286,6 +276,25 @@ class DataValidator:
         if not missing_pairs and not duplicate_pairs:
             print(f"[PASS] 검증 통과: 모든 (제품코드, 공정코드) 쌍이 배합액정보 테이블에 정확히 1개씩 존재합니다.")
 
+    @staticmethod
+    def _count_pair_rows(df: pd.DataFrame, pairs: List[Tuple[str, str]]) -> List[int]:
+        """
+        (GitemNo, PROCCODE) 쌍별 테이블 행 수 계산
+
+        groupby 한 번으로 쌍별 행 수를 구한 뒤 pairs 순서로 재배열합니다.
+
+        Args:
+            df: GITEM, OPERATION_CODE 컬럼을 가진 테이블
+            pairs: 조회할 (GitemNo, PROCCODE) 쌍 목록
+
+        Returns:
+            List[int]: pairs 순서의 행 수 (없으면 0)
+        """
+        if not pairs:
+            return []
+        pair_counts = df.groupby([config.columns.GITEM, config.columns.OPERATION_CODE]).size()
+        return pair_counts.reindex(pd.MultiIndex.from_tuples(pairs), fill_value=0).astype(int).tolist()
+
     def _print_summary(self, result: Dict):
         """검증 결과 요약 출력"""
         print("\n" + "="*80)
@@ -14,15 +14,19 @@ def yield_prediction(yield_data, sequence_seperated_order):
     # 수율 정보 추가
     sequence_seperated_order_yield = sequence_seperated_order.merge(yield_data, on = [config.columns.GITEM, config.columns.OPERATION_CODE], how = 'left')
 
-    # item과 process_sequence로 정렬
+    # item과 process_sequence로 정렬 (GITEM 결측 행은 그룹에서 제외)
+    sequence_seperated_order_yield = sequence_seperated_order_yield[sequence_seperated_order_yield[config.columns.GITEM].notna()]
     sequence_seperated_order_yield = sequence_seperated_order_yield.sort_values([config.columns.GITEM, config.columns.OPERATION_ORDER]).reset_index(drop=True)
 
-    # item별로 그룹화하여 투입 비율 계산
-    sequence_seperated_order_yield = sequence_seperated_order_yield.groupby(config.columns.GITEM, group_keys=False).apply(calculate_input_ratio)
+    # item별 투입 비율 계산
+    input_ratio = calculate_input_ratio(
+        sequence_seperated_order_yield[config.columns.YIELD],
+        sequence_seperated_order_yield[config.columns.GITEM]
+    )
 
     sequence_seperated_order_yield.rename(columns = { config.columns.PRODUCTION_LENGTH: config.columns.ORIGINAL_PRODUCTION_LENGTH}, inplace = True)
-    sequence_seperated_order_yield[config.columns.PRODUCTION_LENGTH] = sequence_seperated_order_yield[config.columns.ORIGINAL_PRODUCTION_LENGTH] * sequence_seperated_order_yield[config.columns.PRODUCT_RATIO]
-    sequence_seperated_order_yield.drop(columns = {config.columns.YIELD, config.columns.PRODUCT_RATIO}, inplace = True)
+    sequence_seperated_order_yield[config.columns.PRODUCTION_LENGTH] = sequence_seperated_order_yield[config.columns.ORIGINAL_PRODUCTION_LENGTH] * input_ratio
+    sequence_seperated_order_yield.drop(columns = {config.columns.YIELD}, inplace = True)
 
     # 결과 길이를 10의 자리에서 반올림
     sequence_seperated_order_yield[config.columns.PRODUCTION_LENGTH] = (sequence_seperated_order_yield[config.columns.PRODUCTION_LENGTH].round(-1).astype(int)
@@ -31,28 +35,19 @@ def yield_prediction(yield_data, sequence_seperated_order):
     return sequence_seperated_order_yield
 
 
-def calculate_input_ratio(group):
+def calculate_input_ratio(yields, groups):
     """
     공정별 수율을 고려한 투입 비율을 계산합니다.
 
-    역순으로 누적 곱을 계산하여 각 공정에서 필요한 투입량 비율을 산출합니다.
+    그룹(item)별로 역순 누적 곱을 계산하여 각 공정에서 필요한 투입량 비율을 산출합니다.
+    (역순 시리즈에 대한 groupby cumprod, 수율 결측 시 이전 공정들도 결측)
 
     Args:
-        group: 같은 item으로 그룹화된 DataFrame
+        yields: 공정순서로 정렬된 수율 (단위: %)
+        groups: 같은 길이의 그룹 키 (item)
 
     Returns:
-        input_ratio 컬럼이 추가된 DataFrame
+        pd.Series: yields와 같은 인덱스의 투입 비율
     """
-    yields = group[config.columns.YIELD].values
-    num_processes = len(yields)
-    ratios = [1] * num_processes
-
-    accumulator = 1
-
-    # 역순으로 진행하며 누적 곱을 계산
-    for i in range(num_processes - 1, -1, -1):
-        accumulator *= 1 / yields[i] * 100
-        ratios[i] = accumulator
-
-    group[config.columns.PRODUCT_RATIO] = ratios
-    return group
+    factors = 1 / yields * 100
+    return factors[::-1].groupby(groups[::-1], sort=False).cumprod(skipna=False)[::-1]
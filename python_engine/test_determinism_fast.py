@@ -284,6 +284,274 @@ if not is_consistent:
 else:
     print("[OK] 스케줄링 결과는 결정적입니다!")
 
+# ============================================================================
+# 테스트 8: 단계 캐시 (hit / miss)
+# ============================================================================
+print(f"\n[테스트 8] 단계 캐시 hit/miss 검증")
+print("-" * 80)
+
+import tempfile
+from src.utils import StageCache
+
+def run_cached_stages(cache_dir, window_days):
+    """DAG → 스케줄링 단계를 캐시로 실행하고 (결과 해시, 단계별 상태) 반환"""
+    stage_cache = StageCache(cache_dir)
+    with SuppressOutput():
+        dag_df_c, opnode_dict_c, manager_c, machine_dict_c, _ = stage_cache.run(
+            'dag', create_complete_dag_system, dict(
+                sequence_seperated_order=seq_yield, linespeed=linespeed,
+                machine_mapper=machine_mapper, aging_df=processed['aging_data']))
+        result_c, _ = stage_cache.run('schedule', run_scheduler_pipeline, dict(
+            dag_df=dag_df_c, opnode_dict=opnode_dict_c, manager=manager_c, machine_dict=machine_dict_c,
+            sequence_seperated_order=seq_yield, width_change_df=processed['width_change'],
+            operation_delay_df=processed['operation_delay'], machine_mapper=machine_mapper,
+            machine_rest=machine_rest, base_date=base_date, window_days=window_days))
+    return hash_dataframe(result_c), dict(stage_cache.last_status)
+
+with tempfile.TemporaryDirectory() as cache_dir:
+    first_hash, first_status = run_cached_stages(cache_dir, config.constants.WINDOW_DAYS)
+    second_hash, second_status = run_cached_stages(cache_dir, config.constants.WINDOW_DAYS)
+    changed_hash, changed_status = run_cached_stages(cache_dir, config.constants.WINDOW_DAYS + 1)
+
+print(f"  1회차: {first_status}, 2회차: {second_status}, window_days 변경: {changed_status}")
+cache_ok = (
+    first_status == {'dag': 'miss', 'schedule': 'miss'}
+    and second_status == {'dag': 'hit', 'schedule': 'hit'}
+    and changed_status == {'dag': 'hit', 'schedule': 'miss'}
+)
+is_consistent = check_consistency([first_hash, second_hash, result_hashes[0]], "stage_cache_result")
+if cache_ok and is_consistent:
+    print("[OK] 캐시 hit 결과가 직접 실행과 같고, 바뀐 입력의 단계만 다시 실행합니다!")
+else:
+    print("\n[WARN] 단계 캐시 hit/miss 또는 캐시된 결과가 기대와 다릅니다!")
+
+# ============================================================================
+# 테스트 9: DAG 체크포인트 (저장 → 로딩 후 스케줄 동일)
+# ============================================================================
+print(f"\n[테스트 9] DAG 체크포인트 저장/로딩 후 스케줄 동일성 검증")
+print("-" * 80)
+
+from src.dag_management import save_dag_checkpoint, load_dag_checkpoint
+
+def schedule_dag(dag_state):
+    """(dag_df, opnode_dict, manager, machine_dict, merged_df)로 스케줄링 후 결과 반환"""
+    dag_df_s, opnode_dict_s, manager_s, machine_dict_s, _ = dag_state
+    with SuppressOutput():
+        result_s, _ = run_scheduler_pipeline(
+            dag_df=dag_df_s, opnode_dict=opnode_dict_s, manager=manager_s, machine_dict=machine_dict_s,
+            sequence_seperated_order=seq_yield.copy(), width_change_df=processed['width_change'].copy(),
+            operation_delay_df=processed['operation_delay'].copy(), machine_mapper=machine_mapper,
+            machine_rest=machine_rest.copy(), base_date=base_date, window_days=config.constants.WINDOW_DAYS)
+    return result_s
+
+with SuppressOutput():
+    fresh_dag = create_complete_dag_system(seq_yield.copy(), linespeed.copy(), machine_mapper, processed['aging_data'].copy())
+with tempfile.TemporaryDirectory() as checkpoint_dir:
+    checkpoint_path = os.path.join(checkpoint_dir, "dag_checkpoint.npz")
+    save_dag_checkpoint(checkpoint_path, *fresh_dag)
+    loaded_dag = load_dag_checkpoint(checkpoint_path)
+
+checkpoint_hashes = [hash_dataframe(schedule_dag(loaded_dag)), hash_dataframe(schedule_dag(fresh_dag)), result_hashes[0]]
+if check_consistency(checkpoint_hashes, "checkpoint_schedule"):
+    print("[OK] 체크포인트에서 복원한 DAG로 같은 스케줄이 나옵니다!")
+else:
+    print("\n[WARN] 체크포인트 로딩 후 스케줄링 결과가 다릅니다!")
+
+# ============================================================================
+# 테스트 10: 증분 재스케줄링 (freeze_time=0 == 전체 스케줄링)
+# ============================================================================
+print(f"\n[테스트 10] freeze_time=0 증분 재스케줄링 == 전체 스케줄링 검증")
+print("-" * 80)
+
+from src.scheduler import run_incremental_reschedule
+
+def schedule_fresh(seq_s=seq_yield, linespeed_s=linespeed, processed_s=processed):
+    """새 DAG로 스케줄링 → (결과, 스케줄러, manager, dag_df)"""
+    with SuppressOutput():
+        dag_df_f, opnode_dict_f, manager_f, machine_dict_f, _ = create_complete_dag_system(
+            seq_s.copy(), linespeed_s.copy(), machine_mapper, processed_s['aging_data'].copy())
+        result_f, scheduler_f = run_scheduler_pipeline(
+            dag_df=dag_df_f, opnode_dict=opnode_dict_f, manager=manager_f, machine_dict=machine_dict_f,
+            sequence_seperated_order=seq_s.copy(), width_change_df=processed_s['width_change'].copy(),
+            operation_delay_df=processed_s['operation_delay'].copy(), machine_mapper=machine_mapper,
+            machine_rest=machine_rest.copy(), base_date=base_date, window_days=config.constants.WINDOW_DAYS)
+    return result_f, scheduler_f, manager_f, dag_df_f
+
+def machine_state(scheduler_m):
+    """기계별 (작업, 시작, 종료) 상태"""
+    return {code: ([list(task) for task in machine.assigned_task], list(machine.O_start), list(machine.O_end))
+            for code, machine in scheduler_m.Machines.items()}
+
+full_result, full_scheduler, full_manager, full_dag_df = schedule_fresh()
+full_machines = machine_state(full_scheduler)
+with SuppressOutput():
+    freeze_result, _ = run_incremental_reschedule(
+        full_scheduler, full_manager, full_dag_df, seq_yield.copy(), 0, base_date, config.constants.WINDOW_DAYS)
+
+freeze_hashes = [hash_dataframe(freeze_result), hash_dataframe(full_result), result_hashes[0]]
+is_consistent = check_consistency(freeze_hashes, "freeze_0_schedule")
+if is_consistent and machine_state(full_scheduler) == full_machines:
+    print("[OK] freeze_time=0 재스케줄링은 전체 스케줄링과 같습니다!")
+else:
+    print("\n[WARN] freeze_time=0 재스케줄링 결과(또는 기계 할당 상태)가 전체 스케줄링과 다릅니다!")
+
+# ============================================================================
+# 테스트 11: 지역 탐색 (이동 없으면 디스패치 결과 유지, 같은 seed면 같은 결과)
+# ============================================================================
+print(f"\n[테스트 11] 지역 탐색 결정성 / 이동 없는 경우 디스패치 결과 유지 검증")
+print("-" * 80)
+
+from src.scheduler import improve_schedule
+
+# 테스트 11 이후는 main.py처럼 검증(validate=True)된 입력 사용
+# (validate=False 입력은 수율 데이터 중복 행 때문에 같은 공정이 기계에 여러 번 배정되어 기계 순서를 평가할 수 없음)
+with SuppressOutput():
+    processed_v = preprocess_production_data(
+        order_df=order_df, linespeed_df=linespeed_df, operation_df=operation_df, yield_df=yield_df,
+        chemical_df=chemical_df, operation_delay_df=operation_delay_df, width_change_df=width_change_df,
+        gitem_sitem_df=gitem_sitem_df, aging_gitem_df=aging_gitem, aging_gbn_df=aging_gbn,
+        global_machine_limit_df=global_machine_limit_raw,
+        linespeed_period=config.constants.LINESPEED_PERIOD, yield_period=config.constants.YIELD_PERIOD,
+        validate=True, save_output=False)
+    seq_v, linespeed_v, *_ = generate_order_sequences(
+        processed_v['order_data'], processed_v['operation_sequence'], processed_v['operation_types'],
+        local_machine_limit, processed_v['global_machine_limit'], machine_allocate,
+        processed_v['linespeed'], processed_v['chemical_data'])
+    seq_v = yield_prediction(processed_v['yield_data'], seq_v)
+validated_inputs = dict(seq_s=seq_v, linespeed_s=linespeed_v, processed_s=processed_v)
+
+untouched_result, untouched_scheduler, untouched_manager, _ = schedule_fresh(**validated_inputs)
+untouched_machines = machine_state(untouched_scheduler)
+with SuppressOutput():
+    _, zero_stats = improve_schedule(untouched_scheduler, untouched_manager, seq_v, base_date,
+                                     time_budget=None, max_iterations=0)
+untouched_ok = (not zero_stats['applied'] and machine_state(untouched_scheduler) == untouched_machines
+                and hash_dataframe(untouched_manager.to_dataframe()) == hash_dataframe(untouched_result))
+print(f"  이동 0회: 반영 {zero_stats['applied']}, 현재 {zero_stats['initial_objective']}, "
+      f"재계산 {zero_stats['decoded_objective']}")
+
+local_search_hashes = []
+for i in range(2):
+    _, ls_scheduler, ls_manager, _ = schedule_fresh(**validated_inputs)
+    with SuppressOutput():
+        ls_result, ls_stats = improve_schedule(ls_scheduler, ls_manager, seq_v, base_date,
+                                               time_budget=None, seed=0, max_iterations=500)
+    local_search_hashes.append(hash_dataframe(ls_result))
+is_consistent = check_consistency(local_search_hashes, "local_search_result")
+if untouched_ok and is_consistent:
+    print("[OK] 이동이 없으면 디스패치 결과를 그대로 두고, 같은 seed/반복 횟수면 같은 결과입니다!")
+else:
+    print("\n[WARN] 지역 탐색이 이동 없이 스케줄을 바꿨거나 같은 seed에서 결과가 다릅니다!")
+
+# ============================================================================
+# 테스트 12: 커널 vs 디스패치 (변경 없는 스케줄)
+# ============================================================================
+print(f"\n[테스트 12] 스케줄 커널 vs 디스패치 결과 검증 (변경 없는 스케줄)")
+print("-" * 80)
+
+from src.scheduler import ScheduleKernel
+
+_, kernel_scheduler, kernel_manager, _ = schedule_fresh(**validated_inputs)
+kernel_machines = machine_state(kernel_scheduler)
+kernel = ScheduleKernel(kernel_scheduler, kernel_manager, seq_v, base_date)
+kernel_objective = kernel.schedule_objective(kernel_scheduler, kernel_manager)
+
+# 노드 종료 시간 / P/O 납기로 직접 계산한 지각 주문 수, 총 지각시간, makespan
+node_end = {node_id: node.node_end for node_id, node in kernel_manager.nodes.items() if node.node_end is not None}
+due_slots = (pd.to_datetime(seq_v[config.columns.DUE_DATE]) - pd.Timestamp(base_date)).dt.total_seconds() / 60 / config.constants.TIME_MULTIPLIER
+order_completion, order_due = {}, {}
+for process_id, po_nos, due_slot in zip(seq_v[config.columns.PROCESS_ID], seq_v[config.columns.PO_NO].astype(str), due_slots):
+    if process_id not in node_end:
+        continue
+    for po_no in (po.strip() for po in po_nos.split(',')):
+        order_completion[po_no] = max(order_completion.get(po_no, 0), node_end[process_id])
+        if pd.notna(due_slot):
+            order_due[po_no] = min(order_due.get(po_no, due_slot), due_slot)
+tardiness = [max(order_completion[po_no] - due, 0) for po_no, due in order_due.items()]
+expected = (sum(1 for t in tardiness if t > 0), float(sum(tardiness)), max(node_end.values()))
+read_ok = (kernel_objective[0], kernel_objective[1], kernel_objective[3]) == expected
+print(f"  커널 {kernel_objective}, 직접 계산 (지각 수, 지각시간, makespan) {expected}")
+
+# 같은 순서를 커널로 다시 계산한 시간(재타이밍)도 선후관계/기계 중복 없이 가능한 스케줄이어야 함
+sequences = kernel.current_sequences(kernel_scheduler)
+evaluation = kernel.evaluate(sequences)
+start, end = evaluation['start'], evaluation['end']
+feasible = all(
+    start[kernel.index[child.id]] >= end[kernel.index[node_id]]
+    for node_id in kernel.node_ids for child in kernel_manager.nodes[node_id].children if child.id in kernel.index
+) and all(
+    start[kernel.index[later]] >= end[kernel.index[earlier]]
+    for sequence in sequences.values() for earlier, later in zip(sequence, sequence[1:])
+)
+retimed = sum(1 for node_id in kernel.node_ids if end[kernel.index[node_id]] != node_end[node_id])
+print(f"  재타이밍 {ScheduleKernel.objective(evaluation)} (디스패치와 시간이 다른 노드 {retimed}개, 참고용)")
+
+if read_ok and feasible and machine_state(kernel_scheduler) == kernel_machines:
+    print("[OK] 커널이 변경 없는 디스패치 스케줄을 그대로 읽고, 재타이밍도 가능한 스케줄입니다!")
+else:
+    print("\n[WARN] 커널의 현재 스케줄 지표가 디스패치 결과와 다르거나 재타이밍이 선후관계를 어깁니다!")
+
+# ============================================================================
+# 테스트 13: GA 최적화 (프로세스 수와 무관하게 같은 결과)
+# ============================================================================
+print(f"\n[테스트 13] GA 최적화 결정성 검증 (max_workers 1 vs 2)")
+print("-" * 80)
+
+from src.scheduler import optimize_schedule_ga
+
+_, ga_scheduler, ga_manager, _ = schedule_fresh(**validated_inputs)
+ga_machines = machine_state(ga_scheduler)
+with SuppressOutput():
+    _, ga_zero_stats = optimize_schedule_ga(ga_scheduler, ga_manager, seq_v, base_date,
+                                            time_budget=60.0, seed=0, max_generations=0, max_workers=1)
+ga_untouched_ok = ga_zero_stats['applied'] or machine_state(ga_scheduler) == ga_machines
+print(f"  0세대: 반영 {ga_zero_stats['applied']}, 현재 {ga_zero_stats['initial_objective']}, "
+      f"재계산 {ga_zero_stats['decoded_objective']}")
+
+ga_hashes = []
+for workers in (1, 2):
+    _, ga_scheduler, ga_manager, _ = schedule_fresh(**validated_inputs)
+    with SuppressOutput():
+        ga_result, ga_stats = optimize_schedule_ga(ga_scheduler, ga_manager, seq_v, base_date,
+                                                   time_budget=60.0, seed=0, max_generations=10, max_workers=workers)
+    ga_hashes.append(hash_dataframe(ga_result))
+    print(f"  max_workers={workers}: {ga_stats['initial_objective']} → {ga_stats['objective']} (반영 {ga_stats['applied']})")
+is_consistent = check_consistency(ga_hashes, "ga_result")
+if ga_untouched_ok and is_consistent:
+    print("[OK] GA 결과가 프로세스 수와 무관하게 같고, 반영하지 않으면 디스패치 결과를 그대로 둡니다!")
+else:
+    print("\n[WARN] GA 결과가 프로세스 수에 따라 다르거나 반영 없이 스케줄을 바꿨습니다!")
+
+# ============================================================================
+# 테스트 14: 멀티스타트 디스패치 (프로세스 수와 무관하게 같은 결과)
+# ============================================================================
+print(f"\n[테스트 14] 멀티스타트 디스패치 결정성 검증 (max_workers 1 vs 2)")
+print("-" * 80)
+
+from src.scheduler import run_multistart_dispatch
+
+multistart_hashes, summary_hashes = [], []
+for workers in (1, 2):
+    with SuppressOutput():
+        dag_df_m, opnode_dict_m, manager_m, machine_dict_m, _ = create_complete_dag_system(
+            seq_v.copy(), linespeed_v.copy(), machine_mapper, processed_v['aging_data'].copy())
+        multistart_result, _, multistart_summary = run_multistart_dispatch(
+            dag_df=dag_df_m, sequence_seperated_order=seq_v.copy(), width_change_df=processed_v['width_change'].copy(),
+            machine_mapper=machine_mapper, opnode_dict=opnode_dict_m,
+            operation_delay_df=processed_v['operation_delay'].copy(), machine_dict=machine_dict_m,
+            machine_rest=machine_rest.copy(), base_date=base_date, manager=manager_m,
+            window_days=config.constants.WINDOW_DAYS, num_starts=4, seed=0, max_workers=workers)
+    multistart_hashes.append(hash_dataframe(multistart_result))
+    summary_hashes.append(hash_dataframe(multistart_summary))
+    best = multistart_summary[multistart_summary['선택']].iloc[0]
+    print(f"  max_workers={workers}: 최선 {best['실행']}번 (seed={best['seed']}), makespan {best['makespan']}")
+is_consistent = check_consistency(multistart_hashes, "multistart_result")
+is_consistent = check_consistency(summary_hashes, "multistart_summary") and is_consistent
+if is_consistent:
+    print("[OK] 멀티스타트 디스패치 결과(실행별 지표 포함)가 프로세스 수와 무관하게 같습니다!")
+else:
+    print("\n[WARN] 멀티스타트 디스패치 결과가 프로세스 수에 따라 다릅니다!")
+
 # ============================================================================
 # 요약
 # ============================================================================
@@ -292,5 +560,12 @@ print("테스트 요약")
 print("=" * 80)
 print(f"테스트 6 (Dispatch Rule): {NUM_ITERATIONS}회 반복 테스트")
 print(f"테스트 7 (스케줄링 실행): {NUM_ITERATIONS}회 반복 테스트")
+print("테스트 8 (단계 캐시): hit/miss 및 캐시 결과 일치")
+print("테스트 9 (DAG 체크포인트): 저장 → 로딩 후 스케줄 일치")
+print("테스트 10 (증분 재스케줄링): freeze_time=0 결과 == 전체 스케줄링")
+print("테스트 11 (지역 탐색): 이동 0회 결과 유지, 같은 seed 결과 일치")
+print("테스트 12 (스케줄 커널): 변경 없는 디스패치 스케줄 지표 일치, 재타이밍 가능")
+print("테스트 13 (GA 최적화): max_workers 1/2 결과 일치, 미반영 시 결과 유지")
+print("테스트 14 (멀티스타트 디스패치): max_workers 1/2 결과 및 실행별 지표 일치")
 print("\n비결정성이 발견되었다면 위의 차이 분석을 확인하세요!")
 print("=" * 80)